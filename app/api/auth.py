@@ -1,22 +1,83 @@
+import asyncio
+from functools import lru_cache
+from threading import Lock
+from time import monotonic
 from fastapi import HTTPException, status, Depends
 from fastapi.security import APIKeyHeader
 from clerk_backend_api import Clerk
 from clerk_backend_api.models import Session as ClerkSession
-from time import time
-from typing import Tuple
-from collections import OrderedDict
+from cachetools import TTLCache
+from pydantic import ValidationError
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 from app.core import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
 
 session_id_header = APIKeyHeader(name="X-Session-Id", auto_error=False)
 
-# Cache structure: {session_id: (session_object, expiry_timestamp)}
-# Using OrderedDict for proper LRU behavior with move_to_end()
-_session_cache: OrderedDict[str, Tuple[ClerkSession, float]] = OrderedDict()
+# Redis is a second cache tier shared by all workers, so a session verified by
+# one process doesn't have to be re-verified with Clerk by the others
+_REDIS_SESSION_KEY_PREFIX = "auth:session:"
+
+
+def _create_redis_client() -> Redis | None:
+    """
+    Create the shared-cache Redis client, or None when REDIS_URL is unset.
+    
+    Commands and connects time out quickly so an unresponsive Redis raises a
+    RedisError, which callers treat as a cache miss, instead of stalling requests.
+    
+    Returns:
+        Redis | None: Configured client, or None if Redis is disabled.
+    """
+    if not settings.REDIS_URL:
+        return None
+    return Redis.from_url(
+        settings.REDIS_URL,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+    )
+
 
+redis_client: Redis | None = _create_redis_client()
 
+# Verified sessions keyed by session ID. Entries expire AUTH_CACHE_TTL seconds
+# after being cached, and the least recently used entry is evicted once
+# AUTH_CACHE_MAX_SIZE is reached. Entries are kept in expiry order, so every
+# write also sweeps all expired entries from the front without a full scan.
+# Expiry is measured on the monotonic clock so wall-clock adjustments (NTP,
+# manual changes) can't expire or extend sessions early.
+_session_cache: TTLCache[str, ClerkSession] = TTLCache(
+    maxsize=settings.AUTH_CACHE_MAX_SIZE,
+    ttl=settings.AUTH_CACHE_TTL,
+    timer=monotonic,
+)
+# Rejections of invalid or inactive sessions, keyed by session ID, kept briefly
+# so a client retrying a bad session doesn't hit Clerk on every request. Only
+# definitive answers from Clerk are cached, never transport errors.
+_negative_cache: TTLCache[str, str] = TTLCache(
+    maxsize=settings.AUTH_NEGATIVE_CACHE_MAX_SIZE,
+    ttl=settings.AUTH_NEGATIVE_CACHE_TTL,
+    timer=monotonic,
+)
+# TTLCache isn't thread-safe and every lookup reorders it, so all access to both
+# caches goes through one lock. Operations are O(1), which keeps the critical section short.
+_session_cache_lock = Lock()
+
+# Clerk verifications currently running, keyed by session ID, so a burst of
+# requests for an uncached session results in a single Clerk call
+_inflight_verifications: dict[str, asyncio.Future[ClerkSession]] = {}
+
+
+@lru_cache(maxsize=1)
 def get_clerk_client() -> Clerk:
     """
-    Create and return a Clerk client instance.
+    Return the process-wide Clerk client, creating it on first use.
+    
+    The client and its HTTP connection pool are reused across requests, so it
+    must not be used as a context manager (that would close it).
     
     Returns:
         Clerk: Configured Clerk client.
@@ -24,69 +85,241 @@ def get_clerk_client() -> Clerk:
     return Clerk(bearer_auth=settings.CLERK_SECRET_KEY)
 
 
+def close_clerk_client() -> None:
+    """
+    Close the shared Clerk client, if one was created, and forget it.
+    """
+    if get_clerk_client.cache_info().currsize:
+        get_clerk_client().__exit__(None, None, None)
+    get_clerk_client.cache_clear()
+
+
+async def close_redis_client() -> None:
+    """
+    Close the shared-cache Redis client and its connection pool, if Redis is enabled.
+    """
+    if redis_client is not None:
+        await redis_client.aclose()
+
+
 def _get_cached_session(session_id: str) -> ClerkSession | None:
     """
     Retrieve a session from cache if valid and not expired.
     
-    Updates access order for proper LRU behavior.
-    
     Args:
         session_id: The session ID to look up.
         
     Returns:
         ClerkSession if cached and valid, None otherwise.
     """
-    if session_id in _session_cache:
-        session, expiry = _session_cache[session_id]
-        if time() < expiry:
-            # Move to end to mark as recently used (proper LRU behavior)
-            _session_cache.move_to_end(session_id)
-            return session
-        else:
-            # Remove expired entry
-            del _session_cache[session_id]
-    return None
+    with _session_cache_lock:
+        return _session_cache.get(session_id)
 
 
 def _cache_session(session_id: str, session: ClerkSession) -> None:
     """
     Store a session in the cache with TTL.
     
-    Implements LRU eviction when cache exceeds max size.
-    Removes least recently used item (first item in OrderedDict).
+    Args:
+        session_id: The session ID.
+        session: The session object to cache.
+    """
+    with _session_cache_lock:
+        _session_cache[session_id] = session
+
+
+async def _redis_get_session(session_id: str) -> ClerkSession | None:
+    """
+    Retrieve a session from the shared Redis cache.
+    
+    Redis errors are logged and treated as a cache miss. A payload that no longer
+    parses (corrupt, or written by another SDK version) is deleted and also
+    treated as a miss.
+    
+    Args:
+        session_id: The session ID to look up.
+        
+    Returns:
+        ClerkSession if cached in Redis, None otherwise.
+    """
+    if redis_client is None:
+        return None
+    
+    key = f"{_REDIS_SESSION_KEY_PREFIX}{session_id}"
+    try:
+        payload = await redis_client.get(key)
+    except RedisError as e:
+        logger.warning(f"Redis session lookup failed: {str(e)}")
+        return None
+    
+    if payload is None:
+        return None
+    
+    try:
+        return ClerkSession.model_validate_json(payload)
+    except ValidationError as e:
+        logger.warning(f"Discarding unreadable cached session: {str(e)}")
+    
+    try:
+        await redis_client.delete(key)
+    except RedisError as e:
+        logger.warning(f"Redis session delete failed: {str(e)}")
+    return None
+
+
+async def _redis_set_session(session_id: str, session: ClerkSession) -> None:
+    """
+    Store a session in the shared Redis cache with TTL.
+    
+    Redis errors are logged and otherwise ignored.
     
     Args:
         session_id: The session ID.
         session: The session object to cache.
     """
-    # Implement LRU eviction if cache is full
-    if len(_session_cache) >= settings.AUTH_CACHE_MAX_SIZE:
-        # Remove least recently used entry (first item in OrderedDict)
-        oldest_key = next(iter(_session_cache))
-        del _session_cache[oldest_key]
+    if redis_client is None:
+        return
     
-    expiry = time() + settings.AUTH_CACHE_TTL
-    _session_cache[session_id] = (session, expiry)
-    # Move to end to mark as most recently used
-    _session_cache.move_to_end(session_id)
+    try:
+        await redis_client.set(
+            f"{_REDIS_SESSION_KEY_PREFIX}{session_id}",
+            session.model_dump_json(),
+            ex=settings.AUTH_CACHE_TTL,
+        )
+    except RedisError as e:
+        logger.warning(f"Redis session store failed: {str(e)}")
+
+
+def _get_cached_rejection(session_id: str) -> str | None:
+    """
+    Retrieve the reason a session was recently rejected by Clerk.
+    
+    Args:
+        session_id: The session ID to look up.
+        
+    Returns:
+        The rejection detail if the session was rejected within the negative TTL, None otherwise.
+    """
+    with _session_cache_lock:
+        return _negative_cache.get(session_id)
 
 
-def invalidate_session_cache(session_id: str) -> None:
+def _reject_session(session_id: str, detail: str) -> HTTPException:
+    """
+    Remember that Clerk rejected a session and build the error to raise.
+    
+    Args:
+        session_id: The rejected session ID.
+        detail: Why the session was rejected.
+        
+    Returns:
+        HTTPException: 401 error carrying the rejection detail.
+    """
+    with _session_cache_lock:
+        _negative_cache[session_id] = detail
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=detail,
+    )
+
+
+def _evict_local_session(session_id: str) -> None:
+    """
+    Drop a session and any cached rejection from the in-process caches.
+    
+    Args:
+        session_id: The session ID to evict.
+    """
+    with _session_cache_lock:
+        _session_cache.pop(session_id, None)
+        _negative_cache.pop(session_id, None)
+
+
+async def invalidate_session_cache(session_id: str) -> None:
     """
     Manually invalidate a cached session.
     
+    Clears the cached session and any cached rejection in this process, and
+    deletes the shared copy in Redis so no worker serves it again. Redis errors
+    are logged and otherwise ignored.
+    
     Args:
         session_id: The session ID to invalidate.
     """
-    _session_cache.pop(session_id, None)
+    _evict_local_session(session_id)
+    
+    if redis_client is None:
+        return
+    
+    try:
+        await redis_client.delete(f"{_REDIS_SESSION_KEY_PREFIX}{session_id}")
+    except RedisError as e:
+        logger.warning(f"Redis session invalidation failed: {str(e)}")
+
+
+async def _verify_with_clerk(session_id: str) -> ClerkSession:
+    """
+    Verify a session with Clerk and cache it if active.
+    
+    The blocking Clerk SDK call runs in a worker thread so the event loop stays
+    responsive. Concurrent requests for the same session await a single call.
+    
+    Args:
+        session_id: The session ID to verify.
+        
+    Returns:
+        ClerkSession: Verified Clerk session object.
+        
+    Raises:
+        HTTPException: If authentication fails.
+    """
+    try:
+        session = await asyncio.to_thread(_get_clerk_session, session_id)
+        
+        if not session:
+            raise _reject_session(session_id, "Invalid session")
+        
+        # Check if session is active
+        if session.status != "active":
+            raise _reject_session(session_id, f"Session is not active: {session.status}")
+        
+        # Cache the valid session, shared tier first
+        await _redis_set_session(session_id, session)
+        _cache_session(session_id, session)
+        
+        return session
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=f"Authentication failed: {str(e)}",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    finally:
+        _inflight_verifications.pop(session_id, None)
+
+
+def _get_clerk_session(session_id: str) -> ClerkSession | None:
+    """
+    Fetch a session from the Clerk API.
+    
+    Args:
+        session_id: The session ID to fetch.
+        
+    Returns:
+        The Clerk session, or None if Clerk returned nothing.
+    """
+    return get_clerk_client().sessions.get(session_id=session_id)
 
 
 async def verify_clerk_session(session_id: str | None = Depends(session_id_header)) -> ClerkSession:
     """
     Verify Clerk session token and return session information.
     
-    Uses LRU cache with TTL to improve performance by avoiding redundant
-    API calls to Clerk for recently verified sessions.
+    Uses an in-process LRU cache with TTL, backed by Redis when configured, to
+    avoid redundant API calls to Clerk for recently verified sessions.
     
     Args:
         session_id: Session ID from X-Session-Id header.
@@ -103,39 +336,30 @@ async def verify_clerk_session(session_id: str | None = Depends(session_id_heade
             detail="X-Session-Id header missing",
         )
     
-    # Check cache first
+    # Reject sessions Clerk has just turned down without asking again
+    rejection = _get_cached_rejection(session_id)
+    if rejection:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=rejection,
+        )
+    
+    # Check the in-process cache first, then the shared one. Redis hits are not
+    # copied into the in-process cache: that would restart the TTL and serve the
+    # session for up to twice AUTH_CACHE_TTL after Clerk last checked it.
     cached_session = _get_cached_session(session_id)
     if cached_session:
         return cached_session
     
-    # Verify session with Clerk
-    try:
-        with get_clerk_client() as clerk:
-            session = clerk.sessions.get(session_id=session_id)
-            
-            if not session:
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Invalid session",
-                )
-            
-            # Check if session is active
-            if session.status != "active":
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail=f"Session is not active: {session.status}",
-                )
-            
-            # Cache the valid session
-            _cache_session(session_id, session)
-            
-            return session
-            
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Authentication failed: {str(e)}",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
\ No newline at end of file
+    cached_session = await _redis_get_session(session_id)
+    if cached_session:
+        return cached_session
+    
+    # Verify session with Clerk, sharing one in-flight call per session ID
+    verification = _inflight_verifications.get(session_id)
+    if verification is None:
+        verification = asyncio.ensure_future(_verify_with_clerk(session_id))
+        _inflight_verifications[session_id] = verification
+    
+    # Shield so a cancelled request doesn't cancel the call other requests await
+    return await asyncio.shield(verification)
\ No newline at end of file
@@ -1,7 +1,8 @@
+import hashlib
 from uuid import UUID
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, HTTPException, status, Query, Header, Response
 
 from app.core.logging import get_logger
 from app.services.chat import ChatService
@@ -20,6 +21,24 @@ router = APIRouter()
 logger = get_logger(__name__)
 
 
+def _chat_list_etag(
+    service: ChatService,
+    user_id: str,
+    skip: int,
+    limit: int,
+    include_deleted: bool
+) -> tuple[str, int]:
+    """
+    Build a weak ETag for a chat list from its fingerprint and query parameters.
+    
+    Returns the fingerprint's chat count as well, so callers can report the
+    total without counting again.
+    """
+    latest_updated_at, count = service.list_fingerprint(user_id, include_deleted=include_deleted)
+    raw = f"{user_id}:{latest_updated_at}:{count}:{skip}:{limit}:{include_deleted}"
+    return f'W/"{hashlib.sha1(raw.encode()).hexdigest()}"', count
+
+
 @router.post("/", status_code=status.HTTP_201_CREATED, response_model=ChatPublic)
 async def create_chat(
     chat_data: ChatCreate,
@@ -49,19 +68,27 @@ async def create_chat(
 async def get_user_chats(
     session: SessionDep,
     user: CurrentUser,
+    response: Response,
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
-    include_deleted: bool = Query(False, description="Include soft-deleted chats")
+    include_deleted: bool = Query(False, description="Include soft-deleted chats"),
+    if_none_match: Optional[str] = Header(None, description="ETag from a previous response")
 ):
     """
     Get all chats for the authenticated user with pagination.
     
+    Responses carry an ETag; sending it back in If-None-Match returns
+    304 Not Modified when the chat list hasn't changed. The total number of
+    matching chats is returned in the X-Total-Count header.
+    
     Args:
         session: Database session dependency
         user: Authenticated user from Clerk session
+        response: Outgoing response, used to set the ETag and X-Total-Count headers
         skip: Number of records to skip (default: 0)
         limit: Maximum number of records to return (default: 100, max: 1000)
         include_deleted: If True, include soft-deleted chats (default: False)
+        if_none_match: ETag from a previous response
         
     Returns:
         List of chats ordered by most recent first
@@ -69,13 +96,20 @@ async def get_user_chats(
     service = ChatService(session)
     user_id = user.user_id
     
+    etag, total = _chat_list_etag(service, user_id, skip, limit, include_deleted)
+    if if_none_match == etag:
+        logger.info(f"Chat list not modified for user {user_id} (skip={skip}, limit={limit})")
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["X-Total-Count"] = str(total)
+    
     chats = service.get_all_user_chats(
         user_id,
         skip=skip,
         limit=limit,
         include_deleted=include_deleted
     )
-    logger.info(f"Retrieved {len(chats)} chats for user {user_id} (skip={skip}, limit={limit})")
+    logger.info(f"Retrieved {len(chats)} of {total} chats for user {user_id} (skip={skip}, limit={limit})")
     return chats
 
 
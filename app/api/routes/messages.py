@@ -1,7 +1,8 @@
 from uuid import UUID
 from typing import Optional
 
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, HTTPException, status, Query, Response
+from pydantic import TypeAdapter
 
 from app.core.logging import get_logger
 from app.services.message import MessageService
@@ -11,6 +12,7 @@ from app.models import (
     MessageCreate, 
     MessageUpdate, 
     MessagePublic, 
+    MessagePageResponse,
     MessageResponse,
     MessageWithAutoChatRequest,
     MessageWithAutoChatResponse,
@@ -24,6 +26,26 @@ from app.models import (
 router = APIRouter()
 logger = get_logger(__name__)
 
+_MESSAGE_LIST_ADAPTER = TypeAdapter(list[MessagePublic])
+
+
+def _json_response(content: bytes | str) -> Response:
+    """
+    Wrap already-serialized JSON in a response.
+    
+    The service builds MessagePublic objects from trusted database rows, so
+    going through response_model would only validate them a second time.
+    Routes keep response_model for the OpenAPI schema.
+    """
+    return Response(content=content, media_type="application/json")
+
+
+def _message_list_response(messages: list[MessagePublic]) -> Response:
+    """
+    Serialize a list of messages straight to JSON.
+    """
+    return _json_response(_MESSAGE_LIST_ADAPTER.dump_json(messages))
+
 
 # ==========================================
 # POST routes
@@ -54,8 +76,7 @@ async def create_message(
     user_id = user.user_id
     
     # Verify chat exists and user has access
-    chat = chat_service.get_chat_by_id(message_data.chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(message_data.chat_id, user_id):
         logger.warning(f"Chat not found or access denied: {message_data.chat_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -231,8 +252,7 @@ async def get_active_messages(
     user_id = user.user_id
     
     # Verify chat exists and user has access
-    chat = chat_service.get_chat_by_id(chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(chat_id, user_id):
         logger.warning(f"Chat not found or access denied: {chat_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -241,7 +261,7 @@ async def get_active_messages(
     
     messages = service.get_active_messages(chat_id, skip=skip, limit=limit)
     logger.info(f"Retrieved {len(messages)} active messages for chat {chat_id}")
-    return messages
+    return _message_list_response(messages)
 
 
 @router.get("/chat/{chat_id}/type/{message_type}", response_model=list[MessagePublic])
@@ -275,8 +295,7 @@ async def get_messages_by_type(
     user_id = user.user_id
     
     # Verify chat exists and user has access
-    chat = chat_service.get_chat_by_id(chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(chat_id, user_id):
         logger.warning(f"Chat not found or access denied: {chat_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -285,7 +304,7 @@ async def get_messages_by_type(
     
     messages = service.get_messages_by_type(chat_id, message_type, skip=skip, limit=limit)
     logger.info(f"Retrieved {len(messages)} messages of type '{message_type}' for chat {chat_id}")
-    return messages
+    return _message_list_response(messages)
 
 
 @router.get("/chat/{chat_id}/user", response_model=list[MessagePublic])
@@ -317,8 +336,7 @@ async def get_user_messages(
     user_id = user.user_id
     
     # Verify chat exists and user has access
-    chat = chat_service.get_chat_by_id(chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(chat_id, user_id):
         logger.warning(f"Chat not found or access denied: {chat_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -327,7 +345,7 @@ async def get_user_messages(
     
     messages = service.get_user_messages(chat_id, skip=skip, limit=limit)
     logger.info(f"Retrieved {len(messages)} user messages for chat {chat_id}")
-    return messages
+    return _message_list_response(messages)
 
 
 @router.get("/chat/{chat_id}/ai", response_model=list[MessagePublic])
@@ -359,8 +377,7 @@ async def get_ai_messages(
     user_id = user.user_id
     
     # Verify chat exists and user has access
-    chat = chat_service.get_chat_by_id(chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(chat_id, user_id):
         logger.warning(f"Chat not found or access denied: {chat_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -369,7 +386,7 @@ async def get_ai_messages(
     
     messages = service.get_ai_messages(chat_id, skip=skip, limit=limit)
     logger.info(f"Retrieved {len(messages)} AI messages for chat {chat_id}")
-    return messages
+    return _message_list_response(messages)
 
 
 @router.get("/chat/{chat_id}/latest", response_model=MessagePublic)
@@ -397,8 +414,7 @@ async def get_latest_message(
     user_id = user.user_id
     
     # Verify chat exists and user has access
-    chat = chat_service.get_chat_by_id(chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(chat_id, user_id):
         logger.warning(f"Chat not found or access denied: {chat_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -413,7 +429,7 @@ async def get_latest_message(
         )
     
     logger.info(f"Retrieved latest message for chat {chat_id}")
-    return message
+    return _json_response(message.model_dump_json())
 
 
 @router.get("/chat/{chat_id}/count", response_model=dict)
@@ -443,8 +459,7 @@ async def count_chat_messages(
     user_id = user.user_id
     
     # Verify chat exists and user has access
-    chat = chat_service.get_chat_by_id(chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(chat_id, user_id):
         logger.warning(f"Chat not found or access denied: {chat_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -481,8 +496,7 @@ async def get_conversation_summary(
     user_id = user.user_id
     
     # Verify chat exists and user has access
-    chat = chat_service.get_chat_by_id(chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(chat_id, user_id):
         logger.warning(f"Chat not found or access denied: {chat_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -521,8 +535,7 @@ async def get_messages_with_feedback(
     user_id = user.user_id
     
     # Verify chat exists and user has access
-    chat = chat_service.get_chat_by_id(chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(chat_id, user_id):
         logger.warning(f"Chat not found or access denied: {chat_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -531,7 +544,63 @@ async def get_messages_with_feedback(
     
     messages = service.get_messages_with_feedback(chat_id, feedback_type=feedback_type)
     logger.info(f"Retrieved {len(messages)} messages with feedback for chat {chat_id}")
-    return messages
+    return _message_list_response(messages)
+
+
+@router.get("/chat/{chat_id}/page", response_model=MessagePageResponse)
+async def get_chat_messages_page(
+    chat_id: UUID,
+    session: SessionDep,
+    user: CurrentUser,
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page"),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    include_deleted: bool = Query(False, description="Include soft-deleted messages")
+):
+    """
+    Get a page of messages for a chat using cursor pagination.
+    
+    Args:
+        chat_id: Chat UUID
+        session: Database session dependency
+        user: Authenticated user from Clerk session
+        cursor: Cursor from the previous page's next_cursor (omit for the first page)
+        limit: Maximum number of records to return (default: 100, max: 1000)
+        include_deleted: If True, include soft-deleted messages (default: False)
+        
+    Returns:
+        Messages ordered by creation time and the cursor for the next page
+        
+    Raises:
+        HTTPException: If chat not found, user doesn't have access, or cursor is invalid
+    """
+    service = MessageService(session)
+    chat_service = ChatService(session)
+    user_id = user.user_id
+    
+    # Verify chat exists and user has access
+    if not chat_service.chat_exists(chat_id, user_id):
+        logger.warning(f"Chat not found or access denied: {chat_id} for user {user_id}")
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Chat not found or you don't have access"
+        )
+    
+    try:
+        messages, next_cursor = service.get_chat_messages_page(
+            chat_id,
+            cursor=cursor,
+            limit=limit,
+            include_deleted=include_deleted
+        )
+    except ValueError as e:
+        logger.warning(f"Invalid message cursor for chat {chat_id}: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    logger.info(f"Retrieved {len(messages)} messages for chat {chat_id} (limit={limit})")
+    return _json_response(MessagePageResponse(items=messages, next_cursor=next_cursor).model_dump_json())
 
 
 @router.get("/chat/{chat_id}", response_model=list[MessagePublic])
@@ -565,8 +634,7 @@ async def get_chat_messages(
     user_id = user.user_id
     
     # Verify chat exists and user has access
-    chat = chat_service.get_chat_by_id(chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(chat_id, user_id):
         logger.warning(f"Chat not found or access denied: {chat_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -580,7 +648,7 @@ async def get_chat_messages(
         include_deleted=include_deleted
     )
     logger.info(f"Retrieved {len(messages)} messages for chat {chat_id} (skip={skip}, limit={limit})")
-    return messages
+    return _message_list_response(messages)
 
 
 @router.get("/{message_id}/exists", response_model=dict)
@@ -610,8 +678,7 @@ async def check_message_exists(
         return {"exists": False}
     
     # Check if user has access to the chat
-    chat = chat_service.get_chat_by_id(message.chat_id, user_id)
-    exists = chat is not None
+    exists = chat_service.chat_exists(message.chat_id, user_id)
     
     logger.info(f"Checked existence of message {message_id} for user {user_id}: {exists}")
     return {"exists": exists}
@@ -650,8 +717,7 @@ async def get_message_by_id(
         )
     
     # Verify user has access to the chat
-    chat = chat_service.get_chat_by_id(message.chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(message.chat_id, user_id):
         logger.warning(f"Access denied to message {message_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -659,7 +725,7 @@ async def get_message_by_id(
         )
     
     logger.info(f"Retrieved message {message_id} for user {user_id}")
-    return message
+    return _json_response(message.model_dump_json())
 
 
 # ==========================================
@@ -702,8 +768,7 @@ async def update_message(
         )
     
     # Verify user has access to the chat
-    chat = chat_service.get_chat_by_id(message.chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(message.chat_id, user_id):
         logger.warning(f"Access denied to update message {message_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -767,8 +832,7 @@ async def update_message_content(
         )
     
     # Verify user has access to the chat
-    chat = chat_service.get_chat_by_id(message.chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(message.chat_id, user_id):
         logger.warning(f"Access denied to update message {message_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -822,8 +886,7 @@ async def update_message_feedback(
         )
     
     # Verify user has access to the chat
-    chat = chat_service.get_chat_by_id(message.chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(message.chat_id, user_id):
         logger.warning(f"Access denied to update message {message_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -870,8 +933,7 @@ async def delete_all_chat_messages(
     user_id = user.user_id
     
     # Verify chat exists and user has access
-    chat = chat_service.get_chat_by_id(chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(chat_id, user_id):
         logger.warning(f"Chat not found or access denied: {chat_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -917,8 +979,7 @@ async def permanently_delete_message(
         )
     
     # Verify user has access to the chat
-    chat = chat_service.get_chat_by_id(message.chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(message.chat_id, user_id):
         logger.warning(f"Access denied to permanently delete message {message_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -970,8 +1031,7 @@ async def delete_message(
         )
     
     # Verify user has access to the chat
-    chat = chat_service.get_chat_by_id(message.chat_id, user_id)
-    if not chat:
+    if not chat_service.chat_exists(message.chat_id, user_id):
         logger.warning(f"Access denied to delete message {message_id} for user {user_id}")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -61,6 +61,11 @@ class Settings(BaseSettings):
     # Authentication Cache Settings
     AUTH_CACHE_TTL: int = 300  # Cache TTL in seconds (5 minutes)
     AUTH_CACHE_MAX_SIZE: int = 1000  # Maximum number of cached sessions
+    AUTH_NEGATIVE_CACHE_TTL: int = 5  # How long invalid/inactive sessions are rejected without asking Clerk
+    AUTH_NEGATIVE_CACHE_MAX_SIZE: int = 1024  # Maximum number of cached rejections
+    REDIS_URL: str | None = None  # Shared session cache across workers (disabled when unset)
+    REDIS_SOCKET_TIMEOUT: float = 0.5  # Seconds to wait on a Redis command before treating it as a miss
+    REDIS_CONNECT_TIMEOUT: float = 0.5  # Seconds to wait for a Redis connection
 
     @property
     def IS_PRODUCTION(self) -> bool:
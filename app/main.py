@@ -1,5 +1,6 @@
 from contextlib import asynccontextmanager
 
+from app.api.auth import close_clerk_client, close_redis_client
 from app.api.main import router as api_router
 from app.core import settings
 from app.core.logging import get_logger
@@ -19,6 +20,8 @@ async def lifespan(app: FastAPI):
         f"Starting application in {settings.ENVIRONMENT} mode with log level {settings.LOG_LEVEL}"
         )
     yield
+    close_clerk_client()
+    await close_redis_client()
     logger.info("Ending application lifespan")
 
 app = FastAPI(
@@ -40,6 +43,7 @@ if settings.all_cors_origins:
         allow_credentials=True,
         allow_methods=["GET", "POST", "PATCH", "DELETE", "PUT"],
         allow_headers=["*"],
+        expose_headers=["X-Total-Count"],
     )
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
\ No newline at end of file
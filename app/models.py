@@ -1,4 +1,4 @@
-from sqlmodel import SQLModel, Field
+from sqlmodel import SQLModel, Field, Index, text
 from pydantic import BaseModel
 from typing import Optional, Literal
 from datetime import datetime, timezone
@@ -46,6 +46,9 @@ class ModelBase(SQLModel):
 
 class Model(ModelBase, table=True):
     __tablename__ = "models"
+    __table_args__ = (
+        Index("ix_models_provider", "provider"),
+    )
     
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -130,6 +133,23 @@ class MessageBase(SQLModel):
 
 class Message(MessageBase, table=True):
     __tablename__ = "messages"
+    __table_args__ = (
+        Index(
+            "ix_messages_chat_id_created_at_active",
+            "chat_id",
+            "created_at",
+            postgresql_where=text("is_deleted = false"),
+            sqlite_where=text("is_deleted = 0"),
+        ),
+        Index("ix_messages_chat_id_type", "chat_id", "type"),
+        Index(
+            "ix_messages_chat_id_feedback",
+            "chat_id",
+            "feedback",
+            postgresql_where=text("feedback IS NOT NULL"),
+            sqlite_where=text("feedback IS NOT NULL"),
+        ),
+    )
     
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -194,6 +214,12 @@ class MessageWithAutoChatResponse(BaseModel):
     chat_id: uuid.UUID
 
 
+class MessagePageResponse(BaseModel):
+    """Response model for a keyset-paginated page of messages."""
+    items: list[MessagePublic]
+    next_cursor: Optional[str] = None
+
+
 class MessageFeedbackRequest(BaseModel):
     """Request model for updating message feedback."""
     feedback: str
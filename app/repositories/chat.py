@@ -1,16 +1,34 @@
 from typing import Optional
 from uuid import UUID
-from sqlmodel import Session, select, desc
+from sqlmodel import Session, select, desc, insert, update, delete, col, tuple_, func, literal
 from app.models import Chat, ChatCreate, ChatUpdate
 from datetime import datetime, timezone
 
 
+def _utcnow() -> datetime:
+    """
+    Current UTC time, the single clock for every timestamp this repository writes.
+    """
+    return datetime.now(timezone.utc)
+
+
 class ChatRepository:
     """Repository for Chat CRUD operations."""
     
     def __init__(self, session: Session):
         self.session = session
     
+    def _commit_returned(self, chat: Chat) -> Chat:
+        """
+        Commit the current transaction and return a chat loaded via RETURNING.
+        
+        The chat is detached first so the commit doesn't expire the returned
+        values and force a reload on the next attribute access.
+        """
+        self.session.expunge(chat)
+        self.session.commit()
+        return chat
+    
     def create(self, user_id: str, chat_data: ChatCreate) -> Chat:
         """
         Create a new chat.
@@ -22,14 +40,40 @@ class ChatRepository:
         Returns:
             Created chat instance
         """
-        chat = Chat(
-            user_id=user_id,
-            **chat_data.model_dump()
+        now = _utcnow()
+        statement = (
+            insert(Chat)
+            .values(user_id=user_id, **chat_data.model_dump(), created_at=now, updated_at=now)
+            .returning(Chat)
         )
-        self.session.add(chat)
+        chat = self.session.exec(statement).scalar_one()
+        return self._commit_returned(chat)
+    
+    def bulk_create(self, user_id: str, chats_data: list[ChatCreate]) -> list[Chat]:
+        """
+        Create several chats for a user with a single INSERT and commit.
+        
+        Args:
+            user_id: User ID string (from authenticated user)
+            chats_data: List of chat creation data
+            
+        Returns:
+            Created chat instances, in the same order as the input
+        """
+        if not chats_data:
+            return []
+        
+        rows = []
+        for chat_data in chats_data:
+            now = _utcnow()
+            rows.append({"user_id": user_id, **chat_data.model_dump(), "created_at": now, "updated_at": now})
+        
+        statement = insert(Chat).returning(Chat, sort_by_parameter_order=True)
+        chats = list(self.session.scalars(statement, rows).all())
+        for chat in chats:
+            self.session.expunge(chat)
         self.session.commit()
-        self.session.refresh(chat)
-        return chat
+        return chats
     
     def get_by_id(self, chat_id: UUID, user_id: str) -> Optional[Chat]:
         """
@@ -49,6 +93,50 @@ class ChatRepository:
         )
         return self.session.exec(statement).first()
     
+    def exists(self, chat_id: UUID) -> bool:
+        """
+        Check whether a chat exists, including deleted chats, without loading it.
+        
+        Args:
+            chat_id: Chat UUID
+            
+        Returns:
+            True if the chat exists, False otherwise
+        """
+        statement = select(literal(1)).where(Chat.id == chat_id).limit(1)
+        return self.session.exec(statement).first() is not None
+    
+    def owner_of(self, chat_id: UUID, include_deleted: bool = False) -> Optional[str]:
+        """
+        Get the owner of a chat without loading the full row.
+        
+        Args:
+            chat_id: Chat UUID
+            include_deleted: If True, also consider deleted chats
+            
+        Returns:
+            User ID string of the owner or None if the chat doesn't exist
+        """
+        statement = select(Chat.user_id).where(Chat.id == chat_id)
+        
+        if not include_deleted:
+            statement = statement.where(Chat.is_deleted == False)
+        
+        return self.session.exec(statement).first()
+    
+    def get_existing_ids(self, chat_ids: list[UUID]) -> set[UUID]:
+        """
+        Get which of the given chat IDs exist, including deleted chats.
+        
+        Args:
+            chat_ids: List of chat UUIDs
+            
+        Returns:
+            Set of the IDs that exist
+        """
+        statement = select(Chat.id).where(col(Chat.id).in_(chat_ids))
+        return set(self.session.exec(statement).all())
+    
     def get_all_by_user(
         self, 
         user_id: str,
@@ -76,6 +164,43 @@ class ChatRepository:
         statement = statement.order_by(desc(Chat.updated_at)).offset(skip).limit(limit)
         return list(self.session.exec(statement).all())
     
+    def get_page(
+        self,
+        user_id: str,
+        cursor: Optional[tuple[datetime, UUID]] = None,
+        limit: int = 100,
+        include_deleted: bool = False,
+        deleted_only: bool = False
+    ) -> list[Chat]:
+        """
+        Get a page of chats for a user using keyset pagination.
+        
+        Chats are ordered by updated_at descending with the ID as tie-breaker, so
+        the (updated_at, id) of the last chat of a page is the cursor for the next.
+        
+        Args:
+            user_id: User ID string
+            cursor: (updated_at, id) of the last chat of the previous page, or None for the first page
+            limit: Maximum number of records to return
+            include_deleted: If True, include deleted chats
+            deleted_only: If True, only return deleted chats
+            
+        Returns:
+            List of chat instances
+        """
+        statement = select(Chat).where(Chat.user_id == user_id)
+        
+        if deleted_only:
+            statement = statement.where(Chat.is_deleted)
+        elif not include_deleted:
+            statement = statement.where(Chat.is_deleted == False)
+        
+        if cursor is not None:
+            statement = statement.where(tuple_(Chat.updated_at, Chat.id) < tuple_(*cursor))
+        
+        statement = statement.order_by(desc(Chat.updated_at), desc(Chat.id)).limit(limit)
+        return list(self.session.exec(statement).all())
+    
     def update(self, chat_id: UUID, user_id: str, chat_data: ChatUpdate) -> Optional[Chat]:
         """
         Update a chat.
@@ -88,19 +213,24 @@ class ChatRepository:
         Returns:
             Updated chat instance or None if not found or user doesn't own it
         """
-        chat = self.get_by_id(chat_id, user_id)
+        statement = (
+            update(Chat)
+            .where(
+                Chat.id == chat_id,
+                Chat.user_id == user_id,
+                Chat.is_deleted == False
+            )
+            .values(
+                **chat_data.model_dump(exclude_unset=True),
+                updated_at=_utcnow()
+            )
+            .returning(Chat)
+        )
+        chat = self.session.exec(statement).scalar_one_or_none()
         if not chat:
             return None
         
-        update_data = chat_data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(chat, key, value)
-        
-        chat.updated_at = datetime.now(timezone.utc)
-        self.session.add(chat)
-        self.session.commit()
-        self.session.refresh(chat)
-        return chat
+        return self._commit_returned(chat)
     
     def soft_delete(self, chat_id: UUID, user_id: str) -> bool:
         """
@@ -113,13 +243,19 @@ class ChatRepository:
         Returns:
             True if deleted, False if not found or user doesn't own it
         """
-        chat = self.get_by_id(chat_id, user_id)
-        if not chat:
+        statement = (
+            update(Chat)
+            .where(
+                Chat.id == chat_id,
+                Chat.user_id == user_id,
+                Chat.is_deleted == False
+            )
+            .values(is_deleted=True, updated_at=_utcnow())
+            .returning(Chat.id)
+        )
+        if self.session.exec(statement).first() is None:
             return False
         
-        chat.is_deleted = True
-        chat.updated_at = datetime.now(timezone.utc)
-        self.session.add(chat)
         self.session.commit()
         return True
     
@@ -134,15 +270,14 @@ class ChatRepository:
         Returns:
             True if deleted, False if not found or user doesn't own it
         """
-        statement = select(Chat).where(
-            Chat.id == chat_id,
-            Chat.user_id == user_id
+        statement = (
+            delete(Chat)
+            .where(Chat.id == chat_id, Chat.user_id == user_id)
+            .returning(Chat.id)
         )
-        chat = self.session.exec(statement).first()
-        if not chat:
+        if self.session.exec(statement).first() is None:
             return False
         
-        self.session.delete(chat)
         self.session.commit()
         return True
     
@@ -157,21 +292,113 @@ class ChatRepository:
         Returns:
             Restored chat instance or None if not found or user doesn't own it
         """
-        statement = select(Chat).where(
-            Chat.id == chat_id,
-            Chat.user_id == user_id,
-            Chat.is_deleted
+        statement = (
+            update(Chat)
+            .where(
+                Chat.id == chat_id,
+                Chat.user_id == user_id,
+                Chat.is_deleted
+            )
+            .values(is_deleted=False, updated_at=_utcnow())
+            .returning(Chat)
         )
-        chat = self.session.exec(statement).first()
+        chat = self.session.exec(statement).scalar_one_or_none()
         if not chat:
             return None
         
-        chat.is_deleted = False
-        chat.updated_at = datetime.now(timezone.utc)
-        self.session.add(chat)
+        return self._commit_returned(chat)
+    
+    def fingerprint(self, user_id: str, include_deleted: bool = False) -> tuple[Optional[datetime], int]:
+        """
+        Get a cheap fingerprint of a user's chat list.
+        
+        The latest updated_at and the number of chats change whenever a chat in
+        the list is created, updated, deleted or restored.
+        
+        Args:
+            user_id: User ID string
+            include_deleted: If True, include deleted chats
+            
+        Returns:
+            Tuple of (latest updated_at or None if no chats, chat count)
+        """
+        statement = select(func.max(Chat.updated_at), func.count()).where(Chat.user_id == user_id)
+        
+        if not include_deleted:
+            statement = statement.where(Chat.is_deleted == False)
+        
+        latest_updated_at, count = self.session.exec(statement).one()
+        return latest_updated_at, count
+    
+    def bulk_soft_delete(self, chat_ids: list[UUID], user_id: str) -> list[UUID]:
+        """
+        Soft delete multiple chats in a single statement and transaction.
+        
+        Args:
+            chat_ids: List of chat UUIDs
+            user_id: User ID string to verify ownership
+            
+        Returns:
+            IDs of the chats that were deleted
+        """
+        statement = (
+            update(Chat)
+            .where(
+                col(Chat.id).in_(chat_ids),
+                Chat.user_id == user_id,
+                Chat.is_deleted == False
+            )
+            .values(is_deleted=True, updated_at=_utcnow())
+            .returning(Chat.id)
+        )
+        deleted_ids = list(self.session.exec(statement).scalars().all())
         self.session.commit()
-        self.session.refresh(chat)
-        return chat
+        return deleted_ids
+    
+    def bulk_restore(self, chat_ids: list[UUID], user_id: str) -> list[UUID]:
+        """
+        Restore multiple soft-deleted chats in a single statement and transaction.
+        
+        Args:
+            chat_ids: List of chat UUIDs
+            user_id: User ID string to verify ownership
+            
+        Returns:
+            IDs of the chats that were restored
+        """
+        statement = (
+            update(Chat)
+            .where(
+                col(Chat.id).in_(chat_ids),
+                Chat.user_id == user_id,
+                Chat.is_deleted
+            )
+            .values(is_deleted=False, updated_at=_utcnow())
+            .returning(Chat.id)
+        )
+        restored_ids = list(self.session.exec(statement).scalars().all())
+        self.session.commit()
+        return restored_ids
+    
+    def bulk_hard_delete(self, chat_ids: list[UUID], user_id: str) -> list[UUID]:
+        """
+        Permanently remove multiple chats in a single statement and transaction.
+        
+        Args:
+            chat_ids: List of chat UUIDs
+            user_id: User ID string to verify ownership
+            
+        Returns:
+            IDs of the chats that were deleted
+        """
+        statement = (
+            delete(Chat)
+            .where(col(Chat.id).in_(chat_ids), Chat.user_id == user_id)
+            .returning(Chat.id)
+        )
+        deleted_ids = list(self.session.exec(statement).scalars().all())
+        self.session.commit()
+        return deleted_ids
     
     def count_by_user(self, user_id: str, include_deleted: bool = False) -> int:
         """
@@ -184,10 +411,9 @@ class ChatRepository:
         Returns:
             Total count of chats
         """
-        statement = select(Chat).where(Chat.user_id == user_id)
+        statement = select(func.count()).select_from(Chat).where(Chat.user_id == user_id)
         
         if not include_deleted:
             statement = statement.where(Chat.is_deleted == False)
         
-        results = self.session.exec(statement).all()
-        return len(list(results))
+        return self.session.exec(statement).one()
@@ -1,8 +1,14 @@
 from typing import Optional
 from uuid import UUID
-from sqlmodel import Session, select, desc, col
-from app.models import Message, MessageCreate, MessageUpdate, Model
+from sqlmodel import Session, select, desc, col, insert, update, delete, func, tuple_, literal
+from sqlalchemy import Row
+from app.models import Message, MessageCreate, MessageUpdate, MessageType, Model
 from datetime import datetime, timezone
+from decimal import Decimal
+
+
+# Upper bound on IDs bound into a single IN clause, to stay under driver parameter limits
+_BULK_BATCH_SIZE = 500
 
 
 class MessageRepository:
@@ -11,6 +17,17 @@ class MessageRepository:
     def __init__(self, session: Session):
         self.session = session
     
+    def _commit_returned(self, message: Message) -> Message:
+        """
+        Commit the current transaction and return a message loaded via RETURNING.
+        
+        The message is detached first so the commit doesn't expire the returned
+        values and force a reload on the next attribute access.
+        """
+        self.session.expunge(message)
+        self.session.commit()
+        return message
+    
     def create(self, message_data: MessageCreate) -> Message:
         """
         Create a new message.
@@ -21,11 +38,32 @@ class MessageRepository:
         Returns:
             Created message instance
         """
-        message = Message.model_validate(message_data)
-        self.session.add(message)
+        statement = insert(Message).values(**message_data.model_dump()).returning(Message)
+        message = self.session.exec(statement).scalar_one()
+        return self._commit_returned(message)
+    
+    def create_many(self, messages_data: list[MessageCreate]) -> list[Message]:
+        """
+        Create several messages with a single INSERT and commit.
+        
+        Args:
+            messages_data: List of message creation data
+            
+        Returns:
+            Created message instances, in the same order as the input
+        """
+        if not messages_data:
+            return []
+        
+        statement = insert(Message).returning(Message, sort_by_parameter_order=True)
+        messages = list(self.session.scalars(
+            statement,
+            [message_data.model_dump() for message_data in messages_data]
+        ).all())
+        for message in messages:
+            self.session.expunge(message)
         self.session.commit()
-        self.session.refresh(message)
-        return message
+        return messages
     
     def get_by_id(self, message_id: UUID) -> Optional[Message]:
         """
@@ -37,8 +75,28 @@ class MessageRepository:
         Returns:
             Message instance or None if not found
         """
-        statement = select(Message).where(Message.id == message_id, Message.is_deleted == False)
-        return self.session.exec(statement).first()
+        # Served from the session's identity map when the message is already loaded
+        message = self.session.get(Message, message_id)
+        if message is None or message.is_deleted:
+            return None
+        return message
+    
+    def exists(self, message_id: UUID) -> bool:
+        """
+        Check whether a non-deleted message exists without loading it.
+        
+        Args:
+            message_id: Message UUID
+            
+        Returns:
+            True if the message exists, False otherwise
+        """
+        statement = (
+            select(literal(True))
+            .where(Message.id == message_id, Message.is_deleted == False)
+            .limit(1)
+        )
+        return self.session.exec(statement).first() is not None
     
     def get_with_model(self, message_id: UUID) -> Optional[tuple[Message, Model]]:
         """
@@ -116,6 +174,43 @@ class MessageRepository:
         statement = statement.order_by(col(Message.created_at)).offset(skip).limit(limit)
         return list(self.session.exec(statement).all())
     
+    def get_page_after(
+        self,
+        chat_id: UUID,
+        cursor: Optional[tuple[datetime, UUID]] = None,
+        limit: int = 100,
+        include_deleted: bool = False
+    ) -> list[tuple[Message, Model]]:
+        """
+        Get a page of messages in a chat with their models using keyset pagination.
+        
+        Messages are ordered by created_at with the ID as tie-breaker, so the
+        (created_at, id) of the last message of a page is the cursor for the next.
+        
+        Args:
+            chat_id: Chat UUID
+            cursor: (created_at, id) of the last message of the previous page, or None for the first page
+            limit: Maximum number of records to return
+            include_deleted: If True, include deleted messages
+            
+        Returns:
+            List of (Message, Model) tuples ordered by creation time
+        """
+        statement = (
+            select(Message, Model)
+            .where(Message.model_id == Model.id)
+            .where(Message.chat_id == chat_id)
+        )
+        
+        if not include_deleted:
+            statement = statement.where(Message.is_deleted == False)
+        
+        if cursor is not None:
+            statement = statement.where(tuple_(Message.created_at, Message.id) > tuple_(*cursor))
+        
+        statement = statement.order_by(col(Message.created_at), col(Message.id)).limit(limit)
+        return list(self.session.exec(statement).all())
+    
     def get_by_type(
         self, 
         chat_id: UUID, 
@@ -148,6 +243,37 @@ class MessageRepository:
         )
         return list(self.session.exec(statement).all())
     
+    def get_with_feedback(
+        self,
+        chat_id: UUID,
+        feedback_type: Optional[str] = None
+    ) -> list[tuple[Message, Model]]:
+        """
+        Get messages in a chat that have feedback, with their associated models.
+        
+        Args:
+            chat_id: Chat UUID
+            feedback_type: Optional filter for 'positive' or 'negative'
+            
+        Returns:
+            List of tuples (Message, Model) ordered by creation time
+        """
+        statement = (
+            select(Message, Model)
+            .where(Message.model_id == Model.id)
+            .where(
+                Message.chat_id == chat_id,
+                Message.is_deleted == False,
+                col(Message.feedback).is_not(None)
+            )
+        )
+        
+        if feedback_type:
+            statement = statement.where(Message.feedback == feedback_type)
+        
+        statement = statement.order_by(Message.created_at)
+        return list(self.session.exec(statement).all())
+    
     def update(self, message_id: UUID, message_data: MessageUpdate) -> Optional[Message]:
         """
         Update a message.
@@ -159,19 +285,20 @@ class MessageRepository:
         Returns:
             Updated message instance or None if not found
         """
-        message = self.get_by_id(message_id)
+        statement = (
+            update(Message)
+            .where(Message.id == message_id, Message.is_deleted == False)
+            .values(
+                **message_data.model_dump(exclude_unset=True),
+                updated_at=datetime.now(timezone.utc)
+            )
+            .returning(Message)
+        )
+        message = self.session.exec(statement).scalar_one_or_none()
         if not message:
             return None
         
-        update_data = message_data.model_dump(exclude_unset=True)
-        for key, value in update_data.items():
-            setattr(message, key, value)
-        
-        message.updated_at = datetime.now(timezone.utc)
-        self.session.add(message)
-        self.session.commit()
-        self.session.refresh(message)
-        return message
+        return self._commit_returned(message)
     
     def update_feedback(self, message_id: UUID, feedback: str) -> Optional[Message]:
         """
@@ -184,16 +311,17 @@ class MessageRepository:
         Returns:
             Updated message instance or None if not found
         """
-        message = self.get_by_id(message_id)
+        statement = (
+            update(Message)
+            .where(Message.id == message_id, Message.is_deleted == False)
+            .values(feedback=feedback, updated_at=datetime.now(timezone.utc))
+            .returning(Message)
+        )
+        message = self.session.exec(statement).scalar_one_or_none()
         if not message:
             return None
         
-        message.feedback = feedback
-        message.updated_at = datetime.now(timezone.utc)
-        self.session.add(message)
-        self.session.commit()
-        self.session.refresh(message)
-        return message
+        return self._commit_returned(message)
     
     def soft_delete(self, message_id: UUID) -> bool:
         """
@@ -225,8 +353,7 @@ class MessageRepository:
         Returns:
             True if deleted, False if not found
         """
-        statement = select(Message).where(Message.id == message_id)
-        message = self.session.exec(statement).first()
+        message = self.session.get(Message, message_id)
         if not message:
             return False
         
@@ -234,6 +361,54 @@ class MessageRepository:
         self.session.commit()
         return True
     
+    def soft_delete_many(self, message_ids: list[UUID]) -> int:
+        """
+        Soft delete multiple messages in one transaction.
+        
+        Args:
+            message_ids: List of message UUIDs
+            
+        Returns:
+            Number of messages deleted
+        """
+        ids = list(dict.fromkeys(message_ids))
+        now = datetime.now(timezone.utc)
+        count = 0
+        for start in range(0, len(ids), _BULK_BATCH_SIZE):
+            statement = (
+                update(Message)
+                .where(
+                    col(Message.id).in_(ids[start:start + _BULK_BATCH_SIZE]),
+                    Message.is_deleted == False
+                )
+                .values(is_deleted=True, updated_at=now)
+            )
+            count += self.session.exec(statement).rowcount
+        
+        self.session.commit()
+        return count
+    
+    def hard_delete_many(self, message_ids: list[UUID]) -> int:
+        """
+        Permanently delete multiple messages in one transaction.
+        
+        Args:
+            message_ids: List of message UUIDs
+            
+        Returns:
+            Number of messages deleted
+        """
+        ids = list(dict.fromkeys(message_ids))
+        count = 0
+        for start in range(0, len(ids), _BULK_BATCH_SIZE):
+            statement = delete(Message).where(
+                col(Message.id).in_(ids[start:start + _BULK_BATCH_SIZE])
+            )
+            count += self.session.exec(statement).rowcount
+        
+        self.session.commit()
+        return count
+    
     def soft_delete_by_chat(self, chat_id: UUID) -> int:
         """
         Soft delete all messages in a chat.
@@ -244,18 +419,12 @@ class MessageRepository:
         Returns:
             Number of messages deleted
         """
-        statement = select(Message).where(
-            Message.chat_id == chat_id,
-            Message.is_deleted == False
+        statement = (
+            update(Message)
+            .where(Message.chat_id == chat_id, Message.is_deleted == False)
+            .values(is_deleted=True, updated_at=datetime.now(timezone.utc))
         )
-        messages = self.session.exec(statement).all()
-        
-        count = 0
-        for message in messages:
-            message.is_deleted = True
-            message.updated_at = datetime.now(timezone.utc)
-            self.session.add(message)
-            count += 1
+        count = self.session.exec(statement).rowcount
         
         if count > 0:
             self.session.commit()
@@ -273,13 +442,12 @@ class MessageRepository:
         Returns:
             Total count of messages
         """
-        statement = select(Message).where(Message.chat_id == chat_id)
+        statement = select(func.count()).select_from(Message).where(Message.chat_id == chat_id)
         
         if not include_deleted:
             statement = statement.where(Message.is_deleted == False)
         
-        results = self.session.exec(statement).all()
-        return len(list(results))
+        return self.session.exec(statement).one()
     
     def get_latest_by_chat(self, chat_id: UUID) -> Optional[Message]:
         """
@@ -299,6 +467,25 @@ class MessageRepository:
         )
         return self.session.exec(statement).first()
     
+    def get_latest_by_chat_with_model(self, chat_id: UUID) -> Optional[tuple[Message, Model]]:
+        """
+        Get the latest message in a chat with its associated model.
+        
+        Args:
+            chat_id: Chat UUID
+            
+        Returns:
+            Tuple of (Message, Model) or None if no messages
+        """
+        statement = (
+            select(Message, Model)
+            .where(Message.model_id == Model.id)
+            .where(Message.chat_id == chat_id, Message.is_deleted == False)
+            .order_by(desc(Message.created_at))
+            .limit(1)
+        )
+        return self.session.exec(statement).first()
+    
     def calculate_total_tokens(self, chat_id: UUID) -> int:
         """
         Calculate total tokens used in a chat.
@@ -309,9 +496,54 @@ class MessageRepository:
         Returns:
             Total token count
         """
-        statement = select(Message).where(
+        statement = select(func.coalesce(func.sum(Message.tokens), 0)).where(
             Message.chat_id == chat_id,
             Message.is_deleted == False
         )
-        messages = self.session.exec(statement).all()
-        return sum(msg.tokens or 0 for msg in messages if msg.tokens is not None)
+        return self.session.exec(statement).one()
+    
+    def sum_cost(self, chat_id: UUID) -> Decimal:
+        """
+        Calculate the total cost of a chat from message tokens and model pricing.
+        
+        Args:
+            chat_id: Chat UUID
+            
+        Returns:
+            Total cost in dollars
+        """
+        statement = (
+            select(func.coalesce(func.sum(Message.tokens * Model.price_per_million_tokens), 0) / 1_000_000)
+            .select_from(Message)
+            .join(Model, Message.model_id == Model.id)
+            .where(Message.chat_id == chat_id, Message.is_deleted == False)
+        )
+        return self.session.exec(statement).one()
+    
+    def get_summary(self, chat_id: UUID) -> Row:
+        """
+        Aggregate message statistics for a chat in a single query.
+        
+        Args:
+            chat_id: Chat UUID
+            
+        Returns:
+            Row with total_messages, user_messages, ai_messages, system_messages,
+            total_tokens, total_cost and latest_message_at. Sums are None when
+            the chat has no active messages.
+        """
+        statement = (
+            select(
+                func.count().label("total_messages"),
+                func.count().filter(Message.type == MessageType.user).label("user_messages"),
+                func.count().filter(Message.type == MessageType.assistant).label("ai_messages"),
+                func.count().filter(Message.type == MessageType.system).label("system_messages"),
+                func.sum(Message.tokens).label("total_tokens"),
+                (func.sum(Message.tokens * Model.price_per_million_tokens) / 1_000_000).label("total_cost"),
+                func.max(Message.created_at).label("latest_message_at"),
+            )
+            .select_from(Message)
+            .outerjoin(Model, Message.model_id == Model.id)
+            .where(Message.chat_id == chat_id, Message.is_deleted == False)
+        )
+        return self.session.exec(statement).one()
@@ -1,10 +1,55 @@
+from threading import Lock
 from typing import Optional
 from uuid import UUID
-from sqlmodel import Session, select
+from cachetools import TTLCache
+from sqlalchemy.orm import make_transient_to_detached
+from sqlmodel import Session, select, col, insert, update
 from app.models import Model, ModelCreate, ModelUpdate
 from datetime import datetime, timezone
 
 
+# Models change rarely compared to how often they are read, so lookups by ID and
+# by name are cached process-wide. Entries are detached snapshots, never bound
+# to a session, and are dropped on every write that goes through this repository.
+# Other processes only see those writes once the TTL expires, so the cache serves
+# read-only lookups and write paths always load the row fresh.
+_MODEL_CACHE_MAXSIZE = 256
+_MODEL_CACHE_TTL = 30
+
+_models_by_id: TTLCache[UUID, Model] = TTLCache(maxsize=_MODEL_CACHE_MAXSIZE, ttl=_MODEL_CACHE_TTL)
+_models_by_name: TTLCache[str, Model] = TTLCache(maxsize=_MODEL_CACHE_MAXSIZE, ttl=_MODEL_CACHE_TTL)
+_model_cache_lock = Lock()
+
+
+def _snapshot(model: Model) -> Model:
+    """
+    Copy a loaded model into a detached instance that is safe to share between sessions.
+    """
+    snapshot = Model.model_validate(model)
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+def clear_model_cache() -> None:
+    """
+    Drop every cached model.
+    """
+    with _model_cache_lock:
+        _models_by_id.clear()
+        _models_by_name.clear()
+
+
+def _invalidate_model(model_id: UUID) -> None:
+    """
+    Drop a model from the caches after it has been written.
+    
+    Names can change on update, so the name cache is cleared as a whole.
+    """
+    with _model_cache_lock:
+        _models_by_id.pop(model_id, None)
+        _models_by_name.clear()
+
+
 class ModelRepository:
     """Repository for Model CRUD operations."""
     
@@ -27,6 +72,29 @@ class ModelRepository:
         self.session.refresh(model)
         return model
     
+    def create_many(self, models_data: list[ModelCreate]) -> list[Model]:
+        """
+        Create several models with a single INSERT and commit.
+        
+        Args:
+            models_data: List of model creation data
+            
+        Returns:
+            Created model instances, in the same order as the input
+        """
+        if not models_data:
+            return []
+        
+        statement = insert(Model).returning(Model, sort_by_parameter_order=True)
+        models = list(self.session.scalars(
+            statement,
+            [model_data.model_dump() for model_data in models_data]
+        ).all())
+        for model in models:
+            self.session.expunge(model)
+        self.session.commit()
+        return models
+    
     def get_by_id(self, model_id: UUID) -> Optional[Model]:
         """
         Get a model by ID.
@@ -37,8 +105,44 @@ class ModelRepository:
         Returns:
             Model instance or None if not found
         """
-        statement = select(Model).where(Model.id == model_id)
-        return self.session.exec(statement).first()
+        with _model_cache_lock:
+            snapshot = _models_by_id.get(model_id)
+        if snapshot is not None:
+            return self.session.merge(snapshot, load=False)
+        
+        model = self.session.get(Model, model_id)
+        if model is not None:
+            with _model_cache_lock:
+                _models_by_id[model_id] = _snapshot(model)
+        return model
+    
+    def get_fresh_by_id(self, model_id: UUID) -> Optional[Model]:
+        """
+        Get a model by ID from the database, bypassing the model cache.
+        
+        Write paths use this so they never act on a cached snapshot of a row
+        that another session has since changed or deleted.
+        
+        Args:
+            model_id: Model UUID
+            
+        Returns:
+            Model instance or None if not found
+        """
+        return self.session.get(Model, model_id, populate_existing=True)
+    
+    def get_many(self, model_ids: list[UUID]) -> list[Model]:
+        """
+        Get several models by ID in a single query.
+        
+        Args:
+            model_ids: List of model UUIDs
+            
+        Returns:
+            List of the models found, in no particular order
+        """
+        statement = select(Model).where(col(Model.id).in_(model_ids))
+        return list(self.session.exec(statement).all())
     
     def get_by_name(self, name: str) -> Optional[Model]:
         """
@@ -50,8 +154,17 @@ class ModelRepository:
         Returns:
             Model instance or None if not found
         """
+        with _model_cache_lock:
+            snapshot = _models_by_name.get(name)
+        if snapshot is not None:
+            return self.session.merge(snapshot, load=False)
+        
         statement = select(Model).where(Model.name == name)
-        return self.session.exec(statement).first()
+        model = self.session.exec(statement).first()
+        if model is not None:
+            with _model_cache_lock:
+                _models_by_name[name] = _snapshot(model)
+        return model
     
     def get_all(
         self, 
@@ -91,6 +204,16 @@ class ModelRepository:
         statement = select(Model).where(Model.provider == provider)
         return list(self.session.exec(statement).all())
     
+    def get_distinct_providers(self) -> list[str]:
+        """
+        Get the distinct provider names across all models.
+        
+        Returns:
+            Sorted list of provider names
+        """
+        statement = select(Model.provider).distinct().order_by(Model.provider)
+        return list(self.session.exec(statement).all())
+    
     def update(self, model_id: UUID, model_data: ModelUpdate) -> Optional[Model]:
         """
         Update a model.
@@ -102,7 +225,7 @@ class ModelRepository:
         Returns:
             Updated model instance or None if not found
         """
-        model = self.get_by_id(model_id)
+        model = self.get_fresh_by_id(model_id)
         if not model:
             return None
         
@@ -113,6 +236,7 @@ class ModelRepository:
         model.updated_at = datetime.now(timezone.utc)
         self.session.add(model)
         self.session.commit()
+        _invalidate_model(model_id)
         self.session.refresh(model)
         return model
     
@@ -126,12 +250,13 @@ class ModelRepository:
         Returns:
             True if deleted, False if not found
         """
-        model = self.get_by_id(model_id)
+        model = self.get_fresh_by_id(model_id)
         if not model:
             return False
         
         self.session.delete(model)
         self.session.commit()
+        _invalidate_model(model_id)
         return True
     
     def toggle_enabled(self, model_id: UUID) -> Optional[Model]:
@@ -144,15 +269,47 @@ class ModelRepository:
         Returns:
             Updated model instance or None if not found
         """
-        model = self.get_by_id(model_id)
-        if not model:
+        statement = (
+            update(Model)
+            .where(Model.id == model_id)
+            .values(is_enabled=~col(Model.is_enabled), updated_at=datetime.now(timezone.utc))
+            .returning(Model)
+        )
+        model = self.session.exec(statement).scalar_one_or_none()
+        if model is None:
             return None
         
-        model.is_enabled = not model.is_enabled
-        model.updated_at = datetime.now(timezone.utc)
-        self.session.add(model)
+        # Detach so the commit doesn't expire the RETURNING values
+        self.session.expunge(model)
         self.session.commit()
-        self.session.refresh(model)
+        _invalidate_model(model_id)
+        return model
+    
+    def set_enabled(self, model_id: UUID, enabled: bool) -> Optional[Model]:
+        """
+        Set the enabled status of a model if it differs from the current one.
+        
+        Args:
+            model_id: Model UUID
+            enabled: Desired enabled status
+            
+        Returns:
+            Updated model instance, or None if not found or already in that state
+        """
+        statement = (
+            update(Model)
+            .where(Model.id == model_id, Model.is_enabled != enabled)
+            .values(is_enabled=enabled, updated_at=datetime.now(timezone.utc))
+            .returning(Model)
+        )
+        model = self.session.exec(statement).scalar_one_or_none()
+        if model is None:
+            return None
+        
+        # Detach so the commit doesn't expire the RETURNING values
+        self.session.expunge(model)
+        self.session.commit()
+        _invalidate_model(model_id)
         return model
     
     def count(self, enabled_only: bool = False) -> int:
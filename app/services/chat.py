@@ -1,11 +1,20 @@
-from typing import Optional
+from typing import Iterator, Literal, Optional
 from uuid import UUID
+from datetime import datetime
+from pydantic import TypeAdapter
 from sqlmodel import Session
 
 from app.repositories.chat import ChatRepository
 from app.models import Chat, ChatCreate, ChatUpdate, ChatPublic
 
 
+# Validator for list responses, built once instead of validating row by row
+_CHAT_LIST_ADAPTER = TypeAdapter(list[ChatPublic])
+
+# Known-valid creation data for auto-created chats, so it is not rebuilt per call
+_DEFAULT_CHAT_CREATE = ChatCreate.model_construct(title="New Chat")
+
+
 class ChatService:
     """Service layer for Chat business logic."""
     
@@ -55,8 +64,7 @@ class ChatService:
             return ChatPublic.model_validate(chat)
         
         # Create new chat
-        title = auto_title or "New Chat"
-        chat_data = ChatCreate(title=title)
+        chat_data = ChatCreate(title=auto_title) if auto_title else _DEFAULT_CHAT_CREATE
         return self.create_chat(user_id, chat_data)
     
     def get_chat_by_id(self, chat_id: UUID, user_id: str) -> Optional[ChatPublic]:
@@ -118,7 +126,24 @@ class ChatService:
             limit=limit,
             include_deleted=include_deleted
         )
-        return [ChatPublic.model_validate(chat) for chat in chats]
+        return _CHAT_LIST_ADAPTER.validate_python(chats, from_attributes=True)
+    
+    def list_fingerprint(
+        self,
+        user_id: str,
+        include_deleted: bool = False
+    ) -> tuple[Optional[datetime], int]:
+        """
+        Get a fingerprint of a user's chat list for HTTP cache validation.
+        
+        Args:
+            user_id: User ID string
+            include_deleted: If True, include soft-deleted chats
+            
+        Returns:
+            Tuple of (latest updated_at or None if no chats, chat count)
+        """
+        return self.repository.fingerprint(user_id, include_deleted=include_deleted)
     
     def get_active_chats(
         self,
@@ -275,7 +300,46 @@ class ChatService:
         # Apply pagination manually
         paginated = deleted_chats[skip:skip + limit] if skip < len(deleted_chats) else []
         
-        return [ChatPublic.model_validate(chat) for chat in paginated]
+        return _CHAT_LIST_ADAPTER.validate_python(paginated, from_attributes=True)
+    
+    def scan_user_chats(
+        self,
+        user_id: str,
+        *,
+        include_deleted: bool = False,
+        deleted_only: bool = False,
+        batch_size: int = 500
+    ) -> Iterator[ChatPublic]:
+        """
+        Iterate over all chats for a user, most recent first.
+        
+        Pages through the chats with a keyset cursor instead of OFFSET, so full
+        scans (e.g. exports) cost the same per batch no matter how deep they go.
+        
+        Args:
+            user_id: User ID string
+            include_deleted: If True, include soft-deleted chats
+            deleted_only: If True, only yield soft-deleted chats
+            batch_size: Number of chats fetched per query
+            
+        Yields:
+            ChatPublic instances
+        """
+        cursor = None
+        while True:
+            chats = self.repository.get_page(
+                user_id,
+                cursor=cursor,
+                limit=batch_size,
+                include_deleted=include_deleted,
+                deleted_only=deleted_only
+            )
+            for chat in chats:
+                yield ChatPublic.model_validate(chat)
+            
+            if len(chats) < batch_size:
+                return
+            cursor = (chats[-1].updated_at, chats[-1].id)
     
     def update_chat_title(
         self,
@@ -328,34 +392,46 @@ class ChatService:
         Returns:
             True if chat exists and user owns it, False otherwise
         """
-        return self.repository.get_by_id(chat_id, user_id) is not None
+        return self.repository.owner_of(chat_id) == user_id
     
-    def bulk_delete_chats(self, chat_ids: list[UUID], user_id: str) -> dict[str, int]:
+    def _bulk(
+        self,
+        op_name: Literal["soft_delete", "restore", "hard_delete"],
+        chat_ids: list[UUID],
+        user_id: str
+    ) -> dict[str, int]:
         """
-        Soft delete multiple chats at once.
+        Run a bulk repository operation and summarize its outcome.
         
         Args:
+            op_name: Repository operation, dispatched to bulk_<op_name>
             chat_ids: List of chat UUIDs
             user_id: User ID string to verify ownership
             
         Returns:
-            Dictionary with counts of successful and failed deletions
+            Dictionary with counts of successful and failed operations
         """
-        successful = 0
-        failed = 0
-        
-        for chat_id in chat_ids:
-            if self.repository.soft_delete(chat_id, user_id):
-                successful += 1
-            else:
-                failed += 1
+        affected_ids = getattr(self.repository, f"bulk_{op_name}")(chat_ids, user_id)
         
         return {
-            "successful": successful,
-            "failed": failed,
+            "successful": len(affected_ids),
+            "failed": len(chat_ids) - len(affected_ids),
             "total": len(chat_ids)
         }
     
+    def bulk_delete_chats(self, chat_ids: list[UUID], user_id: str) -> dict[str, int]:
+        """
+        Soft delete multiple chats at once.
+        
+        Args:
+            chat_ids: List of chat UUIDs
+            user_id: User ID string to verify ownership
+            
+        Returns:
+            Dictionary with counts of successful and failed deletions
+        """
+        return self._bulk("soft_delete", chat_ids, user_id)
+    
     def bulk_restore_chats(self, chat_ids: list[UUID], user_id: str) -> dict[str, int]:
         """
         Restore multiple soft-deleted chats at once.
@@ -367,20 +443,7 @@ class ChatService:
         Returns:
             Dictionary with counts of successful and failed restorations
         """
-        successful = 0
-        failed = 0
-        
-        for chat_id in chat_ids:
-            if self.repository.restore(chat_id, user_id) is not None:
-                successful += 1
-            else:
-                failed += 1
-        
-        return {
-            "successful": successful,
-            "failed": failed,
-            "total": len(chat_ids)
-        }
+        return self._bulk("restore", chat_ids, user_id)
     
     def bulk_permanently_delete_chats(
         self,
@@ -397,17 +460,4 @@ class ChatService:
         Returns:
             Dictionary with counts of successful and failed deletions
         """
-        successful = 0
-        failed = 0
-        
-        for chat_id in chat_ids:
-            if self.repository.hard_delete(chat_id, user_id):
-                successful += 1
-            else:
-                failed += 1
-        
-        return {
-            "successful": successful,
-            "failed": failed,
-            "total": len(chat_ids)
-        }
+        return self._bulk("hard_delete", chat_ids, user_id)
@@ -1,3 +1,6 @@
+import base64
+import binascii
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 from sqlmodel import Session
@@ -10,11 +13,55 @@ from app.models import (
     MessageCreate, 
     MessageUpdate, 
     MessagePublic,
+    Model,
     ModelPublic,
     ChatCreate
 )
 
 
+# Field names copied from ORM rows into the public schemas, computed once at import
+_MSG_FIELDS = tuple(field for field in MessagePublic.model_fields if field != "model")
+_MODEL_FIELDS = tuple(ModelPublic.model_fields)
+
+
+def _msg_public_from_orm(message: Message, model: Model) -> MessagePublic:
+    """
+    Build a MessagePublic from a message and its model as loaded from the database.
+    
+    Rows coming from the database are trusted, so both objects are built with
+    model_construct and skip validation.
+    """
+    model_public = ModelPublic.model_construct(
+        **{field: getattr(model, field) for field in _MODEL_FIELDS}
+    )
+    return MessagePublic.model_construct(
+        **{field: getattr(message, field) for field in _MSG_FIELDS},
+        model=model_public
+    )
+
+
+def _encode_message_cursor(message: MessagePublic) -> str:
+    """
+    Serialize the (created_at, id) keyset position of a message into an opaque cursor.
+    """
+    raw = f"{message.created_at.isoformat()}|{message.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_message_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """
+    Parse a cursor produced by _encode_message_cursor.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        created_at, message_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(message_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor '{cursor}'") from e
+
+
 class MessageService:
     """Service layer for Message business logic."""
     
@@ -22,6 +69,82 @@ class MessageService:
         self.message_repository = MessageRepository(session)
         self.chat_repository = ChatRepository(session)
         self.model_repository = ModelRepository(session)
+        self._model_cache: dict[UUID, Model] = {}
+        self._token_totals: dict[UUID, int] = {}
+    
+    def _get_model(self, model_id: UUID) -> Optional[Model]:
+        """
+        Get a model by ID, memoized for the lifetime of this service instance.
+        
+        Cached models are detached from the session so later commits don't
+        expire them and trigger a reload on attribute access.
+        
+        Args:
+            model_id: Model UUID
+            
+        Returns:
+            Model instance or None if not found
+        """
+        model = self._model_cache.get(model_id)
+        if model is None:
+            model = self.model_repository.get_by_id(model_id)
+            if model is not None:
+                self.model_repository.session.expunge(model)
+                self._model_cache[model_id] = model
+        return model
+    
+    def _invalidate_token_totals(self, chat_id: Optional[UUID] = None) -> None:
+        """
+        Forget memoized token totals after messages were written.
+        
+        Args:
+            chat_id: Chat whose total changed, or None to forget every chat
+        """
+        if chat_id is None:
+            self._token_totals.clear()
+        else:
+            self._token_totals.pop(chat_id, None)
+    
+    def _get_models(self, model_ids: set[UUID]) -> dict[UUID, Model]:
+        """
+        Get several models by ID, fetching the ones not yet memoized in one query.
+        
+        Args:
+            model_ids: Set of model UUIDs
+            
+        Returns:
+            Dictionary of the models found, keyed by ID
+        """
+        missing_ids = [model_id for model_id in model_ids if model_id not in self._model_cache]
+        if missing_ids:
+            for model in self.model_repository.get_many(missing_ids):
+                self.model_repository.session.expunge(model)
+                self._model_cache[model.id] = model
+        
+        return {
+            model_id: self._model_cache[model_id]
+            for model_id in model_ids
+            if model_id in self._model_cache
+        }
+    
+    def _to_public(self, messages: list[Message]) -> list[MessagePublic]:
+        """
+        Attach models to messages and build their public representation.
+        
+        Messages whose model no longer exists are skipped, as with a join.
+        
+        Args:
+            messages: Message instances
+            
+        Returns:
+            List of MessagePublic instances in the same order
+        """
+        models = self._get_models({message.model_id for message in messages})
+        return [
+            _msg_public_from_orm(message, models[message.model_id])
+            for message in messages
+            if message.model_id in models
+        ]
     
     def create_message(self, message_data: MessageCreate, user_id: Optional[str] = None) -> Optional[MessagePublic]:
         """
@@ -38,43 +161,60 @@ class MessageService:
             ValueError: If model doesn't exist or is disabled, or if chat doesn't exist
         """
         # Verify model exists and is enabled
-        model = self.model_repository.get_by_id(message_data.model_id)
+        model = self._get_model(message_data.model_id)
         if not model:
             raise ValueError(f"Model with ID '{message_data.model_id}' does not exist")
         if not model.is_enabled:
             raise ValueError(f"Model '{model.name}' is currently disabled")
         
         # Verify chat exists (without user_id check for internal use)
-        from sqlmodel import select
-        from app.models import Chat
-        statement = select(Chat).where(Chat.id == message_data.chat_id)
-        chat = self.chat_repository.session.exec(statement).first()
-        if not chat:
+        if not self.chat_repository.exists(message_data.chat_id):
             raise ValueError(f"Chat with ID '{message_data.chat_id}' does not exist")
         
         message = self.message_repository.create(message_data)
+        self._invalidate_token_totals(message.chat_id)
         
-        # Get message with model for proper serialization
-        result = self.message_repository.get_with_model(message.id)
-        if not result:
-            return None
+        # Reuse the model loaded during validation for serialization
+        return _msg_public_from_orm(message, model)
+    
+    def create_messages(self, messages_data: list[MessageCreate]) -> list[MessagePublic]:
+        """
+        Create several messages at once, e.g. the user and AI messages of one turn.
         
-        message_obj, model_obj = result
-        # Construct MessagePublic with all fields including the model
-        message_public = MessagePublic.model_construct(
-            id=message_obj.id,
-            chat_id=message_obj.chat_id,
-            model_id=message_obj.model_id,
-            type=message_obj.type,
-            content=message_obj.content,
-            tokens=message_obj.tokens,
-            feedback=message_obj.feedback,
-            is_deleted=message_obj.is_deleted,
-            created_at=message_obj.created_at,
-            updated_at=message_obj.updated_at,
-            model=ModelPublic.model_validate(model_obj)
-        )
-        return message_public
+        All models and chats are validated up front, then the messages are
+        inserted in a single statement and transaction.
+        
+        Args:
+            messages_data: List of message creation data
+            
+        Returns:
+            Created messages as MessagePublic, in the same order as the input
+            
+        Raises:
+            ValueError: If a model doesn't exist or is disabled, or if a chat doesn't exist
+        """
+        if not messages_data:
+            return []
+        
+        model_ids = list({message_data.model_id for message_data in messages_data})
+        models = self._get_models(set(model_ids))
+        for model_id in model_ids:
+            model = models.get(model_id)
+            if not model:
+                raise ValueError(f"Model with ID '{model_id}' does not exist")
+            if not model.is_enabled:
+                raise ValueError(f"Model '{model.name}' is currently disabled")
+        
+        chat_ids = list({message_data.chat_id for message_data in messages_data})
+        existing_chat_ids = self.chat_repository.get_existing_ids(chat_ids)
+        for chat_id in chat_ids:
+            if chat_id not in existing_chat_ids:
+                raise ValueError(f"Chat with ID '{chat_id}' does not exist")
+        
+        messages = self.message_repository.create_many(messages_data)
+        for chat_id in chat_ids:
+            self._invalidate_token_totals(chat_id)
+        return [_msg_public_from_orm(message, models[message.model_id]) for message in messages]
     
     def create_message_with_auto_chat(
         self,
@@ -104,7 +244,7 @@ class MessageService:
             ValueError: If model doesn't exist or is disabled
         """
         # Verify model exists and is enabled
-        model = self.model_repository.get_by_id(model_id)
+        model = self._get_model(model_id)
         if not model:
             raise ValueError(f"Model with ID '{model_id}' does not exist")
         if not model.is_enabled:
@@ -128,28 +268,10 @@ class MessageService:
             tokens=tokens
         )
         message = self.message_repository.create(message_data)
+        self._invalidate_token_totals(message.chat_id)
         
-        # Get message with model for proper serialization
-        result = self.message_repository.get_with_model(message.id)
-        if not result:
-            raise ValueError("Failed to retrieve created message")
-        
-        message_obj, model_obj = result
-        message_public = MessagePublic.model_construct(
-            id=message_obj.id,
-            chat_id=message_obj.chat_id,
-            model_id=message_obj.model_id,
-            type=message_obj.type,
-            content=message_obj.content,
-            tokens=message_obj.tokens,
-            feedback=message_obj.feedback,
-            is_deleted=message_obj.is_deleted,
-            created_at=message_obj.created_at,
-            updated_at=message_obj.updated_at,
-            model=ModelPublic.model_validate(model_obj)
-        )
-        
-        return message_public, chat.id
+        # Reuse the model loaded during validation for serialization
+        return _msg_public_from_orm(message, model), chat.id
     
     def get_message_by_id(self, message_id: UUID) -> Optional[MessagePublic]:
         """
@@ -166,20 +288,7 @@ class MessageService:
             return None
         
         message, model = result
-        message_public = MessagePublic.model_construct(
-            id=message.id,
-            chat_id=message.chat_id,
-            model_id=message.model_id,
-            type=message.type,
-            content=message.content,
-            tokens=message.tokens,
-            feedback=message.feedback,
-            is_deleted=message.is_deleted,
-            created_at=message.created_at,
-            updated_at=message.updated_at,
-            model=ModelPublic.model_validate(model)
-        )
-        return message_public
+        return _msg_public_from_orm(message, model)
     
     def get_messages_by_ids(self, message_ids: list[UUID]) -> list[MessagePublic]:
         """
@@ -246,31 +355,50 @@ class MessageService:
         Returns:
             List of MessagePublic instances ordered by creation time
         """
-        results = self.message_repository.get_all_by_chat_with_model(
+        messages = self.message_repository.get_all_by_chat(
             chat_id,
             skip=skip,
             limit=limit,
             include_deleted=include_deleted
         )
         
-        message_publics = []
-        for message, model in results:
-            message_public = MessagePublic.model_construct(
-                id=message.id,
-                chat_id=message.chat_id,
-                model_id=message.model_id,
-                type=message.type,
-                content=message.content,
-                tokens=message.tokens,
-                feedback=message.feedback,
-                is_deleted=message.is_deleted,
-                created_at=message.created_at,
-                updated_at=message.updated_at,
-                model=ModelPublic.model_validate(model)
-            )
-            message_publics.append(message_public)
-        
-        return message_publics
+        return self._to_public(messages)
+    
+    def get_chat_messages_page(
+        self,
+        chat_id: UUID,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        include_deleted: bool = False
+    ) -> tuple[list[MessagePublic], Optional[str]]:
+        """
+        Get a page of messages for a chat using keyset pagination.
+        
+        Unlike get_chat_messages, the cost of a page doesn't grow with how far
+        into the conversation it is.
+        
+        Args:
+            chat_id: Chat UUID
+            cursor: Cursor returned with the previous page, or None for the first page
+            limit: Maximum number of records to return
+            include_deleted: If True, include soft-deleted messages
+            
+        Returns:
+            Tuple of (messages ordered by creation time, cursor for the next page or None)
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        results = self.message_repository.get_page_after(
+            chat_id,
+            cursor=_decode_message_cursor(cursor) if cursor else None,
+            limit=limit,
+            include_deleted=include_deleted
+        )
+        
+        messages = [_msg_public_from_orm(message, model) for message, model in results]
+        next_cursor = _encode_message_cursor(messages[-1]) if len(messages) == limit else None
+        return messages, next_cursor
     
     def get_active_messages(
         self,
@@ -322,28 +450,7 @@ class MessageService:
             limit=limit
         )
         
-        # Get models for each message
-        message_publics = []
-        for message in messages:
-            result = self.message_repository.get_with_model(message.id)
-            if result:
-                msg, model = result
-                message_public = MessagePublic.model_construct(
-                    id=msg.id,
-                    chat_id=msg.chat_id,
-                    model_id=msg.model_id,
-                    type=msg.type,
-                    content=msg.content,
-                    tokens=msg.tokens,
-                    feedback=msg.feedback,
-                    is_deleted=msg.is_deleted,
-                    created_at=msg.created_at,
-                    updated_at=msg.updated_at,
-                    model=ModelPublic.model_validate(model)
-                )
-                message_publics.append(message_public)
-        
-        return message_publics
+        return self._to_public(messages)
     
     def get_user_messages(
         self,
@@ -402,8 +509,9 @@ class MessageService:
             ValueError: If trying to update to a disabled model
         """
         # If updating model_id, verify it exists and is enabled
+        model = None
         if message_data.model_id is not None:
-            model = self.model_repository.get_by_id(message_data.model_id)
+            model = self._get_model(message_data.model_id)
             if not model:
                 raise ValueError(f"Model with ID '{message_data.model_id}' does not exist")
             if not model.is_enabled:
@@ -412,27 +520,14 @@ class MessageService:
         message = self.message_repository.update(message_id, message_data)
         if not message:
             return None
+        self._invalidate_token_totals(message.chat_id)
         
-        # Get with model for proper serialization
-        result = self.message_repository.get_with_model(message.id)
-        if not result:
-            return None
+        if model is None:
+            model = self._get_model(message.model_id)
+            if not model:
+                return None
         
-        msg, model = result
-        message_public = MessagePublic.model_construct(
-            id=msg.id,
-            chat_id=msg.chat_id,
-            model_id=msg.model_id,
-            type=msg.type,
-            content=msg.content,
-            tokens=msg.tokens,
-            feedback=msg.feedback,
-            is_deleted=msg.is_deleted,
-            created_at=msg.created_at,
-            updated_at=msg.updated_at,
-            model=ModelPublic.model_validate(model)
-        )
-        return message_public
+        return _msg_public_from_orm(message, model)
     
     def update_message_content(
         self,
@@ -471,25 +566,11 @@ class MessageService:
         if not message:
             return None
         
-        result = self.message_repository.get_with_model(message.id)
-        if not result:
+        model = self._get_model(message.model_id)
+        if not model:
             return None
         
-        msg, model = result
-        message_public = MessagePublic.model_construct(
-            id=msg.id,
-            chat_id=msg.chat_id,
-            model_id=msg.model_id,
-            type=msg.type,
-            content=msg.content,
-            tokens=msg.tokens,
-            feedback=msg.feedback,
-            is_deleted=msg.is_deleted,
-            created_at=msg.created_at,
-            updated_at=msg.updated_at,
-            model=ModelPublic.model_validate(model)
-        )
-        return message_public
+        return _msg_public_from_orm(message, model)
     
     def delete_message(self, message_id: UUID) -> bool:
         """
@@ -501,6 +582,7 @@ class MessageService:
         Returns:
             True if deleted, False if not found
         """
+        self._invalidate_token_totals()
         return self.message_repository.soft_delete(message_id)
     
     def permanently_delete_message(self, message_id: UUID) -> bool:
@@ -513,6 +595,7 @@ class MessageService:
         Returns:
             True if deleted, False if not found
         """
+        self._invalidate_token_totals()
         return self.message_repository.hard_delete(message_id)
     
     def delete_chat_messages(self, chat_id: UUID) -> int:
@@ -525,6 +608,7 @@ class MessageService:
         Returns:
             Number of messages deleted
         """
+        self._invalidate_token_totals(chat_id)
         return self.message_repository.soft_delete_by_chat(chat_id)
     
     def count_chat_messages(
@@ -566,29 +650,12 @@ class MessageService:
         Returns:
             Latest MessagePublic instance or None if no messages
         """
-        message = self.message_repository.get_latest_by_chat(chat_id)
-        if not message:
-            return None
-        
-        result = self.message_repository.get_with_model(message.id)
+        result = self.message_repository.get_latest_by_chat_with_model(chat_id)
         if not result:
             return None
         
-        msg, model = result
-        message_public = MessagePublic.model_construct(
-            id=msg.id,
-            chat_id=msg.chat_id,
-            model_id=msg.model_id,
-            type=msg.type,
-            content=msg.content,
-            tokens=msg.tokens,
-            feedback=msg.feedback,
-            is_deleted=msg.is_deleted,
-            created_at=msg.created_at,
-            updated_at=msg.updated_at,
-            model=ModelPublic.model_validate(model)
-        )
-        return message_public
+        message, model = result
+        return _msg_public_from_orm(message, model)
     
     def calculate_chat_tokens(self, chat_id: UUID) -> int:
         """
@@ -600,7 +667,11 @@ class MessageService:
         Returns:
             Total token count
         """
-        return self.message_repository.calculate_total_tokens(chat_id)
+        total = self._token_totals.get(chat_id)
+        if total is None:
+            total = self.message_repository.calculate_total_tokens(chat_id)
+            self._token_totals[chat_id] = total
+        return total
     
     def calculate_chat_cost(self, chat_id: UUID) -> float:
         """
@@ -612,21 +683,7 @@ class MessageService:
         Returns:
             Total cost in dollars
         """
-        messages = self.message_repository.get_all_by_chat_with_model(
-            chat_id,
-            skip=0,
-            limit=10000,  # Get all messages
-            include_deleted=False
-        )
-        
-        total_cost = 0.0
-        for message, model in messages:
-            if message.tokens:
-                # price_per_million_tokens * (tokens / 1_000_000)
-                cost = float(model.price_per_million_tokens) * (message.tokens / 1_000_000)
-                total_cost += cost
-        
-        return total_cost
+        return float(self.message_repository.sum_cost(chat_id))
     
     def message_exists(self, message_id: UUID) -> bool:
         """
@@ -638,7 +695,7 @@ class MessageService:
         Returns:
             True if message exists, False otherwise
         """
-        return self.message_repository.get_by_id(message_id) is not None
+        return self.message_repository.exists(message_id)
     
     def get_conversation_summary(self, chat_id: UUID) -> dict:
         """
@@ -650,23 +707,16 @@ class MessageService:
         Returns:
             Dictionary with conversation statistics
         """
-        total_messages = self.count_active_messages(chat_id)
-        user_messages = len(self.message_repository.get_by_type(chat_id, "user"))
-        ai_messages = len(self.message_repository.get_by_type(chat_id, "ai"))
-        system_messages = len(self.message_repository.get_by_type(chat_id, "system"))
-        total_tokens = self.calculate_chat_tokens(chat_id)
-        total_cost = self.calculate_chat_cost(chat_id)
-        
-        latest_message = self.get_latest_message(chat_id)
+        summary = self.message_repository.get_summary(chat_id)
         
         return {
-            "total_messages": total_messages,
-            "user_messages": user_messages,
-            "ai_messages": ai_messages,
-            "system_messages": system_messages,
-            "total_tokens": total_tokens,
-            "total_cost": total_cost,
-            "latest_message_at": latest_message.created_at if latest_message else None
+            "total_messages": summary.total_messages,
+            "user_messages": summary.user_messages,
+            "ai_messages": summary.ai_messages,
+            "system_messages": summary.system_messages,
+            "total_tokens": summary.total_tokens or 0,
+            "total_cost": float(summary.total_cost or 0),
+            "latest_message_at": summary.latest_message_at
         }
     
     def bulk_delete_messages(self, message_ids: list[UUID]) -> dict[str, int]:
@@ -679,18 +729,12 @@ class MessageService:
         Returns:
             Dictionary with counts of successful and failed deletions
         """
-        successful = 0
-        failed = 0
-        
-        for message_id in message_ids:
-            if self.message_repository.soft_delete(message_id):
-                successful += 1
-            else:
-                failed += 1
+        self._invalidate_token_totals()
+        successful = self.message_repository.soft_delete_many(message_ids)
         
         return {
             "successful": successful,
-            "failed": failed,
+            "failed": len(message_ids) - successful,
             "total": len(message_ids)
         }
     
@@ -704,18 +748,12 @@ class MessageService:
         Returns:
             Dictionary with counts of successful and failed deletions
         """
-        successful = 0
-        failed = 0
-        
-        for message_id in message_ids:
-            if self.message_repository.hard_delete(message_id):
-                successful += 1
-            else:
-                failed += 1
+        self._invalidate_token_totals()
+        successful = self.message_repository.hard_delete_many(message_ids)
         
         return {
             "successful": successful,
-            "failed": failed,
+            "failed": len(message_ids) - successful,
             "total": len(message_ids)
         }
     
@@ -734,9 +772,5 @@ class MessageService:
         Returns:
             List of MessagePublic instances with feedback
         """
-        all_messages = self.get_chat_messages(chat_id, skip=0, limit=10000)
-        
-        if feedback_type:
-            return [msg for msg in all_messages if msg.feedback == feedback_type]
-        else:
-            return [msg for msg in all_messages if msg.feedback is not None]
+        results = self.message_repository.get_with_feedback(chat_id, feedback_type)
+        return [_msg_public_from_orm(message, model) for message, model in results]
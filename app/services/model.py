@@ -158,15 +158,11 @@ class ModelService:
         Returns:
             Updated ModelPublic instance or None if not found
         """
-        model = self.repository.get_by_id(model_id)
+        # Falls back to an uncached lookup when the model is missing or already enabled
+        model = self.repository.set_enabled(model_id, True) or self.repository.get_fresh_by_id(model_id)
         if not model:
             return None
-        
-        if model.is_enabled:
-            # Already enabled, just return it
-            return ModelPublic.model_validate(model)
-        
-        return self.toggle_model_enabled(model_id)
+        return ModelPublic.model_validate(model)
     
     def disable_model(self, model_id: UUID) -> Optional[ModelPublic]:
         """
@@ -178,15 +174,11 @@ class ModelService:
         Returns:
             Updated ModelPublic instance or None if not found
         """
-        model = self.repository.get_by_id(model_id)
+        # Falls back to an uncached lookup when the model is missing or already disabled
+        model = self.repository.set_enabled(model_id, False) or self.repository.get_fresh_by_id(model_id)
         if not model:
             return None
-        
-        if not model.is_enabled:
-            # Already disabled, just return it
-            return ModelPublic.model_validate(model)
-        
-        return self.toggle_model_enabled(model_id)
+        return ModelPublic.model_validate(model)
     
     def count_models(self, enabled_only: bool = False) -> int:
         """
@@ -220,6 +212,4 @@ class ModelService:
         Returns:
             List of unique provider names
         """
-        models = self.repository.get_all()
-        providers = {model.provider for model in models}
-        return sorted(list(providers))
+        return self.repository.get_distinct_providers()
@@ -10,14 +10,22 @@ Tests cover:
 - Error handling
 """
 
+import asyncio
+import threading
+import time
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from time import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
+from cachetools import TTLCache
+from fakeredis import FakeAsyncRedis
+from redis.exceptions import RedisError
 from fastapi import HTTPException
 from clerk_backend_api.models import Session as ClerkSession
 
+from app.api import auth
 from app.api.auth import (
     get_clerk_client,
+    close_clerk_client,
     _get_cached_session,
     _cache_session,
     invalidate_session_cache,
@@ -30,38 +38,116 @@ pytestmark = pytest.mark.anyio(backends=["asyncio"])
 
 
 @pytest.fixture(autouse=True)
-def clear_cache():
-    """Clear the session cache before each test."""
-    _session_cache.clear()
-    yield
-    _session_cache.clear()
+def isolated_cache(monkeypatch):
+    """Give each test fresh session and rejection caches configured like the real ones."""
+    cache = TTLCache(
+        maxsize=auth.settings.AUTH_CACHE_MAX_SIZE,
+        ttl=auth.settings.AUTH_CACHE_TTL,
+        timer=time.monotonic,
+    )
+    monkeypatch.setattr(auth, "_session_cache", cache)
+    monkeypatch.setattr(auth, "_negative_cache", TTLCache(
+        maxsize=auth.settings.AUTH_NEGATIVE_CACHE_MAX_SIZE,
+        ttl=auth.settings.AUTH_NEGATIVE_CACHE_TTL,
+        timer=time.monotonic,
+    ))
+    return cache
+
+
+class FakeClock:
+    """Manually advanced timer for driving cache expiry in tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
 
 
 @pytest.fixture
-def mock_clerk_session():
-    """Create a mock Clerk session object."""
-    session = Mock(spec=ClerkSession)
-    session.id = "sess_123456789"
-    session.user_id = "user_abc123def456"
-    session.status = "active"
-    session.client_id = "client_xyz"
-    return session
+def clock():
+    """Provide a fake clock for cache expiry."""
+    return FakeClock()
+
+
+@pytest.fixture
+def make_cache(monkeypatch, clock):
+    """
+    Replace the session cache with one of the given size and TTL driven by the fake clock.
+    """
+    def _make_cache(maxsize: int = 1000, ttl: float = 300) -> TTLCache:
+        cache = TTLCache(maxsize=maxsize, ttl=ttl, timer=clock)
+        monkeypatch.setattr(auth, "_session_cache", cache)
+        return cache
+    return _make_cache
+
+
+@pytest.fixture
+def mock_clerk_factory():
+    """
+    Build a mock Clerk client with a mocked sessions API.
+    """
+    def _make(get_return=None, get_side_effect=None):
+        mock_clerk = MagicMock()
+        mock_sessions = Mock()
+        if get_side_effect is not None:
+            mock_sessions.get.side_effect = get_side_effect
+        else:
+            mock_sessions.get.return_value = get_return
+        mock_clerk.sessions = mock_sessions
+        return mock_clerk, mock_sessions
+    return _make
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Enable the shared session cache backed by an in-memory fake Redis."""
+    client = FakeAsyncRedis()
+    monkeypatch.setattr(auth, "redis_client", client)
+    return client
+
+
+@pytest.fixture
+def clerk_session():
+    """Create a real (serializable) Clerk session object."""
+    return ClerkSession(
+        object="session",
+        id="sess_shared",
+        user_id="user_shared",
+        client_id="client_xyz",
+        status="active",
+        last_active_at=0,
+        expire_at=0,
+        abandon_at=0,
+        updated_at=0,
+        created_at=0,
+    )
 
 
 @pytest.fixture
 def mock_inactive_session():
     """Create a mock inactive Clerk session."""
-    session = Mock(spec=ClerkSession)
-    session.id = "sess_inactive"
-    session.user_id = "user_inactive"
-    session.status = "expired"
-    session.client_id = "client_xyz"
-    return session
+    return SimpleNamespace(
+        id="sess_inactive",
+        user_id="user_inactive",
+        status="expired",
+        client_id="client_xyz",
+    )
 
 
 class TestGetClerkClient:
     """Tests for get_clerk_client function."""
 
+    @pytest.fixture(autouse=True)
+    def clear_clerk_client(self):
+        """Forget the shared Clerk client so each test builds its own."""
+        get_clerk_client.cache_clear()
+        yield
+        get_clerk_client.cache_clear()
+
     @patch("app.api.auth.Clerk")
     @patch("app.api.auth.settings")
     def test_creates_clerk_client_with_secret_key(self, mock_settings, mock_clerk):
@@ -86,6 +172,75 @@ class TestGetClerkClient:
         assert result == mock_client
 
 
+    @patch("app.api.auth.Clerk")
+    def test_reuses_client_across_calls(self, mock_clerk):
+        """Test that the Clerk client is built once and then shared."""
+        first = get_clerk_client()
+        second = get_clerk_client()
+        
+        mock_clerk.assert_called_once()
+        assert first is second
+
+    @patch("app.api.auth.Clerk")
+    def test_close_clerk_client_closes_and_forgets_client(self, mock_clerk):
+        """Test that closing the shared client releases it and a new one is built next time."""
+        get_clerk_client()
+        
+        close_clerk_client()
+        get_clerk_client()
+        
+        mock_clerk.return_value.__exit__.assert_called_once_with(None, None, None)
+        assert mock_clerk.call_count == 2
+
+    def test_close_clerk_client_without_client_is_noop(self):
+        """Test that closing before any client was built doesn't create one."""
+        with patch("app.api.auth.Clerk") as mock_clerk:
+            close_clerk_client()
+        
+        mock_clerk.assert_not_called()
+
+
+class TestRedisClient:
+    """Tests for the shared-cache Redis client."""
+
+    def test_create_redis_client_disabled_without_url(self, monkeypatch):
+        """Test that no client is built when REDIS_URL is unset."""
+        monkeypatch.setattr(auth.settings, "REDIS_URL", None)
+        
+        assert auth._create_redis_client() is None
+
+    def test_create_redis_client_sets_timeouts(self, monkeypatch):
+        """Test that the client is built with the configured socket timeouts."""
+        monkeypatch.setattr(auth.settings, "REDIS_URL", "redis://localhost:6379/0")
+        
+        with patch("app.api.auth.Redis") as mock_redis:
+            auth._create_redis_client()
+        
+        mock_redis.from_url.assert_called_once_with(
+            "redis://localhost:6379/0",
+            socket_timeout=auth.settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=auth.settings.REDIS_CONNECT_TIMEOUT,
+        )
+
+    @pytest.mark.anyio
+    async def test_close_redis_client_closes_pool(self, monkeypatch):
+        """Test that closing releases the client's connections."""
+        client = Mock()
+        client.aclose = AsyncMock()
+        monkeypatch.setattr(auth, "redis_client", client)
+        
+        await auth.close_redis_client()
+        
+        client.aclose.assert_awaited_once()
+
+    @pytest.mark.anyio
+    async def test_close_redis_client_without_redis_is_noop(self, monkeypatch):
+        """Test that closing is safe when Redis is disabled."""
+        monkeypatch.setattr(auth, "redis_client", None)
+        
+        await auth.close_redis_client()
+
+
 class TestSessionCaching:
     """Tests for session caching functions."""
 
@@ -94,30 +249,35 @@ class TestSessionCaching:
         result = _get_cached_session("nonexistent_session")
         assert result is None
 
-    def test_cache_session_stores_session(self, mock_clerk_session):
-        """Test that caching stores session with expiry."""
+    def test_cache_session_stores_session(self, isolated_cache, mock_clerk_session):
+        """Test that caching stores the session."""
         session_id = "sess_test"
         
         _cache_session(session_id, mock_clerk_session)
         
-        assert session_id in _session_cache
-        cached_session, expiry = _session_cache[session_id]
-        assert cached_session == mock_clerk_session
-        assert expiry > time()
+        assert session_id in isolated_cache
+        assert isolated_cache[session_id] == mock_clerk_session
 
-    @patch("app.api.auth.settings")
-    def test_cache_session_respects_ttl(self, mock_settings, mock_clerk_session):
-        """Test that cache respects configured TTL."""
-        mock_settings.AUTH_CACHE_TTL = 300
-        mock_settings.AUTH_CACHE_MAX_SIZE = 1000
+    def test_cache_uses_configured_size_and_ttl(self):
+        """Test that the module's cache is built from the auth settings."""
+        assert _session_cache.maxsize == auth.settings.AUTH_CACHE_MAX_SIZE
+        assert _session_cache.ttl == auth.settings.AUTH_CACHE_TTL
+
+    def test_cache_session_respects_ttl(self, make_cache, clock, mock_clerk_session):
+        """Test that cached sessions live exactly for the TTL."""
+        make_cache(ttl=300)
         session_id = "sess_ttl_test"
-        current_time = time()
         
-        with patch("app.api.auth.time", return_value=current_time):
-            _cache_session(session_id, mock_clerk_session)
+        _cache_session(session_id, mock_clerk_session)
         
-        _, expiry = _session_cache[session_id]
-        assert abs(expiry - (current_time + 300)) < 1  # Allow small time drift
+        clock.advance(299)
+        assert _get_cached_session(session_id) == mock_clerk_session
+        clock.advance(1)
+        assert _get_cached_session(session_id) is None
+
+    def test_cache_uses_monotonic_clock(self):
+        """Test that the module's cache measures expiry on the monotonic clock, not wall time."""
+        assert abs(_session_cache.timer() - time.monotonic()) < 1
 
     def test_get_cached_session_returns_valid_session(self, mock_clerk_session):
         """Test retrieving a valid cached session."""
@@ -128,78 +288,97 @@ class TestSessionCaching:
         
         assert result == mock_clerk_session
 
-    def test_get_cached_session_removes_expired_session(self, mock_clerk_session):
+    def test_get_cached_session_removes_expired_session(self, make_cache, clock, mock_clerk_session):
         """Test that expired sessions are removed from cache."""
+        cache = make_cache(ttl=300)
         session_id = "sess_expired"
-        # Cache with expired timestamp
-        _session_cache[session_id] = (mock_clerk_session, time() - 100)
+        _cache_session(session_id, mock_clerk_session)
         
+        clock.advance(400)
         result = _get_cached_session(session_id)
+        cache.expire()
         
         assert result is None
-        assert session_id not in _session_cache
+        assert session_id not in cache
+        assert cache.currsize == 0
 
-    @patch("app.api.auth.settings")
-    def test_cache_implements_lru_eviction(self, mock_settings, mock_clerk_session):
+    def test_cache_implements_lru_eviction(self, make_cache, mock_clerk_session):
         """Test that cache evicts oldest entry when max size is reached."""
-        mock_settings.AUTH_CACHE_MAX_SIZE = 3
-        mock_settings.AUTH_CACHE_TTL = 300
+        cache = make_cache(maxsize=3)
         
         # Fill cache to max
         _cache_session("sess_1", mock_clerk_session)
         _cache_session("sess_2", mock_clerk_session)
         _cache_session("sess_3", mock_clerk_session)
         
-        assert len(_session_cache) == 3
-        assert "sess_1" in _session_cache
+        assert len(cache) == 3
+        assert "sess_1" in cache
         
         # Add one more, should evict sess_1
         _cache_session("sess_4", mock_clerk_session)
         
-        assert len(_session_cache) == 3
-        assert "sess_1" not in _session_cache
-        assert "sess_2" in _session_cache
-        assert "sess_3" in _session_cache
-        assert "sess_4" in _session_cache
+        assert len(cache) == 3
+        assert "sess_1" not in cache
+        assert "sess_2" in cache
+        assert "sess_3" in cache
+        assert "sess_4" in cache
 
-    @patch("app.api.auth.settings")
-    def test_cache_lru_updates_access_order(self, mock_settings, mock_clerk_session):
+    def test_cache_lru_updates_access_order(self, make_cache, mock_clerk_session):
         """Test that accessing a cached item updates its position (proper LRU)."""
-        mock_settings.AUTH_CACHE_MAX_SIZE = 3
-        mock_settings.AUTH_CACHE_TTL = 300
+        cache = make_cache(maxsize=3)
         
         # Fill cache to max
         _cache_session("sess_1", mock_clerk_session)
         _cache_session("sess_2", mock_clerk_session)
         _cache_session("sess_3", mock_clerk_session)
         
-        # Access sess_1 to move it to the end (most recently used)
+        # Access sess_1 to mark it as most recently used
         result = _get_cached_session("sess_1")
         assert result == mock_clerk_session
         
         # Add a new session - should evict sess_2 (now the least recently used)
         _cache_session("sess_4", mock_clerk_session)
         
-        assert len(_session_cache) == 3
-        assert "sess_1" in _session_cache  # Should still be present (was accessed)
-        assert "sess_2" not in _session_cache  # Should be evicted (least recently used)
-        assert "sess_3" in _session_cache
-        assert "sess_4" in _session_cache
+        assert len(cache) == 3
+        assert "sess_1" in cache  # Should still be present (was accessed)
+        assert "sess_2" not in cache  # Should be evicted (least recently used)
+        assert "sess_3" in cache
+        assert "sess_4" in cache
+
+    def test_recaching_existing_session_does_not_evict(self, make_cache, mock_clerk_session):
+        """Test that refreshing a cached session at capacity keeps the other entries."""
+        cache = make_cache(maxsize=3)
+        
+        _cache_session("sess_1", mock_clerk_session)
+        _cache_session("sess_2", mock_clerk_session)
+        _cache_session("sess_3", mock_clerk_session)
+        
+        # Re-cache sess_1 while full - nothing should be evicted
+        _cache_session("sess_1", mock_clerk_session)
+        
+        assert set(cache) == {"sess_1", "sess_2", "sess_3"}
+        
+        # sess_2 is now the least recently used
+        _cache_session("sess_4", mock_clerk_session)
+        
+        assert set(cache) == {"sess_1", "sess_3", "sess_4"}
 
-    def test_invalidate_session_cache_removes_session(self, mock_clerk_session):
+    @pytest.mark.anyio
+    async def test_invalidate_session_cache_removes_session(self, isolated_cache, mock_clerk_session):
         """Test that invalidation removes session from cache."""
         session_id = "sess_to_invalidate"
         _cache_session(session_id, mock_clerk_session)
-        assert session_id in _session_cache
+        assert session_id in isolated_cache
         
-        invalidate_session_cache(session_id)
+        await invalidate_session_cache(session_id)
         
-        assert session_id not in _session_cache
+        assert session_id not in isolated_cache
 
-    def test_invalidate_session_cache_handles_nonexistent_session(self):
+    @pytest.mark.anyio
+    async def test_invalidate_session_cache_handles_nonexistent_session(self):
         """Test that invalidating nonexistent session doesn't raise error."""
         try:
-            invalidate_session_cache("nonexistent_session")
+            await invalidate_session_cache("nonexistent_session")
         except Exception as e:
             pytest.fail(f"Should not raise exception: {e}")
 
@@ -230,16 +409,10 @@ class TestVerifyClerkSession:
         assert result == mock_clerk_session
 
     @pytest.mark.anyio
-    async def test_verifies_session_with_clerk_when_not_cached(self, mock_clerk_session):
+    async def test_verifies_session_with_clerk_when_not_cached(self, mock_clerk_factory, mock_clerk_session):
         """Test that session is verified with Clerk when not in cache."""
         session_id = "sess_new"
-        mock_clerk = MagicMock()
-        mock_sessions = Mock()
-        mock_sessions.get.return_value = mock_clerk_session
-        # Set up context manager behavior
-        mock_clerk.__enter__ = Mock(return_value=mock_clerk)
-        mock_clerk.__exit__ = Mock(return_value=False)
-        mock_clerk.sessions = mock_sessions
+        mock_clerk, mock_sessions = mock_clerk_factory(get_return=mock_clerk_session)
         
         with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
             result = await verify_clerk_session(session_id=session_id)
@@ -248,16 +421,10 @@ class TestVerifyClerkSession:
         assert result == mock_clerk_session
 
     @pytest.mark.anyio
-    async def test_caches_verified_session(self, mock_clerk_session):
+    async def test_caches_verified_session(self, mock_clerk_factory, mock_clerk_session):
         """Test that successfully verified session is cached."""
         session_id = "sess_to_cache"
-        mock_clerk = MagicMock()
-        mock_sessions = Mock()
-        mock_sessions.get.return_value = mock_clerk_session
-        # Set up context manager behavior
-        mock_clerk.__enter__ = Mock(return_value=mock_clerk)
-        mock_clerk.__exit__ = Mock(return_value=False)
-        mock_clerk.sessions = mock_sessions
+        mock_clerk, _ = mock_clerk_factory(get_return=mock_clerk_session)
         
         with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
             await verify_clerk_session(session_id=session_id)
@@ -267,16 +434,25 @@ class TestVerifyClerkSession:
         assert cached == mock_clerk_session
 
     @pytest.mark.anyio
-    async def test_invalid_session_raises_unauthorized(self):
+    async def test_cache_miss_makes_one_thread_hop(self, mock_clerk_factory, mock_clerk_session):
+        """Test that all Clerk work for a cache miss happens in a single worker-thread call on the shared client."""
+        session_id = "sess_one_hop"
+        mock_clerk, _ = mock_clerk_factory(get_return=mock_clerk_session)
+        
+        with patch("app.api.auth.get_clerk_client", return_value=mock_clerk) as mock_get_client:
+            with patch("app.api.auth.asyncio.to_thread", wraps=asyncio.to_thread) as mock_to_thread:
+                await verify_clerk_session(session_id=session_id)
+        
+        mock_to_thread.assert_called_once()
+        mock_get_client.assert_called_once()
+        # The shared client stays open for later requests
+        mock_clerk.__exit__.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_invalid_session_raises_unauthorized(self, mock_clerk_factory):
         """Test that invalid session (None) raises 401."""
         session_id = "sess_invalid"
-        mock_clerk = MagicMock()
-        mock_sessions = Mock()
-        mock_sessions.get.return_value = None  # Invalid session
-        # Set up context manager behavior
-        mock_clerk.__enter__ = Mock(return_value=mock_clerk)
-        mock_clerk.__exit__ = Mock(return_value=False)
-        mock_clerk.sessions = mock_sessions
+        mock_clerk, _ = mock_clerk_factory(get_return=None)  # Invalid session
         
         with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
             with pytest.raises(HTTPException) as exc_info:
@@ -286,16 +462,10 @@ class TestVerifyClerkSession:
         assert "Invalid session" in exc_info.value.detail
 
     @pytest.mark.anyio
-    async def test_inactive_session_raises_unauthorized(self, mock_inactive_session):
+    async def test_inactive_session_raises_unauthorized(self, mock_clerk_factory, mock_inactive_session):
         """Test that inactive session raises 401."""
         session_id = "sess_inactive"
-        mock_clerk = MagicMock()
-        mock_sessions = Mock()
-        mock_sessions.get.return_value = mock_inactive_session
-        # Set up context manager behavior
-        mock_clerk.__enter__ = Mock(return_value=mock_clerk)
-        mock_clerk.__exit__ = Mock(return_value=False)
-        mock_clerk.sessions = mock_sessions
+        mock_clerk, _ = mock_clerk_factory(get_return=mock_inactive_session)
         
         with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
             with pytest.raises(HTTPException) as exc_info:
@@ -306,16 +476,10 @@ class TestVerifyClerkSession:
         assert "expired" in exc_info.value.detail
 
     @pytest.mark.anyio
-    async def test_clerk_api_error_raises_unauthorized(self):
+    async def test_clerk_api_error_raises_unauthorized(self, mock_clerk_factory):
         """Test that Clerk API errors are caught and raise 401."""
         session_id = "sess_error"
-        mock_clerk = MagicMock()
-        mock_sessions = Mock()
-        mock_sessions.get.side_effect = Exception("Clerk API Error")
-        # Set up context manager behavior
-        mock_clerk.__enter__ = Mock(return_value=mock_clerk)
-        mock_clerk.__exit__ = Mock(return_value=False)
-        mock_clerk.sessions = mock_sessions
+        mock_clerk, _ = mock_clerk_factory(get_side_effect=Exception("Clerk API Error"))
         
         with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
             with pytest.raises(HTTPException) as exc_info:
@@ -326,19 +490,13 @@ class TestVerifyClerkSession:
         assert "Clerk API Error" in exc_info.value.detail
 
     @pytest.mark.anyio
-    async def test_http_exception_is_reraised(self):
+    async def test_http_exception_is_reraised(self, mock_clerk_factory):
         """Test that HTTPException from verification is re-raised as-is."""
         session_id = "sess_http_error"
-        mock_clerk = MagicMock()
-        mock_sessions = Mock()
         
         # Simulate HTTPException being raised
         original_exception = HTTPException(status_code=403, detail="Forbidden")
-        mock_sessions.get.side_effect = original_exception
-        # Set up context manager behavior
-        mock_clerk.__enter__ = Mock(return_value=mock_clerk)
-        mock_clerk.__exit__ = Mock(return_value=False)
-        mock_clerk.sessions = mock_sessions
+        mock_clerk, _ = mock_clerk_factory(get_side_effect=original_exception)
         
         with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
             with pytest.raises(HTTPException) as exc_info:
@@ -349,62 +507,44 @@ class TestVerifyClerkSession:
         assert exc_info.value.detail == "Forbidden"
 
     @pytest.mark.anyio
-    async def test_does_not_cache_invalid_session(self):
-        """Test that invalid sessions are not cached."""
+    async def test_does_not_cache_invalid_session(self, isolated_cache, mock_clerk_factory):
+        """Test that invalid sessions are not cached and are briefly rejected without Clerk."""
         session_id = "sess_not_to_cache"
-        mock_clerk = MagicMock()
-        mock_sessions = Mock()
-        mock_sessions.get.return_value = None
-        # Set up context manager behavior
-        mock_clerk.__enter__ = Mock(return_value=mock_clerk)
-        mock_clerk.__exit__ = Mock(return_value=False)
-        mock_clerk.sessions = mock_sessions
+        mock_clerk, mock_sessions = mock_clerk_factory(get_return=None)
         
         with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
-            try:
-                await verify_clerk_session(session_id=session_id)
-            except HTTPException:
-                pass
+            for _ in range(2):
+                with pytest.raises(HTTPException):
+                    await verify_clerk_session(session_id=session_id)
         
-        # Session should not be cached
-        assert session_id not in _session_cache
+        # Session should not be cached, but the rejection should be
+        assert session_id not in isolated_cache
+        assert mock_sessions.get.call_count == 1
 
     @pytest.mark.anyio
-    async def test_does_not_cache_inactive_session(self, mock_inactive_session):
-        """Test that inactive sessions are not cached."""
+    async def test_does_not_cache_inactive_session(self, isolated_cache, mock_clerk_factory, mock_inactive_session):
+        """Test that inactive sessions are not cached and are briefly rejected without Clerk."""
         session_id = "sess_inactive_not_cached"
-        mock_clerk = MagicMock()
-        mock_sessions = Mock()
-        mock_sessions.get.return_value = mock_inactive_session
-        # Set up context manager behavior
-        mock_clerk.__enter__ = Mock(return_value=mock_clerk)
-        mock_clerk.__exit__ = Mock(return_value=False)
-        mock_clerk.sessions = mock_sessions
+        mock_clerk, mock_sessions = mock_clerk_factory(get_return=mock_inactive_session)
         
         with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
-            try:
-                await verify_clerk_session(session_id=session_id)
-            except HTTPException:
-                pass
+            for _ in range(2):
+                with pytest.raises(HTTPException):
+                    await verify_clerk_session(session_id=session_id)
         
-        # Session should not be cached
-        assert session_id not in _session_cache
+        # Session should not be cached, but the rejection should be
+        assert session_id not in isolated_cache
+        assert mock_sessions.get.call_count == 1
 
 
 class TestCacheIntegration:
     """Integration tests for cache behavior."""
 
     @pytest.mark.anyio
-    async def test_multiple_calls_use_cache(self, mock_clerk_session):
+    async def test_multiple_calls_use_cache(self, mock_clerk_factory, mock_clerk_session):
         """Test that multiple calls to verify use cache after first call."""
         session_id = "sess_multi"
-        mock_clerk = MagicMock()
-        mock_sessions = Mock()
-        mock_sessions.get.return_value = mock_clerk_session
-        # Set up context manager behavior
-        mock_clerk.__enter__ = Mock(return_value=mock_clerk)
-        mock_clerk.__exit__ = Mock(return_value=False)
-        mock_clerk.sessions = mock_sessions
+        mock_clerk, mock_sessions = mock_clerk_factory(get_return=mock_clerk_session)
         
         with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
             # First call - should hit API
@@ -419,29 +559,21 @@ class TestCacheIntegration:
         assert result1 == result2 == result3 == mock_clerk_session
 
     @pytest.mark.anyio
-    @patch("app.api.auth.settings")
     async def test_expired_cache_triggers_revalidation(
-        self, mock_settings, mock_clerk_session
+        self, mock_clerk_factory, make_cache, clock, mock_clerk_session
     ):
         """Test that expired cache entry triggers new API call."""
-        mock_settings.AUTH_CACHE_TTL = 1  # 1 second TTL
-        mock_settings.AUTH_CACHE_MAX_SIZE = 1000
+        make_cache(ttl=1)  # 1 second TTL
         session_id = "sess_expire_test"
         
-        mock_clerk = MagicMock()
-        mock_sessions = Mock()
-        mock_sessions.get.return_value = mock_clerk_session
-        # Set up context manager behavior
-        mock_clerk.__enter__ = Mock(return_value=mock_clerk)
-        mock_clerk.__exit__ = Mock(return_value=False)
-        mock_clerk.sessions = mock_sessions
+        mock_clerk, mock_sessions = mock_clerk_factory(get_return=mock_clerk_session)
         
         with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
             # First call
             await verify_clerk_session(session_id=session_id)
             
-            # Manually expire the cache entry
-            _session_cache[session_id] = (mock_clerk_session, time() - 100)
+            # Let the cache entry expire
+            clock.advance(2)
             
             # Second call should trigger new API call
             await verify_clerk_session(session_id=session_id)
@@ -449,18 +581,234 @@ class TestCacheIntegration:
         # Should have been called twice
         assert mock_sessions.get.call_count == 2
 
-    def test_cache_cleanup_on_expiry_check(self, mock_clerk_session):
-        """Test that expired entries are cleaned up when checked."""
-        # Add multiple expired entries
+    def test_cache_cleanup_on_expiry_check(self, make_cache, clock, mock_clerk_session):
+        """Test that expired entries are cleaned up without being accessed."""
+        cache = make_cache(ttl=300)
         for i in range(5):
-            session_id = f"sess_expired_{i}"
-            _session_cache[session_id] = (mock_clerk_session, time() - 100)
+            _cache_session(f"sess_expired_{i}", mock_clerk_session)
         
-        assert len(_session_cache) == 5
+        assert cache.currsize == 5
         
-        # Check each one - should remove as we go
-        for i in range(5):
-            result = _get_cached_session(f"sess_expired_{i}")
-            assert result is None
+        clock.advance(400)
+        # Any write sweeps expired entries
+        _cache_session("sess_fresh", mock_clerk_session)
+        
+        assert cache.currsize == 1
+        assert all(_get_cached_session(f"sess_expired_{i}") is None for i in range(5))
+
+    def test_bulk_expiry_sweep_on_insert(self, make_cache, clock, mock_clerk_session):
+        """Test that one insert sweeps every expired entry but keeps refreshed ones."""
+        cache = make_cache(maxsize=1000, ttl=300)
+        for i in range(100):
+            _cache_session(f"sess_stale_{i}", mock_clerk_session)
+        
+        # Re-cache one entry halfway through its TTL, giving it a later expiry
+        clock.advance(200)
+        _cache_session("sess_stale_0", mock_clerk_session)
+        
+        clock.advance(150)
+        _cache_session("sess_fresh", mock_clerk_session)
+        
+        assert set(cache) == {"sess_stale_0", "sess_fresh"}
+        assert cache.currsize == 2
+
+    def test_concurrent_cache_safety(self, make_cache, mock_clerk_session):
+        """Test that many threads reading and writing overlapping keys don't corrupt the cache."""
+        cache = make_cache(maxsize=50)
+        errors = []
+        
+        def hammer(worker: int):
+            try:
+                for i in range(500):
+                    session_id = f"sess_{(worker + i) % 80}"
+                    _cache_session(session_id, mock_clerk_session)
+                    _get_cached_session(session_id)
+                    if i % 7 == 0:
+                        auth._evict_local_session(session_id)
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=hammer, args=(n,)) for n in range(32)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert errors == []
+        assert len(cache) <= 50
+
+    @pytest.mark.anyio
+    async def test_single_flight_coalesces_concurrent_verifies(self, mock_clerk_factory, mock_clerk_session):
+        """Test that concurrent verifies of an uncached session share one Clerk call."""
+        session_id = "sess_burst"
+        release = threading.Event()
+        
+        def slow_get(session_id):
+            release.wait(timeout=5)
+            return mock_clerk_session
+        
+        mock_clerk, mock_sessions = mock_clerk_factory(get_side_effect=slow_get)
+        
+        with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
+            pending = asyncio.gather(
+                *(verify_clerk_session(session_id=session_id) for _ in range(10))
+            )
+            # Let every request reach the in-flight Clerk call before it returns
+            await asyncio.sleep(0.05)
+            release.set()
+            results = await pending
+        
+        assert mock_sessions.get.call_count == 1
+        assert all(result == mock_clerk_session for result in results)
+        assert auth._inflight_verifications == {}
+
+    @pytest.mark.anyio
+    async def test_single_flight_shares_failures(self, mock_clerk_factory):
+        """Test that a failed Clerk call is reported to every waiting request and not retained."""
+        session_id = "sess_burst_invalid"
+        mock_clerk, mock_sessions = mock_clerk_factory(get_return=None)
+        
+        with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
+            results = await asyncio.gather(
+                *(verify_clerk_session(session_id=session_id) for _ in range(5)),
+                return_exceptions=True,
+            )
+        
+        assert mock_sessions.get.call_count == 1
+        assert all(isinstance(result, HTTPException) for result in results)
+        assert all(result.status_code == 401 for result in results)
+        assert auth._inflight_verifications == {}
+
+    @pytest.mark.anyio
+    async def test_rejection_expires_after_negative_ttl(
+        self, mock_clerk_factory, monkeypatch, clock, mock_clerk_session
+    ):
+        """Test that a rejected session is checked with Clerk again once the rejection expires."""
+        monkeypatch.setattr(auth, "_negative_cache", TTLCache(maxsize=10, ttl=5, timer=clock))
+        session_id = "sess_reactivated"
+        mock_clerk, mock_sessions = mock_clerk_factory(get_side_effect=[None, mock_clerk_session])
+        
+        with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
+            with pytest.raises(HTTPException) as exc_info:
+                await verify_clerk_session(session_id=session_id)
+            assert exc_info.value.detail == "Invalid session"
+            
+            # Still rejected from the cache within the negative TTL
+            clock.advance(4)
+            with pytest.raises(HTTPException):
+                await verify_clerk_session(session_id=session_id)
+            
+            clock.advance(1)
+            result = await verify_clerk_session(session_id=session_id)
+        
+        assert result == mock_clerk_session
+        assert mock_sessions.get.call_count == 2
+
+    @pytest.mark.anyio
+    async def test_clerk_errors_are_not_negatively_cached(self, mock_clerk_factory, mock_clerk_session):
+        """Test that a transient Clerk failure doesn't block the next attempt."""
+        session_id = "sess_transient"
+        mock_clerk, _ = mock_clerk_factory(
+            get_side_effect=[Exception("Clerk API Error"), mock_clerk_session]
+        )
+        
+        with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
+            with pytest.raises(HTTPException):
+                await verify_clerk_session(session_id=session_id)
+            result = await verify_clerk_session(session_id=session_id)
+        
+        assert result == mock_clerk_session
+
+    @pytest.mark.anyio
+    async def test_invalidate_clears_cached_rejection(self):
+        """Test that invalidation also drops a cached rejection."""
+        auth._reject_session("sess_rejected", "Invalid session")
+        
+        await invalidate_session_cache("sess_rejected")
+        
+        assert auth._get_cached_rejection("sess_rejected") is None
+
+    @pytest.mark.anyio
+    async def test_second_worker_uses_redis_instead_of_clerk(
+        self, isolated_cache, mock_clerk_factory, fake_redis, clerk_session
+    ):
+        """Test that a session verified by one worker is served from Redis to another."""
+        session_id = clerk_session.id
+        mock_clerk, mock_sessions = mock_clerk_factory(get_return=clerk_session)
+        
+        with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
+            # First worker verifies with Clerk
+            await verify_clerk_session(session_id=session_id)
+            
+            # Second worker starts with an empty in-process cache
+            isolated_cache.clear()
+            result = await verify_clerk_session(session_id=session_id)
+        
+        assert mock_sessions.get.call_count == 1
+        assert result == clerk_session
+        # The Redis hit isn't copied locally, so it can't outlive the Redis TTL
+        assert _get_cached_session(session_id) is None
+        assert await fake_redis.ttl(f"auth:session:{session_id}") > 0
+
+    @pytest.mark.anyio
+    async def test_invalidate_deletes_session_from_redis(
+        self, isolated_cache, mock_clerk_factory, fake_redis, clerk_session
+    ):
+        """Test that an invalidated session is verified with Clerk again, not restored from Redis."""
+        session_id = clerk_session.id
+        mock_clerk, mock_sessions = mock_clerk_factory(get_return=clerk_session)
+        
+        with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
+            await verify_clerk_session(session_id=session_id)
+            
+            await invalidate_session_cache(session_id)
+            assert await fake_redis.exists(f"auth:session:{session_id}") == 0
+            
+            await verify_clerk_session(session_id=session_id)
+        
+        assert mock_sessions.get.call_count == 2
+
+    @pytest.mark.anyio
+    async def test_invalidate_survives_redis_errors(self, isolated_cache, monkeypatch, mock_clerk_session):
+        """Test that an unavailable Redis doesn't stop the local caches from being cleared."""
+        broken_redis = Mock()
+        broken_redis.delete = AsyncMock(side_effect=RedisError("connection refused"))
+        monkeypatch.setattr(auth, "redis_client", broken_redis)
+        _cache_session("sess_local", mock_clerk_session)
+        
+        await invalidate_session_cache("sess_local")
+        
+        assert "sess_local" not in isolated_cache
+        broken_redis.delete.assert_awaited_once_with("auth:session:sess_local")
+
+    @pytest.mark.anyio
+    async def test_unreadable_redis_payload_is_discarded(self, mock_clerk_factory, fake_redis, clerk_session):
+        """Test that a payload that doesn't parse is deleted and verified with Clerk instead."""
+        session_id = clerk_session.id
+        await fake_redis.set(f"auth:session:{session_id}", b'{"id": "sess_shared"}')
+        mock_clerk, mock_sessions = mock_clerk_factory(get_return=clerk_session)
+        
+        with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
+            assert await auth._redis_get_session(session_id) is None
+            assert await fake_redis.exists(f"auth:session:{session_id}") == 0
+            
+            result = await verify_clerk_session(session_id=session_id)
+        
+        assert result == clerk_session
+        assert mock_sessions.get.call_count == 1
+
+    @pytest.mark.anyio
+    async def test_redis_errors_fall_back_to_clerk(self, mock_clerk_factory, monkeypatch, clerk_session):
+        """Test that an unavailable Redis doesn't break authentication."""
+        broken_redis = Mock()
+        broken_redis.get = AsyncMock(side_effect=RedisError("connection refused"))
+        broken_redis.set = AsyncMock(side_effect=RedisError("connection refused"))
+        monkeypatch.setattr(auth, "redis_client", broken_redis)
+        
+        mock_clerk, mock_sessions = mock_clerk_factory(get_return=clerk_session)
+        
+        with patch("app.api.auth.get_clerk_client", return_value=mock_clerk):
+            result = await verify_clerk_session(session_id=clerk_session.id)
         
-        assert len(_session_cache) == 0
+        assert result == clerk_session
+        assert mock_sessions.get.call_count == 1
\ No newline at end of file
@@ -1,41 +1,142 @@
+import httpx
+import importlib.util
 import pytest
+from decimal import Decimal
 from fastapi.testclient import TestClient
 from sqlmodel import Session, SQLModel, create_engine
+from sqlalchemy import event
 from sqlalchemy.pool import StaticPool
-from unittest.mock import Mock
+from types import SimpleNamespace
 from clerk_backend_api.models import Session as ClerkSession
 
 from app.main import app
+from app.models import Chat, Model
 from app.core.db import get_session
 from app.api.auth import verify_clerk_session
+from app.repositories.model import clear_model_cache
 
 
 @pytest.fixture(scope="session")
 def anyio_backend():
-    """Configure anyio to only use asyncio backend."""
-    return "asyncio"
+    """
+    Configure anyio to only use the asyncio backend, running on uvloop like production.
+    
+    uvloop only comes in through fastapi[standard] and isn't built for every
+    platform, so plain asyncio is used when it can't be imported.
+    """
+    if importlib.util.find_spec("uvloop") is None:
+        return "asyncio"
+    return ("asyncio", {"use_uvloop": True})
 
 
-@pytest.fixture(name="session")
-def session_fixture():
+@pytest.fixture(autouse=True)
+def clear_model_cache_fixture():
+    """
+    Reset the process-wide model cache so cached rows don't leak between tests.
+    """
+    clear_model_cache()
+    yield
+    clear_model_cache()
+
+
+@pytest.fixture(scope="session")
+def engine():
     """
-    Create a test database session using SQLite in-memory database.
+    Create one SQLite in-memory database with the schema for the whole test run.
     """
-    # Create SQLite in-memory database
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
     
+    # Let SQLAlchemy emit BEGIN/SAVEPOINT itself; pysqlite's own transaction
+    # handling otherwise breaks the savepoints tests are isolated with
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def do_begin(connection):
+        connection.exec_driver_sql("BEGIN")
+    
     # Create all tables
     SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(name="session")
+def session_fixture(engine):
+    """
+    Create a test database session inside a transaction that is rolled back after the test.
+    
+    Commits made by the code under test only release a savepoint, so every test
+    starts from an empty database without recreating the schema.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     
-    with Session(engine) as session:
-        yield session
+    yield session
     
     # Clean up
-    SQLModel.metadata.drop_all(engine)
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(name="executed_statements")
+def executed_statements_fixture(session: Session):
+    """
+    Record the SQL statements sent through the test session's connection.
+    
+    Savepoint bookkeeping from the rolled-back test transaction is left out so
+    only the statements issued by the repository are counted.
+    """
+    statements = []
+    connection = session.get_bind()
+    
+    def listener(conn, cursor, statement, *args):
+        if not statement.startswith(("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")):
+            statements.append(statement)
+    
+    event.listen(connection, "before_cursor_execute", listener)
+    yield statements
+    event.remove(connection, "before_cursor_execute", listener)
+
+
+@pytest.fixture(name="sample_model")
+def sample_model_fixture(session: Session):
+    """
+    Create a sample model in the database.
+    """
+    model = Model(
+        name="gpt-4",
+        provider="OpenAI",
+        price_per_million_tokens=Decimal("30.000000"),
+        is_enabled=True
+    )
+    session.add(model)
+    session.commit()
+    session.refresh(model)
+    return model
+
+
+@pytest.fixture(name="sample_chat")
+def sample_chat_fixture(session: Session):
+    """
+    Create a sample chat in the database owned by the mocked Clerk user.
+    """
+    chat = Chat(
+        user_id="test_user_id",
+        title="Test Chat",
+        summary="This is a test chat"
+    )
+    session.add(chat)
+    session.commit()
+    session.refresh(chat)
+    return chat
 
 
 @pytest.fixture(name="mock_clerk_session")
@@ -43,18 +144,47 @@ def mock_clerk_session_fixture():
     """
     Create a mock Clerk session for authentication bypass in tests.
     """
-    mock_session = Mock(spec=ClerkSession)
-    mock_session.id = "test_session_id"
-    mock_session.user_id = "test_user_id"
-    mock_session.status = "active"
-    mock_session.client_id = "test_client_id"
-    return mock_session
+    return SimpleNamespace(
+        id="test_session_id",
+        user_id="test_user_id",
+        status="active",
+        client_id="test_client_id",
+    )
+
+
+@pytest.fixture(scope="session")
+def app_client():
+    """
+    Create one test client for the whole test run, running the app lifespan once.
+    """
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture(name="client")
-def client_fixture(session: Session, mock_clerk_session: ClerkSession):
+def client_fixture(app_client: TestClient, session: Session, mock_clerk_session: ClerkSession):
+    """
+    Provide the shared test client with overridden database session and mocked authentication.
     """
-    Create a test client with overridden database session and mocked authentication.
+    def get_session_override():
+        return session
+    
+    async def verify_clerk_session_override():
+        return mock_clerk_session
+    
+    app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[verify_clerk_session] = verify_clerk_session_override
+    yield app_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(name="aclient")
+async def aclient_fixture(session: Session, mock_clerk_session: ClerkSession):
+    """
+    Create an async test client that calls the app in-process on the test's event loop.
+    
+    Use from async tests instead of the sync client to avoid the thread hand-off
+    TestClient makes for every request.
     """
     def get_session_override():
         return session
@@ -64,6 +194,7 @@ def client_fixture(session: Session, mock_clerk_session: ClerkSession):
     
     app.dependency_overrides[get_session] = get_session_override
     app.dependency_overrides[verify_clerk_session] = verify_clerk_session_override
-    client = TestClient(app)
-    yield client
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
     app.dependency_overrides.clear()
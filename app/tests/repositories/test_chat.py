@@ -1,9 +1,22 @@
 import pytest
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from itertools import count
 from uuid import uuid4
-from sqlmodel import Session
+from sqlmodel import Session, col, delete
 
 from app.repositories.chat import ChatRepository
-from app.models import ChatCreate, ChatUpdate
+from app.models import Chat, ChatCreate, ChatUpdate
+
+
+@lru_cache(maxsize=256)
+def _chat_create(title: str | None = None, summary: str | None = None) -> ChatCreate:
+    """
+    Build (once per distinct title/summary) the chat creation data used by these tests.
+    
+    Repositories only read ChatCreate, so instances are safely shared between tests.
+    """
+    return ChatCreate(title=title, summary=summary)
 
 
 @pytest.fixture(name="repository")
@@ -14,20 +27,22 @@ def repository_fixture(session: Session):
     return ChatRepository(session)
 
 
-@pytest.fixture(name="user_id")
+@pytest.fixture(name="user_id", scope="module")
 def user_id_fixture():
     """
     Provide a sample user ID (Clerk-style string ID).
+    
+    Shared by the whole module; every test's chats are rolled back afterwards.
     """
-    return f"user_{uuid4().hex[:24]}"
+    return "user_" + uuid4().hex[:24]
 
 
-@pytest.fixture(name="other_user_id")
+@pytest.fixture(name="other_user_id", scope="module")
 def other_user_id_fixture():
     """
     Provide a different user ID for testing authorization (Clerk-style string ID).
     """
-    return f"user_{uuid4().hex[:24]}"
+    return "user_" + uuid4().hex[:24]
 
 
 @pytest.fixture(name="sample_chat_data")
@@ -35,12 +50,106 @@ def sample_chat_data_fixture():
     """
     Provide sample chat creation data.
     """
-    return ChatCreate(
+    return _chat_create(
         title="Test Chat",
         summary="This is a test chat"
     )
 
 
+@pytest.fixture(scope="module", autouse=True)
+def warm_query_cache(engine):
+    """
+    Run every ChatRepository statement once so SQLAlchemy's compiled-SQL cache is
+    primed before the first test, making per-test timings comparable.
+    
+    Runs inside a transaction that is rolled back, leaving no data behind.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    warm_session = Session(bind=connection, join_transaction_mode="create_savepoint")
+    warm_repository = ChatRepository(warm_session)
+    warm_user_id = "user_warm_query_cache"
+    
+    chat = warm_repository.create(warm_user_id, _chat_create(title="Warm"))
+    warm_repository.bulk_create(warm_user_id, [_chat_create(title="Warm bulk")])
+    warm_repository.get_by_id(chat.id, warm_user_id)
+    warm_repository.exists(chat.id)
+    warm_repository.owner_of(chat.id)
+    warm_repository.get_existing_ids([chat.id])
+    warm_repository.get_all_by_user(warm_user_id)
+    warm_repository.get_page(warm_user_id)
+    warm_repository.update(chat.id, warm_user_id, ChatUpdate(title="Warmer"))
+    warm_repository.fingerprint(warm_user_id)
+    warm_repository.count_by_user(warm_user_id)
+    warm_repository.soft_delete(chat.id, warm_user_id)
+    warm_repository.restore(chat.id, warm_user_id)
+    warm_repository.bulk_soft_delete([chat.id], warm_user_id)
+    warm_repository.bulk_restore([chat.id], warm_user_id)
+    warm_repository.hard_delete(chat.id, warm_user_id)
+    
+    warm_session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(name="seeded_dataset", scope="module")
+def seeded_dataset_fixture(engine):
+    """
+    Commit a fixed set of chats, ten for each of ten users, once for the whole module.
+    
+    Tests must only read it. Each test's own writes are rolled back, so the seed
+    stays intact, and it is removed again when the module finishes.
+    """
+    dataset = {
+        f"user_seed_{n:02d}": [f"Seed Chat {n}-{i}" for i in range(10)]
+        for n in range(10)
+    }
+    with Session(engine) as seed_session:
+        seed_repository = ChatRepository(seed_session)
+        for seed_user_id, titles in dataset.items():
+            seed_repository.bulk_create(seed_user_id, [_chat_create(title=title) for title in titles])
+    
+    yield dataset
+    
+    with Session(engine) as seed_session:
+        seed_session.exec(delete(Chat).where(col(Chat.user_id).in_(dataset)))
+        seed_session.commit()
+
+
+@pytest.fixture(name="ticking_clock")
+def ticking_clock_fixture(monkeypatch):
+    """
+    Make the repository clock advance exactly one second per timestamp it writes.
+    """
+    start = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    seconds = count()
+    monkeypatch.setattr(
+        "app.repositories.chat._utcnow",
+        lambda: start + timedelta(seconds=next(seconds)),
+    )
+    return start
+
+
+@pytest.fixture(name="created_chat")
+def created_chat_fixture(repository: ChatRepository, user_id, sample_chat_data: ChatCreate):
+    """
+    Create a chat owned by user_id.
+    """
+    return repository.create(user_id, sample_chat_data)
+
+
+def _inaccessible_target(case: str, created_chat, user_id, other_user_id):
+    """
+    Resolve the (chat_id, user_id) pair for a parametrized not-found or wrong-user case.
+    """
+    if case == "not_found":
+        return uuid4(), user_id
+    return created_chat.id, other_user_id
+
+
+INACCESSIBLE_CASES = pytest.mark.parametrize("case", ["not_found", "wrong_user"])
+
+
 class TestChatRepositoryCreate:
     """Tests for the create method."""
     
@@ -58,7 +167,7 @@ class TestChatRepositoryCreate:
     
     def test_create_chat_without_optional_fields(self, repository: ChatRepository, user_id):
         """Test creating a chat without optional fields."""
-        chat_data = ChatCreate()
+        chat_data = _chat_create()
         
         chat = repository.create(user_id, chat_data)
         
@@ -70,7 +179,7 @@ class TestChatRepositoryCreate:
     
     def test_create_chat_with_only_title(self, repository: ChatRepository, user_id):
         """Test creating a chat with only title."""
-        chat_data = ChatCreate(title="Only Title")
+        chat_data = _chat_create(title="Only Title")
         
         chat = repository.create(user_id, chat_data)
         
@@ -79,18 +188,16 @@ class TestChatRepositoryCreate:
     
     def test_create_multiple_chats_for_same_user(self, repository: ChatRepository, user_id):
         """Test creating multiple chats for the same user."""
-        chat1_data = ChatCreate(title="Chat 1")
-        chat2_data = ChatCreate(title="Chat 2")
-        
-        chat1 = repository.create(user_id, chat1_data)
-        chat2 = repository.create(user_id, chat2_data)
+        chat1, chat2 = repository.bulk_create(
+            user_id, [_chat_create(title="Chat 1"), _chat_create(title="Chat 2")]
+        )
         
         assert chat1.id != chat2.id
         assert chat1.user_id == chat2.user_id == user_id
     
     def test_create_chats_for_different_users(self, repository: ChatRepository, user_id, other_user_id):
         """Test creating chats for different users."""
-        chat_data = ChatCreate(title="Same Title")
+        chat_data = _chat_create(title="Same Title")
         
         chat1 = repository.create(user_id, chat_data)
         chat2 = repository.create(other_user_id, chat_data)
@@ -100,44 +207,106 @@ class TestChatRepositoryCreate:
         assert chat1.id != chat2.id
 
 
+class TestChatRepositoryBulkCreate:
+    """Tests for the bulk_create method."""
+    
+    def test_bulk_create_returns_chats_in_input_order(self, repository: ChatRepository, user_id):
+        """Test that all chats are created for the user and returned in order."""
+        chats = repository.bulk_create(
+            user_id, [_chat_create(title=f"Chat {i}", summary=f"Summary {i}") for i in range(3)]
+        )
+        
+        assert [chat.title for chat in chats] == ["Chat 0", "Chat 1", "Chat 2"]
+        assert [chat.summary for chat in chats] == ["Summary 0", "Summary 1", "Summary 2"]
+        assert all(chat.user_id == user_id for chat in chats)
+        assert all(chat.is_deleted is False for chat in chats)
+        assert len({chat.id for chat in chats}) == 3
+        assert repository.count_by_user(user_id) == 3
+    
+    def test_bulk_create_with_empty_list(self, repository: ChatRepository, user_id):
+        """Test that an empty list creates nothing."""
+        assert repository.bulk_create(user_id, []) == []
+        assert repository.count_by_user(user_id) == 0
+
+
 class TestChatRepositoryGetById:
     """Tests for the get_by_id method."""
     
-    def test_get_by_id_success(self, repository: ChatRepository, user_id, sample_chat_data: ChatCreate):
+    def test_get_by_id_success(self, repository: ChatRepository, user_id, created_chat):
         """Test retrieving a chat by ID successfully."""
-        created_chat = repository.create(user_id, sample_chat_data)
-        
         retrieved_chat = repository.get_by_id(created_chat.id, user_id)
         
         assert retrieved_chat is not None
         assert retrieved_chat.id == created_chat.id
         assert retrieved_chat.title == created_chat.title
     
-    def test_get_by_id_not_found(self, repository: ChatRepository, user_id):
-        """Test retrieving a non-existent chat by ID."""
-        non_existent_id = uuid4()
+    @INACCESSIBLE_CASES
+    def test_get_by_id_inaccessible(self, repository: ChatRepository, user_id, other_user_id, created_chat, case):
+        """Test that unknown IDs and other users' chats are not retrieved."""
+        chat_id, requester_id = _inaccessible_target(case, created_chat, user_id, other_user_id)
         
-        chat = repository.get_by_id(non_existent_id, user_id)
+        chat = repository.get_by_id(chat_id, requester_id)
         
         assert chat is None
     
-    def test_get_by_id_wrong_user(self, repository: ChatRepository, user_id, other_user_id, sample_chat_data: ChatCreate):
-        """Test that a user cannot retrieve another user's chat."""
+    def test_get_by_id_deleted_chat(self, repository: ChatRepository, user_id, sample_chat_data: ChatCreate):
+        """Test that soft-deleted chats are not retrieved."""
         created_chat = repository.create(user_id, sample_chat_data)
+        repository.soft_delete(created_chat.id, user_id)
         
-        # Try to retrieve with different user_id
-        chat = repository.get_by_id(created_chat.id, other_user_id)
+        chat = repository.get_by_id(created_chat.id, user_id)
         
         assert chat is None
+
+
+class TestChatRepositoryExists:
+    """Tests for the exists method."""
     
-    def test_get_by_id_deleted_chat(self, repository: ChatRepository, user_id, sample_chat_data: ChatCreate):
-        """Test that soft-deleted chats are not retrieved."""
+    def test_exists_true(self, repository: ChatRepository, user_id, sample_chat_data: ChatCreate):
+        """Test that an existing chat is found, even once deleted."""
         created_chat = repository.create(user_id, sample_chat_data)
+        assert repository.exists(created_chat.id) is True
+        
         repository.soft_delete(created_chat.id, user_id)
+        assert repository.exists(created_chat.id) is True
+    
+    def test_exists_false(self, repository: ChatRepository):
+        """Test that a non-existent chat is not found."""
+        assert repository.exists(uuid4()) is False
+
+
+class TestChatRepositoryOwnerOf:
+    """Tests for the owner_of method."""
+    
+    def test_owner_of_success(self, repository: ChatRepository, user_id, sample_chat_data: ChatCreate):
+        """Test retrieving the owner of a chat."""
+        created_chat = repository.create(user_id, sample_chat_data)
         
-        chat = repository.get_by_id(created_chat.id, user_id)
+        assert repository.owner_of(created_chat.id) == user_id
+    
+    def test_owner_of_not_found(self, repository: ChatRepository):
+        """Test retrieving the owner of a non-existent chat."""
+        assert repository.owner_of(uuid4()) is None
+    
+    def test_owner_of_deleted_chat(self, repository: ChatRepository, user_id, sample_chat_data: ChatCreate):
+        """Test that deleted chats only have an owner when include_deleted is set."""
+        created_chat = repository.create(user_id, sample_chat_data)
+        repository.soft_delete(created_chat.id, user_id)
         
-        assert chat is None
+        assert repository.owner_of(created_chat.id) is None
+        assert repository.owner_of(created_chat.id, include_deleted=True) == user_id
+
+
+class TestChatRepositoryGetExistingIds:
+    """Tests for the get_existing_ids method."""
+    
+    def test_get_existing_ids(self, repository: ChatRepository, user_id, sample_chat_data: ChatCreate):
+        """Test that existing chats are returned, including deleted ones."""
+        chat1 = repository.create(user_id, sample_chat_data)
+        chat2 = repository.create(user_id, sample_chat_data)
+        repository.soft_delete(chat2.id, user_id)
+        
+        assert repository.get_existing_ids([chat1.id, chat2.id, uuid4()]) == {chat1.id, chat2.id}
 
 
 class TestChatRepositoryGetAllByUser:
@@ -149,23 +318,24 @@ class TestChatRepositoryGetAllByUser:
         
         assert chats == []
     
-    def test_get_all_by_user_with_chats(self, repository: ChatRepository, user_id):
-        """Test retrieving all chats for a user."""
-        chat1_data = ChatCreate(title="Chat 1")
-        chat2_data = ChatCreate(title="Chat 2")
+    def test_get_all_by_user_with_chats(self, repository: ChatRepository, user_id, executed_statements):
+        """Test retrieving all chats for a user with a single query."""
+        chat1_data = _chat_create(title="Chat 1")
+        chat2_data = _chat_create(title="Chat 2")
         
         repository.create(user_id, chat1_data)
         repository.create(user_id, chat2_data)
+        executed_statements.clear()
         
         chats = repository.get_all_by_user(user_id)
+        titles = sorted(chat.title for chat in chats)
         
-        assert len(chats) == 2
+        assert titles == ["Chat 1", "Chat 2"]
+        assert len(executed_statements) == 1
     
     def test_get_all_by_user_with_pagination(self, repository: ChatRepository, user_id):
         """Test pagination with skip and limit."""
-        for i in range(5):
-            chat_data = ChatCreate(title=f"Chat {i}")
-            repository.create(user_id, chat_data)
+        repository.bulk_create(user_id, [_chat_create(title=f"Chat {i}") for i in range(5)])
         
         # Test skip
         chats = repository.get_all_by_user(user_id, skip=2)
@@ -181,8 +351,8 @@ class TestChatRepositoryGetAllByUser:
     
     def test_get_all_by_user_excludes_deleted(self, repository: ChatRepository, user_id):
         """Test that deleted chats are excluded by default."""
-        chat1_data = ChatCreate(title="Active Chat")
-        chat2_data = ChatCreate(title="Deleted Chat")
+        chat1_data = _chat_create(title="Active Chat")
+        chat2_data = _chat_create(title="Deleted Chat")
         
         chat1 = repository.create(user_id, chat1_data)
         chat2 = repository.create(user_id, chat2_data)
@@ -192,13 +362,12 @@ class TestChatRepositoryGetAllByUser:
         
         chats = repository.get_all_by_user(user_id)
         
-        assert len(chats) == 1
-        assert chats[0].title == "Active Chat"
+        assert [chat.title for chat in chats] == ["Active Chat"]
     
     def test_get_all_by_user_include_deleted(self, repository: ChatRepository, user_id):
         """Test retrieving all chats including deleted ones."""
-        chat1_data = ChatCreate(title="Active Chat")
-        chat2_data = ChatCreate(title="Deleted Chat")
+        chat1_data = _chat_create(title="Active Chat")
+        chat2_data = _chat_create(title="Deleted Chat")
         
         chat1 = repository.create(user_id, chat1_data)
         chat2 = repository.create(user_id, chat2_data)
@@ -208,44 +377,77 @@ class TestChatRepositoryGetAllByUser:
         
         chats = repository.get_all_by_user(user_id, include_deleted=True)
         
-        assert len(chats) == 2
+        assert sorted(chat.title for chat in chats) == ["Active Chat", "Deleted Chat"]
+        assert repository.count_by_user(user_id, include_deleted=True) == len(chats)
     
-    def test_get_all_by_user_ordered_by_updated_at(self, repository: ChatRepository, user_id):
+    def test_get_all_by_user_ordered_by_updated_at(self, repository: ChatRepository, user_id, ticking_clock):
         """Test that chats are ordered by updated_at descending (newest first)."""
-        chat1 = repository.create(user_id, ChatCreate(title="First Chat"))
-        chat2 = repository.create(user_id, ChatCreate(title="Second Chat"))
-        chat3 = repository.create(user_id, ChatCreate(title="Third Chat"))
+        chat1 = repository.create(user_id, _chat_create(title="First Chat"))
+        chat2 = repository.create(user_id, _chat_create(title="Second Chat"))
+        chat3 = repository.create(user_id, _chat_create(title="Third Chat"))
         
         chats = repository.get_all_by_user(user_id)
         
         # Most recently created/updated should be first
-        assert chats[0].id == chat3.id
-        assert chats[1].id == chat2.id
-        assert chats[2].id == chat1.id
+        assert [chat.id for chat in chats] == [chat3.id, chat2.id, chat1.id]
     
-    def test_get_all_by_user_isolation(self, repository: ChatRepository, user_id, other_user_id):
+    def test_get_all_by_user_isolation(self, repository: ChatRepository, seeded_dataset):
         """Test that users only see their own chats."""
-        user1_chat = ChatCreate(title="User 1 Chat")
-        user2_chat = ChatCreate(title="User 2 Chat")
-        
-        repository.create(user_id, user1_chat)
-        repository.create(other_user_id, user2_chat)
+        user1_id, user2_id = list(seeded_dataset)[:2]
         
-        user1_chats = repository.get_all_by_user(user_id)
-        user2_chats = repository.get_all_by_user(other_user_id)
+        user1_chats = repository.get_all_by_user(user1_id)
+        user2_chats = repository.get_all_by_user(user2_id)
         
-        assert len(user1_chats) == 1
-        assert len(user2_chats) == 1
-        assert user1_chats[0].title == "User 1 Chat"
-        assert user2_chats[0].title == "User 2 Chat"
+        assert sorted(chat.title for chat in user1_chats) == sorted(seeded_dataset[user1_id])
+        assert sorted(chat.title for chat in user2_chats) == sorted(seeded_dataset[user2_id])
+        assert all(chat.user_id == user1_id for chat in user1_chats)
+
+
+class TestChatRepositoryGetPage:
+    """Tests for the get_page method."""
+    
+    def test_get_page_walks_all_chats_with_cursor(self, repository: ChatRepository, user_id):
+        """Test that following the cursor returns every chat exactly once in order."""
+        for i in range(5):
+            repository.create(user_id, _chat_create(title=f"Chat {i}"))
+        expected = [chat.id for chat in repository.get_all_by_user(user_id)]
+        
+        seen = []
+        cursor = None
+        while True:
+            page = repository.get_page(user_id, cursor=cursor, limit=2)
+            seen.extend(chat.id for chat in page)
+            if len(page) < 2:
+                break
+            cursor = (page[-1].updated_at, page[-1].id)
+        
+        assert seen == expected
+    
+    def test_get_page_deleted_only(self, repository: ChatRepository, user_id):
+        """Test that deleted_only restricts the page to soft-deleted chats."""
+        repository.create(user_id, _chat_create(title="Active Chat"))
+        deleted_chat = repository.create(user_id, _chat_create(title="Deleted Chat"))
+        repository.soft_delete(deleted_chat.id, user_id)
+        
+        chats = repository.get_page(user_id, deleted_only=True)
+        
+        assert [chat.id for chat in chats] == [deleted_chat.id]
+    
+    def test_get_page_include_deleted(self, repository: ChatRepository, user_id):
+        """Test that include_deleted returns active and deleted chats."""
+        repository.create(user_id, _chat_create(title="Active Chat"))
+        deleted_chat = repository.create(user_id, _chat_create(title="Deleted Chat"))
+        repository.soft_delete(deleted_chat.id, user_id)
+        
+        assert len(repository.get_page(user_id)) == 1
+        assert len(repository.get_page(user_id, include_deleted=True)) == 2
 
 
 class TestChatRepositoryUpdate:
     """Tests for the update method."""
     
-    def test_update_chat_success(self, repository: ChatRepository, user_id, sample_chat_data: ChatCreate):
+    def test_update_chat_success(self, repository: ChatRepository, user_id, ticking_clock, created_chat):
         """Test updating a chat successfully."""
-        created_chat = repository.create(user_id, sample_chat_data)
         original_updated_at = created_chat.updated_at
         
         update_data = ChatUpdate(
@@ -258,23 +460,15 @@ class TestChatRepositoryUpdate:
         assert updated_chat is not None
         assert updated_chat.title == "Updated Title"
         assert updated_chat.summary == "Updated summary"
-        assert updated_chat.updated_at > original_updated_at
-    
-    def test_update_chat_not_found(self, repository: ChatRepository, user_id):
-        """Test updating a non-existent chat."""
-        non_existent_id = uuid4()
-        update_data = ChatUpdate(title="New Title")
-        
-        result = repository.update(non_existent_id, user_id, update_data)
-        
-        assert result is None
+        assert updated_chat.updated_at == original_updated_at + timedelta(seconds=1)
     
-    def test_update_chat_wrong_user(self, repository: ChatRepository, user_id, other_user_id, sample_chat_data: ChatCreate):
-        """Test that a user cannot update another user's chat."""
-        created_chat = repository.create(user_id, sample_chat_data)
+    @INACCESSIBLE_CASES
+    def test_update_chat_inaccessible(self, repository: ChatRepository, user_id, other_user_id, created_chat, case):
+        """Test that unknown IDs and other users' chats cannot be updated."""
+        chat_id, requester_id = _inaccessible_target(case, created_chat, user_id, other_user_id)
         update_data = ChatUpdate(title="Hacked Title")
         
-        result = repository.update(created_chat.id, other_user_id, update_data)
+        result = repository.update(chat_id, requester_id, update_data)
         
         assert result is None
         
@@ -320,10 +514,8 @@ class TestChatRepositoryUpdate:
 class TestChatRepositorySoftDelete:
     """Tests for the soft_delete method."""
     
-    def test_soft_delete_success(self, repository: ChatRepository, user_id, sample_chat_data: ChatCreate):
+    def test_soft_delete_success(self, repository: ChatRepository, user_id, created_chat):
         """Test soft deleting a chat successfully."""
-        created_chat = repository.create(user_id, sample_chat_data)
-        
         result = repository.soft_delete(created_chat.id, user_id)
         
         assert result is True
@@ -332,19 +524,12 @@ class TestChatRepositorySoftDelete:
         chat = repository.get_by_id(created_chat.id, user_id)
         assert chat is None  # Should not be retrieved by default
     
-    def test_soft_delete_not_found(self, repository: ChatRepository, user_id):
-        """Test soft deleting a non-existent chat."""
-        non_existent_id = uuid4()
-        
-        result = repository.soft_delete(non_existent_id, user_id)
-        
-        assert result is False
-    
-    def test_soft_delete_wrong_user(self, repository: ChatRepository, user_id, other_user_id, sample_chat_data: ChatCreate):
-        """Test that a user cannot delete another user's chat."""
-        created_chat = repository.create(user_id, sample_chat_data)
+    @INACCESSIBLE_CASES
+    def test_soft_delete_inaccessible(self, repository: ChatRepository, user_id, other_user_id, created_chat, case):
+        """Test that unknown IDs and other users' chats cannot be soft deleted."""
+        chat_id, requester_id = _inaccessible_target(case, created_chat, user_id, other_user_id)
         
-        result = repository.soft_delete(created_chat.id, other_user_id)
+        result = repository.soft_delete(chat_id, requester_id)
         
         assert result is False
         
@@ -368,31 +553,21 @@ class TestChatRepositorySoftDelete:
 class TestChatRepositoryHardDelete:
     """Tests for the hard_delete method."""
     
-    def test_hard_delete_success(self, repository: ChatRepository, user_id, sample_chat_data: ChatCreate):
+    def test_hard_delete_success(self, repository: ChatRepository, user_id, created_chat):
         """Test hard deleting a chat successfully."""
-        created_chat = repository.create(user_id, sample_chat_data)
-        
         result = repository.hard_delete(created_chat.id, user_id)
         
         assert result is True
         
         # Verify it's completely removed
-        chats = repository.get_all_by_user(user_id, include_deleted=True)
-        assert len(chats) == 0
-    
-    def test_hard_delete_not_found(self, repository: ChatRepository, user_id):
-        """Test hard deleting a non-existent chat."""
-        non_existent_id = uuid4()
-        
-        result = repository.hard_delete(non_existent_id, user_id)
-        
-        assert result is False
+        assert repository.count_by_user(user_id, include_deleted=True) == 0
     
-    def test_hard_delete_wrong_user(self, repository: ChatRepository, user_id, other_user_id, sample_chat_data: ChatCreate):
-        """Test that a user cannot hard delete another user's chat."""
-        created_chat = repository.create(user_id, sample_chat_data)
+    @INACCESSIBLE_CASES
+    def test_hard_delete_inaccessible(self, repository: ChatRepository, user_id, other_user_id, created_chat, case):
+        """Test that unknown IDs and other users' chats cannot be hard deleted."""
+        chat_id, requester_id = _inaccessible_target(case, created_chat, user_id, other_user_id)
         
-        result = repository.hard_delete(created_chat.id, other_user_id)
+        result = repository.hard_delete(chat_id, requester_id)
         
         assert result is False
         
@@ -416,9 +591,8 @@ class TestChatRepositoryHardDelete:
 class TestChatRepositoryRestore:
     """Tests for the restore method."""
     
-    def test_restore_success(self, repository: ChatRepository, user_id, sample_chat_data: ChatCreate):
+    def test_restore_success(self, repository: ChatRepository, user_id, created_chat):
         """Test restoring a soft-deleted chat successfully."""
-        created_chat = repository.create(user_id, sample_chat_data)
         repository.soft_delete(created_chat.id, user_id)
         
         restored_chat = repository.restore(created_chat.id, user_id)
@@ -430,20 +604,13 @@ class TestChatRepositoryRestore:
         chat = repository.get_by_id(created_chat.id, user_id)
         assert chat is not None
     
-    def test_restore_not_found(self, repository: ChatRepository, user_id):
-        """Test restoring a non-existent chat."""
-        non_existent_id = uuid4()
-        
-        result = repository.restore(non_existent_id, user_id)
-        
-        assert result is None
-    
-    def test_restore_wrong_user(self, repository: ChatRepository, user_id, other_user_id, sample_chat_data: ChatCreate):
-        """Test that a user cannot restore another user's chat."""
-        created_chat = repository.create(user_id, sample_chat_data)
+    @INACCESSIBLE_CASES
+    def test_restore_inaccessible(self, repository: ChatRepository, user_id, other_user_id, created_chat, case):
+        """Test that unknown IDs and other users' deleted chats cannot be restored."""
         repository.soft_delete(created_chat.id, user_id)
+        chat_id, requester_id = _inaccessible_target(case, created_chat, user_id, other_user_id)
         
-        result = repository.restore(created_chat.id, other_user_id)
+        result = repository.restore(chat_id, requester_id)
         
         assert result is None
     
@@ -455,7 +622,7 @@ class TestChatRepositoryRestore:
         
         assert result is None
     
-    def test_restore_updates_timestamp(self, repository: ChatRepository, user_id, sample_chat_data: ChatCreate):
+    def test_restore_updates_timestamp(self, repository: ChatRepository, user_id, ticking_clock, sample_chat_data: ChatCreate):
         """Test that restoring updates the updated_at timestamp."""
         created_chat = repository.create(user_id, sample_chat_data)
         original_updated_at = created_chat.updated_at
@@ -465,59 +632,113 @@ class TestChatRepositoryRestore:
         restored_chat = repository.restore(created_chat.id, user_id)
         
         assert restored_chat is not None
-        assert restored_chat.updated_at >= original_updated_at
+        # One tick for the soft delete, one for the restore
+        assert restored_chat.updated_at == original_updated_at + timedelta(seconds=2)
 
 
-class TestChatRepositoryCountByUser:
-    """Tests for the count_by_user method."""
+class TestChatRepositoryFingerprint:
+    """Tests for the fingerprint method."""
     
-    def test_count_by_user_empty(self, repository: ChatRepository, user_id):
-        """Test counting chats for a user with no chats."""
-        count = repository.count_by_user(user_id)
-        
-        assert count == 0
+    def test_fingerprint_empty(self, repository: ChatRepository, user_id):
+        """Test the fingerprint of a user with no chats."""
+        assert repository.fingerprint(user_id) == (None, 0)
     
-    def test_count_by_user_with_chats(self, repository: ChatRepository, user_id):
-        """Test counting chats for a user."""
-        for i in range(3):
-            chat_data = ChatCreate(title=f"Chat {i}")
-            repository.create(user_id, chat_data)
+    def test_fingerprint_tracks_changes(self, repository: ChatRepository, user_id, sample_chat_data: ChatCreate):
+        """Test that the fingerprint changes when the chat list changes."""
+        chat = repository.create(user_id, sample_chat_data)
+        before = repository.fingerprint(user_id)
         
-        count = repository.count_by_user(user_id)
+        repository.update(chat.id, user_id, ChatUpdate(title="Updated Title"))
+        after_update = repository.fingerprint(user_id)
         
-        assert count == 3
-    
-    def test_count_by_user_excludes_deleted(self, repository: ChatRepository, user_id):
-        """Test that deleted chats are excluded from count by default."""
-        chat1 = repository.create(user_id, ChatCreate(title="Active"))
-        chat2 = repository.create(user_id, ChatCreate(title="Deleted"))
+        repository.soft_delete(chat.id, user_id)
+        after_delete = repository.fingerprint(user_id)
         
+        assert before[1] == 1
+        assert after_update[0] > before[0]
+        assert after_delete == (None, 0)
+        assert repository.fingerprint(user_id, include_deleted=True)[1] == 1
+
+
+class TestChatRepositoryBulkOperations:
+    """Tests for the bulk_soft_delete, bulk_restore and bulk_hard_delete methods."""
+    
+    def test_bulk_soft_delete_only_affects_owned_active_chats(self, repository: ChatRepository, user_id, other_user_id):
+        """Test that bulk soft delete skips missing, foreign and already deleted chats."""
+        chat1 = repository.create(user_id, _chat_create(title="Chat 1"))
+        chat2 = repository.create(user_id, _chat_create(title="Chat 2"))
+        foreign_chat = repository.create(other_user_id, _chat_create(title="Foreign"))
         repository.soft_delete(chat2.id, user_id)
         
-        count = repository.count_by_user(user_id)
+        deleted_ids = repository.bulk_soft_delete([chat1.id, chat2.id, foreign_chat.id, uuid4()], user_id)
         
-        assert count == 1
+        assert deleted_ids == [chat1.id]
+        assert repository.count_by_user(user_id) == 0
+        assert repository.count_by_user(other_user_id) == 1
     
-    def test_count_by_user_include_deleted(self, repository: ChatRepository, user_id):
-        """Test counting chats including deleted ones."""
-        chat1 = repository.create(user_id, ChatCreate(title="Active"))
-        chat2 = repository.create(user_id, ChatCreate(title="Deleted"))
+    def test_bulk_restore_only_affects_owned_deleted_chats(self, repository: ChatRepository, user_id):
+        """Test that bulk restore only restores soft-deleted chats."""
+        chat1 = repository.create(user_id, _chat_create(title="Chat 1"))
+        chat2 = repository.create(user_id, _chat_create(title="Chat 2"))
+        repository.soft_delete(chat1.id, user_id)
         
+        restored_ids = repository.bulk_restore([chat1.id, chat2.id], user_id)
+        
+        assert restored_ids == [chat1.id]
+        assert repository.count_by_user(user_id) == 2
+    
+    def test_bulk_hard_delete_removes_owned_chats(self, repository: ChatRepository, user_id, other_user_id):
+        """Test that bulk hard delete removes active and soft-deleted owned chats."""
+        chat1 = repository.create(user_id, _chat_create(title="Chat 1"))
+        chat2 = repository.create(user_id, _chat_create(title="Chat 2"))
+        foreign_chat = repository.create(other_user_id, _chat_create(title="Foreign"))
         repository.soft_delete(chat2.id, user_id)
         
-        count = repository.count_by_user(user_id, include_deleted=True)
+        deleted_ids = repository.bulk_hard_delete([chat1.id, chat2.id, foreign_chat.id], user_id)
         
-        assert count == 2
+        assert set(deleted_ids) == {chat1.id, chat2.id}
+        assert repository.count_by_user(user_id, include_deleted=True) == 0
+        assert repository.count_by_user(other_user_id) == 1
     
-    def test_count_by_user_isolation(self, repository: ChatRepository, user_id, other_user_id):
-        """Test that count only includes user's own chats."""
-        repository.create(user_id, ChatCreate(title="User 1 Chat"))
-        repository.create(other_user_id, ChatCreate(title="User 2 Chat"))
-        repository.create(other_user_id, ChatCreate(title="User 2 Chat 2"))
+    def test_bulk_operations_with_empty_list(self, repository: ChatRepository, user_id):
+        """Test that bulk operations accept an empty list of IDs."""
+        assert repository.bulk_soft_delete([], user_id) == []
+        assert repository.bulk_restore([], user_id) == []
+        assert repository.bulk_hard_delete([], user_id) == []
+
+
+class TestChatRepositoryCountByUser:
+    """Tests for the count_by_user method."""
+    
+    @pytest.mark.parametrize(
+        "n_active,n_deleted,include_deleted,expected",
+        [
+            (0, 0, False, 0),  # empty
+            (3, 0, False, 3),  # with chats
+            (1, 1, False, 1),  # excludes deleted
+            (1, 1, True, 2),   # include deleted
+        ],
+    )
+    def test_count_by_user(
+        self, repository: ChatRepository, user_id, n_active, n_deleted, include_deleted, expected
+    ):
+        """Test counting a user's chats with and without soft-deleted ones."""
+        chats = repository.bulk_create(
+            user_id, [_chat_create(title=f"Chat {i}") for i in range(n_active + n_deleted)]
+        )
+        repository.bulk_soft_delete([chat.id for chat in chats[n_active:]], user_id)
         
-        count = repository.count_by_user(user_id)
+        count = repository.count_by_user(user_id, include_deleted=include_deleted)
+        
+        assert count == expected
+    
+    def test_count_by_user_isolation(self, repository: ChatRepository, user_id, seeded_dataset):
+        """Test that count only includes user's own chats."""
+        repository.create(user_id, _chat_create(title="User 1 Chat"))
         
-        assert count == 1
+        assert repository.count_by_user(user_id) == 1
+        for seed_user_id, titles in seeded_dataset.items():
+            assert repository.count_by_user(seed_user_id) == len(titles)
 
 
 class TestChatRepositoryIntegration:
@@ -526,14 +747,11 @@ class TestChatRepositoryIntegration:
     def test_full_crud_cycle(self, repository: ChatRepository, user_id):
         """Test a complete CRUD cycle."""
         # Create
-        chat_data = ChatCreate(title="Test Chat", summary="Test Summary")
+        chat_data = _chat_create(title="Test Chat", summary="Test Summary")
         created_chat = repository.create(user_id, chat_data)
         assert created_chat.id is not None
-        
-        # Read
-        retrieved_chat = repository.get_by_id(created_chat.id, user_id)
-        assert retrieved_chat is not None
-        assert retrieved_chat.title == "Test Chat"
+        # create returns the row as stored (via RETURNING), so no read-back is needed
+        assert created_chat.title == "Test Chat"
         
         # Update
         update_data = ChatUpdate(title="Updated Chat")
@@ -553,21 +771,21 @@ class TestChatRepositoryIntegration:
         restored_chat = repository.restore(created_chat.id, user_id)
         assert restored_chat is not None
         assert restored_chat.is_deleted is False
+        assert restored_chat.title == "Updated Chat"
         
         # Hard Delete
         hard_delete_result = repository.hard_delete(created_chat.id, user_id)
         assert hard_delete_result is True
         
         # Verify hard deletion
-        all_chats = repository.get_all_by_user(user_id, include_deleted=True)
-        assert len(all_chats) == 0
+        assert repository.count_by_user(user_id, include_deleted=True) == 0
     
     def test_complex_multi_user_scenario(self, repository: ChatRepository, user_id, other_user_id):
         """Test a complex scenario with multiple users and operations."""
         # Create chats for both users
-        user1_chat1 = repository.create(user_id, ChatCreate(title="User1 Chat1"))
-        user1_chat2 = repository.create(user_id, ChatCreate(title="User1 Chat2"))
-        user2_chat1 = repository.create(other_user_id, ChatCreate(title="User2 Chat1"))
+        user1_chat1 = repository.create(user_id, _chat_create(title="User1 Chat1"))
+        user1_chat2 = repository.create(user_id, _chat_create(title="User1 Chat2"))
+        user2_chat1 = repository.create(other_user_id, _chat_create(title="User2 Chat1"))
         
         # Verify counts
         assert repository.count_by_user(user_id) == 2
@@ -578,8 +796,7 @@ class TestChatRepositoryIntegration:
         
         # Verify user1's active chats
         user1_chats = repository.get_all_by_user(user_id)
-        assert len(user1_chats) == 1
-        assert user1_chats[0].title == "User1 Chat1"
+        assert [chat.title for chat in user1_chats] == ["User1 Chat1"]
         
         # Verify user2 is unaffected
         assert repository.count_by_user(other_user_id) == 1
@@ -600,11 +817,12 @@ class TestChatRepositoryIntegration:
         assert repository.count_by_user(user_id) == 2
         assert repository.count_by_user(other_user_id) == 1
     
-    def test_soft_delete_restore_cycle(self, repository: ChatRepository, user_id):
-        """Test multiple soft delete and restore cycles."""
-        chat = repository.create(user_id, ChatCreate(title="Cycle Test"))
+    @pytest.mark.parametrize("cycles", [1, pytest.param(3, marks=pytest.mark.slow)])
+    def test_soft_delete_restore_cycle(self, repository: ChatRepository, user_id, cycles):
+        """Test repeated soft delete and restore cycles."""
+        chat = repository.create(user_id, _chat_create(title="Cycle Test"))
         
-        for i in range(3):
+        for _ in range(cycles):
             # Soft delete
             result = repository.soft_delete(chat.id, user_id)
             assert result is True
@@ -1,12 +1,24 @@
 import pytest
 from decimal import Decimal
-from uuid import uuid4
-from sqlmodel import Session
+from uuid import UUID, uuid4
+from sqlalchemy import Row
+from sqlmodel import Session, delete
 
 from app.repositories.message import MessageRepository
 from app.repositories.model import ModelRepository
 from app.repositories.chat import ChatRepository
-from app.models import MessageCreate, MessageUpdate, ModelCreate, ChatCreate
+from app.models import Chat, Model, MessageCreate, MessageUpdate, ModelCreate, ChatCreate
+
+
+# Owner of every chat created by this module; rows never outlive a test or the module
+TEST_USER_ID = f"user_{uuid4().hex[:24]}"
+
+# Message ID that is never assigned, for not-found cases
+NONEXISTENT_ID = UUID("00000000-0000-0000-0000-000000000000")
+
+# Model prices in dollars per million tokens
+PRICE_GPT4 = Decimal("30.000000")
+PRICE_CLAUDE3 = Decimal("15.000000")
 
 
 @pytest.fixture(name="message_repository")
@@ -25,35 +37,64 @@ def model_repository_fixture(session: Session):
     return ModelRepository(session)
 
 
-@pytest.fixture(name="chat_repository")
-def chat_repository_fixture(session: Session):
-    """
-    Create a ChatRepository instance with the test session.
+@pytest.fixture(name="test_model", scope="module")
+def test_model_fixture(engine):
     """
-    return ChatRepository(session)
-
-
-@pytest.fixture(name="test_model")
-def test_model_fixture(model_repository: ModelRepository):
-    """
-    Create a test model for messages.
+    Commit the model shared by this module's messages, once for the whole module.
+    
+    Each test's own writes are rolled back, so the row is left as committed here,
+    and it is removed again when the module finishes.
     """
     model_data = ModelCreate(
         name="GPT-4",
         provider="OpenAI",
-        price_per_million_tokens=Decimal("30.000000")
+        price_per_million_tokens=PRICE_GPT4
     )
-    return model_repository.create(model_data)
+    with Session(engine) as module_session:
+        model = ModelRepository(module_session).create(model_data)
+    
+    yield model
+    
+    with Session(engine) as module_session:
+        module_session.exec(delete(Model).where(Model.id == model.id))
+        module_session.commit()
 
 
-@pytest.fixture(name="test_chat")
-def test_chat_fixture(chat_repository: ChatRepository):
+@pytest.fixture(name="test_chat", scope="module")
+def test_chat_fixture(engine):
     """
-    Create a test chat for messages.
+    Commit the chat shared by this module's messages, once for the whole module.
+    
+    Like test_model, it is only changed inside rolled-back tests and is removed
+    again when the module finishes.
     """
-    user_id = f"user_{uuid4().hex[:24]}"
     chat_data = ChatCreate(title="Test Chat")
-    return chat_repository.create(user_id, chat_data)
+    with Session(engine) as module_session:
+        chat = ChatRepository(module_session).create(TEST_USER_ID, chat_data)
+    
+    yield chat
+    
+    with Session(engine) as module_session:
+        module_session.exec(delete(Chat).where(Chat.id == chat.id))
+        module_session.commit()
+
+
+@pytest.fixture(name="make_chats")
+def make_chats_fixture(session: Session):
+    """
+    Provide a helper that adds one chat per title for a user in a single flush.
+    
+    The chats are detached after the flush so later commits don't expire them.
+    """
+    def make_chats(user_id: str, titles: list[str]) -> list[Chat]:
+        chats = [Chat(user_id=user_id, title=title) for title in titles]
+        session.add_all(chats)
+        session.flush()
+        for chat in chats:
+            session.expunge(chat)
+        return chats
+    
+    return make_chats
 
 
 @pytest.fixture(name="sample_message_data")
@@ -70,6 +111,24 @@ def sample_message_data_fixture(test_chat, test_model):
     )
 
 
+@pytest.fixture(name="create_messages")
+def create_messages_fixture(message_repository: MessageRepository, test_chat, test_model):
+    """
+    Provide a helper that inserts n messages into the test chat with one INSERT.
+    
+    The creation data is validated once and copied per message with only the
+    content changed.
+    """
+    def create_messages(n: int, type: str = "user", content_prefix: str = "Message "):
+        template = MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type=type, content=content_prefix)
+        return message_repository.create_many([
+            template.model_copy(update={"content": f"{content_prefix}{i}"})
+            for i in range(n)
+        ])
+    
+    return create_messages
+
+
 class TestMessageRepositoryCreate:
     """Tests for the create method."""
     
@@ -101,19 +160,19 @@ class TestMessageRepositoryCreate:
         
         assert message.tokens is None
     
-    def test_create_message_different_types(self, message_repository: MessageRepository, test_chat, test_model):
+    @pytest.mark.parametrize("msg_type", ["user", "ai", "system"])
+    def test_create_message_different_types(self, message_repository: MessageRepository, test_chat, test_model, msg_type):
         """Test creating messages with different types."""
-        types = ["user", "ai", "system"]
-        
-        for msg_type in types:
-            message_data = MessageCreate(
-                chat_id=test_chat.id,
-                model_id=test_model.id,
-                type=msg_type,
-                content=f"Message of type {msg_type}"
-            )
-            message = message_repository.create(message_data)
-            assert message.type == msg_type
+        message_data = MessageCreate(
+            chat_id=test_chat.id,
+            model_id=test_model.id,
+            type=msg_type,
+            content="Typed message"
+        )
+        
+        message = message_repository.create(message_data)
+        
+        assert message.type == msg_type
     
     def test_create_multiple_messages(self, message_repository: MessageRepository, test_chat, test_model):
         """Test creating multiple messages in the same chat."""
@@ -137,6 +196,27 @@ class TestMessageRepositoryCreate:
         assert message1.chat_id == message2.chat_id
 
 
+class TestMessageRepositoryCreateMany:
+    """Tests for the create_many method."""
+    
+    def test_create_many_preserves_order(self, message_repository: MessageRepository, test_chat, test_model):
+        """Test that created messages come back in input order."""
+        messages_data = [
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content=f"Message {i}")
+            for i in range(5)
+        ]
+        
+        messages = message_repository.create_many(messages_data)
+        
+        assert [message.content for message in messages] == [f"Message {i}" for i in range(5)]
+        assert len({message.id for message in messages}) == 5
+        assert message_repository.count_by_chat(test_chat.id) == 5
+    
+    def test_create_many_empty(self, message_repository: MessageRepository):
+        """Test creating an empty batch."""
+        assert message_repository.create_many([]) == []
+
+
 class TestMessageRepositoryGetById:
     """Tests for the get_by_id method."""
     
@@ -152,7 +232,7 @@ class TestMessageRepositoryGetById:
     
     def test_get_by_id_not_found(self, message_repository: MessageRepository):
         """Test retrieving a non-existent message by ID."""
-        non_existent_id = uuid4()
+        non_existent_id = NONEXISTENT_ID
         
         message = message_repository.get_by_id(non_existent_id)
         
@@ -166,17 +246,60 @@ class TestMessageRepositoryGetById:
         message = message_repository.get_by_id(created_message.id)
         
         assert message is None
+    
+    def test_get_by_id_reuses_loaded_message(self, message_repository: MessageRepository, sample_message_data: MessageCreate, executed_statements):
+        """Test that a message already loaded in the session is returned without a query."""
+        created_message = message_repository.create(sample_message_data)
+        first = message_repository.get_by_id(created_message.id)
+        executed_statements.clear()
+        
+        second = message_repository.get_by_id(created_message.id)
+        
+        assert second is first
+        assert executed_statements == []
+    
+    def test_get_by_id_after_bulk_soft_delete(self, message_repository: MessageRepository, sample_message_data: MessageCreate):
+        """Test that a loaded message deleted through a bulk update is no longer returned."""
+        created_message = message_repository.create(sample_message_data)
+        assert message_repository.get_by_id(created_message.id) is not None
+        
+        message_repository.soft_delete_many([created_message.id])
+        
+        assert message_repository.get_by_id(created_message.id) is None
+
+
+class TestMessageRepositoryExists:
+    """Tests for the exists method."""
+    
+    def test_exists_true(self, message_repository: MessageRepository, sample_message_data: MessageCreate):
+        """Test that an existing message is found."""
+        message = message_repository.create(sample_message_data)
+        
+        assert message_repository.exists(message.id) is True
+    
+    def test_exists_false(self, message_repository: MessageRepository):
+        """Test that a non-existent message is not found."""
+        assert message_repository.exists(NONEXISTENT_ID) is False
+    
+    def test_exists_deleted_message(self, message_repository: MessageRepository, sample_message_data: MessageCreate):
+        """Test that soft-deleted messages don't exist."""
+        message = message_repository.create(sample_message_data)
+        message_repository.soft_delete(message.id)
+        
+        assert message_repository.exists(message.id) is False
 
 
 class TestMessageRepositoryGetWithModel:
     """Tests for the get_with_model method."""
     
-    def test_get_with_model_success(self, message_repository: MessageRepository, sample_message_data: MessageCreate, test_model):
-        """Test retrieving a message with its model successfully."""
+    def test_get_with_model_success(self, message_repository: MessageRepository, sample_message_data: MessageCreate, test_model, executed_statements):
+        """Test retrieving a message with its model in a single query."""
         created_message = message_repository.create(sample_message_data)
+        executed_statements.clear()
         
         result = message_repository.get_with_model(created_message.id)
         
+        assert len(executed_statements) == 1
         assert result is not None
         message, model = result
         assert message.id == created_message.id
@@ -185,7 +308,7 @@ class TestMessageRepositoryGetWithModel:
     
     def test_get_with_model_not_found(self, message_repository: MessageRepository):
         """Test retrieving a non-existent message with model."""
-        non_existent_id = uuid4()
+        non_existent_id = NONEXISTENT_ID
         
         result = message_repository.get_with_model(non_existent_id)
         
@@ -212,36 +335,18 @@ class TestMessageRepositoryGetAllByChat:
     
     def test_get_all_by_chat_with_messages(self, message_repository: MessageRepository, test_chat, test_model):
         """Test retrieving all messages for a chat."""
-        message1_data = MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="First message"
-        )
-        message2_data = MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="ai",
-            content="Second message"
-        )
-        
-        message_repository.create(message1_data)
-        message_repository.create(message2_data)
+        message_repository.create_many([
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="First message"),
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="ai", content="Second message"),
+        ])
         
         messages = message_repository.get_all_by_chat(test_chat.id)
         
         assert len(messages) == 2
     
-    def test_get_all_by_chat_with_pagination(self, message_repository: MessageRepository, test_chat, test_model):
+    def test_get_all_by_chat_with_pagination(self, message_repository: MessageRepository, test_chat, create_messages):
         """Test pagination with skip and limit."""
-        for i in range(5):
-            message_data = MessageCreate(
-                chat_id=test_chat.id,
-                model_id=test_model.id,
-                type="user",
-                content=f"Message {i}"
-            )
-            message_repository.create(message_data)
+        create_messages(5)
         
         # Test skip
         messages = message_repository.get_all_by_chat(test_chat.id, skip=2)
@@ -257,21 +362,10 @@ class TestMessageRepositoryGetAllByChat:
     
     def test_get_all_by_chat_excludes_deleted(self, message_repository: MessageRepository, test_chat, test_model):
         """Test that deleted messages are excluded by default."""
-        message1_data = MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="Active message"
-        )
-        message2_data = MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="Deleted message"
-        )
-        
-        message1 = message_repository.create(message1_data)
-        message2 = message_repository.create(message2_data)
+        _, message2 = message_repository.create_many([
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="Active message"),
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="Deleted message"),
+        ])
         
         # Soft delete message2
         message_repository.soft_delete(message2.id)
@@ -283,21 +377,10 @@ class TestMessageRepositoryGetAllByChat:
     
     def test_get_all_by_chat_include_deleted(self, message_repository: MessageRepository, test_chat, test_model):
         """Test retrieving all messages including deleted ones."""
-        message1_data = MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="Active message"
-        )
-        message2_data = MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="Deleted message"
-        )
-        
-        message1 = message_repository.create(message1_data)
-        message2 = message_repository.create(message2_data)
+        _, message2 = message_repository.create_many([
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="Active message"),
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="Deleted message"),
+        ])
         
         # Soft delete message2
         message_repository.soft_delete(message2.id)
@@ -334,11 +417,9 @@ class TestMessageRepositoryGetAllByChat:
         assert messages[1].id == message2.id
         assert messages[2].id == message3.id
     
-    def test_get_all_by_chat_isolation(self, message_repository: MessageRepository, chat_repository: ChatRepository, test_model):
+    def test_get_all_by_chat_isolation(self, message_repository: MessageRepository, make_chats, test_model):
         """Test that messages are isolated by chat."""
-        user_id = f"user_{uuid4().hex[:24]}"
-        chat1 = chat_repository.create(user_id, ChatCreate(title="Chat 1"))
-        chat2 = chat_repository.create(user_id, ChatCreate(title="Chat 2"))
+        chat1, chat2 = make_chats(TEST_USER_ID, ["Chat 1", "Chat 2"])
         
         message_repository.create(MessageCreate(
             chat_id=chat1.id,
@@ -386,13 +467,14 @@ class TestMessageRepositoryGetAllByChatWithModel:
         message_repository: MessageRepository, 
         model_repository: ModelRepository,
         test_chat, 
-        test_model
+        test_model,
+        executed_statements
     ):
-        """Test retrieving messages with different models."""
+        """Test retrieving messages with different models in a single query."""
         model2 = model_repository.create(ModelCreate(
             name="Claude-3",
             provider="Anthropic",
-            price_per_million_tokens=Decimal("15.000000")
+            price_per_million_tokens=PRICE_CLAUDE3
         ))
         
         message_repository.create(MessageCreate(
@@ -407,12 +489,42 @@ class TestMessageRepositoryGetAllByChatWithModel:
             type="ai",
             content="Claude-3 message"
         ))
+        executed_statements.clear()
         
         results = message_repository.get_all_by_chat_with_model(test_chat.id)
+        model_names = [model.name for _, model in results]
         
-        assert len(results) == 2
-        assert results[0][1].name == "GPT-4"
-        assert results[1][1].name == "Claude-3"
+        assert model_names == ["GPT-4", "Claude-3"]
+        assert len(executed_statements) == 1
+
+
+class TestMessageRepositoryGetPageAfter:
+    """Tests for the get_page_after method."""
+    
+    def test_get_page_after_walks_all_messages(self, message_repository: MessageRepository, sample_message_data: MessageCreate):
+        """Test that following the cursor visits every message once, in order."""
+        created = [message_repository.create(sample_message_data) for _ in range(5)]
+        
+        seen = []
+        cursor = None
+        while True:
+            page = message_repository.get_page_after(sample_message_data.chat_id, cursor=cursor, limit=2)
+            if not page:
+                break
+            seen.extend(message.id for message, _ in page)
+            last = page[-1][0]
+            cursor = (last.created_at, last.id)
+        
+        expected = sorted(created, key=lambda message: (message.created_at, message.id))
+        assert seen == [message.id for message in expected]
+    
+    def test_get_page_after_excludes_deleted(self, message_repository: MessageRepository, sample_message_data: MessageCreate):
+        """Test that deleted messages are skipped unless requested."""
+        message = message_repository.create(sample_message_data)
+        message_repository.soft_delete(message.id)
+        
+        assert message_repository.get_page_after(sample_message_data.chat_id) == []
+        assert len(message_repository.get_page_after(sample_message_data.chat_id, include_deleted=True)) == 1
 
 
 class TestMessageRepositoryGetByType:
@@ -420,39 +532,20 @@ class TestMessageRepositoryGetByType:
     
     def test_get_by_type_success(self, message_repository: MessageRepository, test_chat, test_model):
         """Test retrieving messages by type."""
-        message_repository.create(MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="User message 1"
-        ))
-        message_repository.create(MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="ai",
-            content="AI message"
-        ))
-        message_repository.create(MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="User message 2"
-        ))
+        message_repository.create_many([
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="User message 1"),
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="ai", content="AI message"),
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="User message 2"),
+        ])
         
         user_messages = message_repository.get_by_type(test_chat.id, "user")
         
         assert len(user_messages) == 2
         assert all(msg.type == "user" for msg in user_messages)
     
-    def test_get_by_type_with_pagination(self, message_repository: MessageRepository, test_chat, test_model):
+    def test_get_by_type_with_pagination(self, message_repository: MessageRepository, test_chat, create_messages):
         """Test pagination when getting messages by type."""
-        for i in range(5):
-            message_repository.create(MessageCreate(
-                chat_id=test_chat.id,
-                model_id=test_model.id,
-                type="user",
-                content=f"Message {i}"
-            ))
+        create_messages(5)
         
         messages = message_repository.get_by_type(test_chat.id, "user", skip=1, limit=2)
         
@@ -460,18 +553,10 @@ class TestMessageRepositoryGetByType:
     
     def test_get_by_type_excludes_deleted(self, message_repository: MessageRepository, test_chat, test_model):
         """Test that deleted messages are excluded."""
-        message1 = message_repository.create(MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="Active"
-        ))
-        message2 = message_repository.create(MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="Deleted"
-        ))
+        _, message2 = message_repository.create_many([
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="Active"),
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="Deleted"),
+        ])
         
         message_repository.soft_delete(message2.id)
         
@@ -481,6 +566,42 @@ class TestMessageRepositoryGetByType:
         assert messages[0].content == "Active"
 
 
+class TestMessageRepositoryGetWithFeedback:
+    """Tests for the get_with_feedback method."""
+    
+    def test_get_with_feedback_all(self, message_repository: MessageRepository, sample_message_data: MessageCreate, test_model):
+        """Test getting every message that has feedback."""
+        positive = message_repository.create(sample_message_data)
+        negative = message_repository.create(sample_message_data)
+        message_repository.create(sample_message_data)
+        message_repository.update_feedback(positive.id, "positive")
+        message_repository.update_feedback(negative.id, "negative")
+        
+        results = message_repository.get_with_feedback(sample_message_data.chat_id)
+        
+        assert [message.id for message, _ in results] == [positive.id, negative.id]
+        assert all(model.id == test_model.id for _, model in results)
+    
+    def test_get_with_feedback_filtered(self, message_repository: MessageRepository, sample_message_data: MessageCreate):
+        """Test filtering messages by feedback type."""
+        positive = message_repository.create(sample_message_data)
+        negative = message_repository.create(sample_message_data)
+        message_repository.update_feedback(positive.id, "positive")
+        message_repository.update_feedback(negative.id, "negative")
+        
+        results = message_repository.get_with_feedback(sample_message_data.chat_id, "negative")
+        
+        assert [message.id for message, _ in results] == [negative.id]
+    
+    def test_get_with_feedback_excludes_deleted(self, message_repository: MessageRepository, sample_message_data: MessageCreate):
+        """Test that soft-deleted messages are excluded."""
+        message = message_repository.create(sample_message_data)
+        message_repository.update_feedback(message.id, "positive")
+        message_repository.soft_delete(message.id)
+        
+        assert message_repository.get_with_feedback(sample_message_data.chat_id) == []
+
+
 class TestMessageRepositoryUpdate:
     """Tests for the update method."""
     
@@ -503,7 +624,7 @@ class TestMessageRepositoryUpdate:
     
     def test_update_message_not_found(self, message_repository: MessageRepository):
         """Test updating a non-existent message."""
-        non_existent_id = uuid4()
+        non_existent_id = NONEXISTENT_ID
         update_data = MessageUpdate(content="New content")
         
         result = message_repository.update(non_existent_id, update_data)
@@ -556,7 +677,7 @@ class TestMessageRepositoryUpdateFeedback:
     
     def test_update_feedback_not_found(self, message_repository: MessageRepository):
         """Test updating feedback for a non-existent message."""
-        non_existent_id = uuid4()
+        non_existent_id = NONEXISTENT_ID
         
         result = message_repository.update_feedback(non_existent_id, "positive")
         
@@ -590,7 +711,7 @@ class TestMessageRepositorySoftDelete:
     
     def test_soft_delete_not_found(self, message_repository: MessageRepository):
         """Test soft deleting a non-existent message."""
-        non_existent_id = uuid4()
+        non_existent_id = NONEXISTENT_ID
         
         result = message_repository.soft_delete(non_existent_id)
         
@@ -626,7 +747,7 @@ class TestMessageRepositoryHardDelete:
     
     def test_hard_delete_not_found(self, message_repository: MessageRepository):
         """Test hard deleting a non-existent message."""
-        non_existent_id = uuid4()
+        non_existent_id = NONEXISTENT_ID
         
         result = message_repository.hard_delete(non_existent_id)
         
@@ -645,18 +766,59 @@ class TestMessageRepositoryHardDelete:
         assert result is True
 
 
+class TestMessageRepositoryDeleteMany:
+    """Tests for the soft_delete_many and hard_delete_many methods."""
+    
+    def test_soft_delete_many_success(self, message_repository: MessageRepository, sample_message_data: MessageCreate):
+        """Test soft deleting several messages, skipping unknown and already deleted IDs."""
+        msg1 = message_repository.create(sample_message_data)
+        msg2 = message_repository.create(sample_message_data)
+        msg3 = message_repository.create(sample_message_data)
+        message_repository.soft_delete(msg3.id)
+        
+        count = message_repository.soft_delete_many([msg1.id, msg2.id, msg3.id, NONEXISTENT_ID])
+        
+        assert count == 2
+        assert message_repository.get_by_id(msg1.id) is None
+        assert message_repository.get_by_id(msg2.id) is None
+    
+    def test_soft_delete_many_across_batches(
+        self,
+        message_repository: MessageRepository,
+        sample_message_data: MessageCreate,
+        monkeypatch
+    ):
+        """Test that IDs split across several IN batches are all deleted."""
+        monkeypatch.setattr("app.repositories.message._BULK_BATCH_SIZE", 2)
+        messages = [message_repository.create(sample_message_data) for _ in range(5)]
+        
+        count = message_repository.soft_delete_many([msg.id for msg in messages])
+        
+        assert count == 5
+        assert message_repository.count_by_chat(sample_message_data.chat_id) == 0
+    
+    def test_soft_delete_many_empty(self, message_repository: MessageRepository):
+        """Test soft deleting an empty list."""
+        assert message_repository.soft_delete_many([]) == 0
+    
+    def test_hard_delete_many_success(self, message_repository: MessageRepository, sample_message_data: MessageCreate):
+        """Test permanently deleting several messages, including soft-deleted ones."""
+        msg1 = message_repository.create(sample_message_data)
+        msg2 = message_repository.create(sample_message_data)
+        message_repository.soft_delete(msg2.id)
+        
+        count = message_repository.hard_delete_many([msg1.id, msg2.id, NONEXISTENT_ID])
+        
+        assert count == 2
+        assert message_repository.count_by_chat(sample_message_data.chat_id, include_deleted=True) == 0
+
+
 class TestMessageRepositorySoftDeleteByChat:
     """Tests for the soft_delete_by_chat method."""
     
-    def test_soft_delete_by_chat_success(self, message_repository: MessageRepository, test_chat, test_model):
+    def test_soft_delete_by_chat_success(self, message_repository: MessageRepository, test_chat, create_messages):
         """Test soft deleting all messages in a chat."""
-        for i in range(3):
-            message_repository.create(MessageCreate(
-                chat_id=test_chat.id,
-                model_id=test_model.id,
-                type="user",
-                content=f"Message {i}"
-            ))
+        create_messages(3)
         
         count = message_repository.soft_delete_by_chat(test_chat.id)
         
@@ -674,18 +836,10 @@ class TestMessageRepositorySoftDeleteByChat:
     
     def test_soft_delete_by_chat_excludes_already_deleted(self, message_repository: MessageRepository, test_chat, test_model):
         """Test that already deleted messages are not counted."""
-        message1 = message_repository.create(MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="Active"
-        ))
-        message2 = message_repository.create(MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="Already deleted"
-        ))
+        _, message2 = message_repository.create_many([
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="Active"),
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="Already deleted"),
+        ])
         
         # Soft delete message2 first
         message_repository.soft_delete(message2.id)
@@ -694,6 +848,25 @@ class TestMessageRepositorySoftDeleteByChat:
         count = message_repository.soft_delete_by_chat(test_chat.id)
         
         assert count == 1  # Only message1 was deleted
+    
+    def test_soft_delete_by_chat_single_update(self, message_repository: MessageRepository, test_chat, create_messages, executed_statements):
+        """Test that the whole chat is soft deleted with one UPDATE, whatever its size."""
+        create_messages(5)
+        executed_statements.clear()
+        
+        message_repository.soft_delete_by_chat(test_chat.id)
+        
+        assert [statement.split()[0] for statement in executed_statements] == ["UPDATE"]
+    
+    def test_soft_delete_by_chat_updates_loaded_messages(self, message_repository: MessageRepository, test_chat, create_messages):
+        """Test that messages already loaded in the session are seen as deleted."""
+        message = create_messages(1)[0]
+        loaded = message_repository.get_by_id(message.id)
+        
+        message_repository.soft_delete_by_chat(test_chat.id)
+        
+        assert loaded.is_deleted is True
+        assert message_repository.get_by_id(message.id) is None
 
 
 class TestMessageRepositoryCountByChat:
@@ -705,15 +878,9 @@ class TestMessageRepositoryCountByChat:
         
         assert count == 0
     
-    def test_count_by_chat_with_messages(self, message_repository: MessageRepository, test_chat, test_model):
+    def test_count_by_chat_with_messages(self, message_repository: MessageRepository, test_chat, create_messages):
         """Test counting messages in a chat."""
-        for i in range(3):
-            message_repository.create(MessageCreate(
-                chat_id=test_chat.id,
-                model_id=test_model.id,
-                type="user",
-                content=f"Message {i}"
-            ))
+        create_messages(3)
         
         count = message_repository.count_by_chat(test_chat.id)
         
@@ -721,18 +888,10 @@ class TestMessageRepositoryCountByChat:
     
     def test_count_by_chat_excludes_deleted(self, message_repository: MessageRepository, test_chat, test_model):
         """Test that deleted messages are excluded from count by default."""
-        message1 = message_repository.create(MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="Active"
-        ))
-        message2 = message_repository.create(MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="Deleted"
-        ))
+        _, message2 = message_repository.create_many([
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="Active"),
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="Deleted"),
+        ])
         
         message_repository.soft_delete(message2.id)
         
@@ -742,18 +901,10 @@ class TestMessageRepositoryCountByChat:
     
     def test_count_by_chat_include_deleted(self, message_repository: MessageRepository, test_chat, test_model):
         """Test counting messages including deleted ones."""
-        message1 = message_repository.create(MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="Active"
-        ))
-        message2 = message_repository.create(MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="Deleted"
-        ))
+        _, message2 = message_repository.create_many([
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="Active"),
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="Deleted"),
+        ])
         
         message_repository.soft_delete(message2.id)
         
@@ -815,6 +966,36 @@ class TestMessageRepositoryGetLatestByChat:
         assert latest.id == message1.id
 
 
+class TestMessageRepositoryGetLatestByChatWithModel:
+    """Tests for the get_latest_by_chat_with_model method."""
+    
+    def test_get_latest_by_chat_with_model_success(self, message_repository: MessageRepository, test_chat, test_model):
+        """Test retrieving the latest message in a chat with its model."""
+        message_repository.create(MessageCreate(
+            chat_id=test_chat.id,
+            model_id=test_model.id,
+            type="user",
+            content="First message"
+        ))
+        latest_message = message_repository.create(MessageCreate(
+            chat_id=test_chat.id,
+            model_id=test_model.id,
+            type="ai",
+            content="Latest message"
+        ))
+        
+        result = message_repository.get_latest_by_chat_with_model(test_chat.id)
+        
+        assert result is not None
+        message, model = result
+        assert message.id == latest_message.id
+        assert model.id == test_model.id
+    
+    def test_get_latest_by_chat_with_model_empty(self, message_repository: MessageRepository, test_chat):
+        """Test getting latest message with model from an empty chat."""
+        assert message_repository.get_latest_by_chat_with_model(test_chat.id) is None
+
+
 class TestMessageRepositoryCalculateTotalTokens:
     """Tests for the calculate_total_tokens method."""
     
@@ -944,28 +1125,13 @@ class TestMessageRepositoryIntegration:
     
     def test_complex_conversation_scenario(self, message_repository: MessageRepository, test_chat, test_model):
         """Test a complex conversation scenario."""
-        # Create a conversation
-        user_msg1 = message_repository.create(MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="Hello",
-            tokens=5
-        ))
-        ai_msg1 = message_repository.create(MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="ai",
-            content="Hi there!",
-            tokens=10
-        ))
-        user_msg2 = message_repository.create(MessageCreate(
-            chat_id=test_chat.id,
-            model_id=test_model.id,
-            type="user",
-            content="How are you?",
-            tokens=8
-        ))
+        # Create a conversation; the last reply is added on its own so it is
+        # strictly the latest message
+        _, ai_msg1, user_msg2 = message_repository.create_many([
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="Hello", tokens=5),
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="ai", content="Hi there!", tokens=10),
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="How are you?", tokens=8),
+        ])
         ai_msg2 = message_repository.create(MessageCreate(
             chat_id=test_chat.id,
             model_id=test_model.id,
@@ -1010,13 +1176,11 @@ class TestMessageRepositoryIntegration:
     def test_multi_chat_isolation(
         self, 
         message_repository: MessageRepository, 
-        chat_repository: ChatRepository,
+        make_chats,
         test_model
     ):
         """Test that messages are properly isolated between chats."""
-        user_id = f"user_{uuid4().hex[:24]}"
-        chat1 = chat_repository.create(user_id, ChatCreate(title="Chat 1"))
-        chat2 = chat_repository.create(user_id, ChatCreate(title="Chat 2"))
+        chat1, chat2 = make_chats(TEST_USER_ID, ["Chat 1", "Chat 2"])
         
         # Add messages to both chats
         message_repository.create(MessageCreate(
@@ -1054,3 +1218,139 @@ class TestMessageRepositoryIntegration:
         
         # Verify chat2 is unaffected
         assert message_repository.count_by_chat(chat2.id) == 1
+
+
+class TestMessageRepositoryGetSummary:
+    """Tests for the get_summary method."""
+    
+    def test_get_summary_success(self, message_repository: MessageRepository, test_chat, test_model):
+        """Test aggregating counts, tokens and cost in one row."""
+        message_repository.create(MessageCreate(
+            chat_id=test_chat.id,
+            model_id=test_model.id,
+            type="user",
+            content="Question",
+            tokens=1000
+        ))
+        message_repository.create(MessageCreate(
+            chat_id=test_chat.id,
+            model_id=test_model.id,
+            type="ai",
+            content="Answer",
+            tokens=2000
+        ))
+        latest = message_repository.create(MessageCreate(
+            chat_id=test_chat.id,
+            model_id=test_model.id,
+            type="system",
+            content="Note"
+        ))
+        deleted = message_repository.create(MessageCreate(
+            chat_id=test_chat.id,
+            model_id=test_model.id,
+            type="user",
+            content="Deleted",
+            tokens=500
+        ))
+        message_repository.soft_delete(deleted.id)
+        
+        summary = message_repository.get_summary(test_chat.id)
+        
+        assert summary.total_messages == 3
+        assert summary.user_messages == 1
+        assert summary.ai_messages == 1
+        assert summary.system_messages == 1
+        assert summary.total_tokens == 3000
+        # 3000 tokens * (30.00 / 1,000,000) = 0.09
+        assert float(summary.total_cost) == pytest.approx(0.09, rel=1e-6)
+        assert summary.latest_message_at == latest.created_at
+    
+    def test_get_summary_empty(self, message_repository: MessageRepository, test_chat):
+        """Test summary of a chat without messages."""
+        summary = message_repository.get_summary(test_chat.id)
+        
+        assert summary.total_messages == 0
+        assert summary.user_messages == 0
+        assert summary.total_tokens is None
+        assert summary.total_cost is None
+        assert summary.latest_message_at is None
+
+
+class TestMessageRepositorySumCost:
+    """Tests for the sum_cost method."""
+    
+    def test_sum_cost_success(self, message_repository: MessageRepository, test_chat, test_model):
+        """Test summing cost across messages, ignoring deleted and token-less ones."""
+        message_repository.create(MessageCreate(
+            chat_id=test_chat.id,
+            model_id=test_model.id,
+            type="user",
+            content="Message 1",
+            tokens=1000
+        ))
+        message_repository.create(MessageCreate(
+            chat_id=test_chat.id,
+            model_id=test_model.id,
+            type="ai",
+            content="Message 2"
+        ))
+        deleted = message_repository.create(MessageCreate(
+            chat_id=test_chat.id,
+            model_id=test_model.id,
+            type="ai",
+            content="Deleted",
+            tokens=5000
+        ))
+        message_repository.soft_delete(deleted.id)
+        
+        cost = message_repository.sum_cost(test_chat.id)
+        
+        # 1000 tokens * (30.00 / 1,000,000) = 0.03
+        assert float(cost) == pytest.approx(0.03, rel=1e-6)
+    
+    def test_sum_cost_empty(self, message_repository: MessageRepository, test_chat):
+        """Test cost of a chat without messages."""
+        cost = message_repository.sum_cost(test_chat.id)
+        
+        assert float(cost) == 0.0
+
+
+class TestMessageRepositoryLoading:
+    """Tests that rows returned by the lookups are fully loaded."""
+    
+    @pytest.mark.parametrize("lookup", [
+        lambda repository, message: repository.get_by_id(message.id),
+        lambda repository, message: repository.get_with_model(message.id),
+        lambda repository, message: repository.get_all_by_chat(message.chat_id),
+        lambda repository, message: repository.get_all_by_chat_with_model(message.chat_id),
+        lambda repository, message: repository.get_page_after(message.chat_id),
+        lambda repository, message: repository.get_by_type(message.chat_id, "user"),
+        lambda repository, message: repository.get_with_feedback(message.chat_id),
+        lambda repository, message: repository.get_latest_by_chat(message.chat_id),
+        lambda repository, message: repository.get_latest_by_chat_with_model(message.chat_id),
+    ], ids=[
+        "get_by_id", "get_with_model", "get_all_by_chat", "get_all_by_chat_with_model",
+        "get_page_after", "get_by_type", "get_with_feedback",
+        "get_latest_by_chat", "get_latest_by_chat_with_model",
+    ])
+    def test_returned_rows_need_no_further_queries(
+        self,
+        message_repository: MessageRepository,
+        sample_message_data: MessageCreate,
+        executed_statements,
+        lookup
+    ):
+        """Test that reading every column of the returned rows issues no lazy loads."""
+        message = message_repository.create(sample_message_data)
+        message_repository.update_feedback(message.id, "positive")
+        
+        result = lookup(message_repository, message)
+        rows = result if isinstance(result, list) else [result]
+        instances = [instance for row in rows for instance in (row if isinstance(row, Row) else (row,))]
+        executed_statements.clear()
+        
+        for instance in instances:
+            instance.model_dump()
+        
+        assert instances
+        assert executed_statements == []
@@ -1,10 +1,11 @@
 import pytest
 from decimal import Decimal
 from uuid import uuid4
-from sqlmodel import Session
+from sqlalchemy import event
+from sqlmodel import Session, delete
 
 from app.repositories.model import ModelRepository
-from app.models import ModelCreate, ModelUpdate
+from app.models import Model, ModelCreate, ModelUpdate
 
 
 @pytest.fixture(name="repository")
@@ -15,10 +16,13 @@ def repository_fixture(session: Session):
     return ModelRepository(session)
 
 
-@pytest.fixture(name="sample_model_data")
+@pytest.fixture(name="sample_model_data", scope="module")
 def sample_model_data_fixture():
     """
     Provide sample model creation data.
+    
+    Built once for the module; repositories only read ModelCreate, so the instance
+    is safely shared between tests.
     """
     return ModelCreate(
         name="GPT-4",
@@ -77,6 +81,27 @@ class TestModelRepositoryCreate:
         assert model2.name == "GPT-3.5"
 
 
+class TestModelRepositoryCreateMany:
+    """Tests for the create_many method."""
+    
+    def test_create_many_preserves_order(self, repository: ModelRepository):
+        """Test that created models come back in input order."""
+        models_data = [
+            ModelCreate(name=f"Model-{i}", provider="TestProvider", price_per_million_tokens=Decimal("10.000000"))
+            for i in range(5)
+        ]
+        
+        models = repository.create_many(models_data)
+        
+        assert [model.name for model in models] == [f"Model-{i}" for i in range(5)]
+        assert len({model.id for model in models}) == 5
+        assert repository.count() == 5
+    
+    def test_create_many_empty(self, repository: ModelRepository):
+        """Test creating an empty batch."""
+        assert repository.create_many([]) == []
+
+
 class TestModelRepositoryGetById:
     """Tests for the get_by_id method."""
     
@@ -99,6 +124,27 @@ class TestModelRepositoryGetById:
         assert model is None
 
 
+class TestModelRepositoryGetMany:
+    """Tests for the get_many method."""
+    
+    def test_get_many_success(self, repository: ModelRepository, sample_model_data: ModelCreate):
+        """Test retrieving several models by ID, ignoring unknown IDs."""
+        model1 = repository.create(sample_model_data)
+        model2 = repository.create(ModelCreate(
+            name="Claude",
+            provider="Anthropic",
+            price_per_million_tokens=Decimal("15.000000")
+        ))
+        
+        models = repository.get_many([model1.id, model2.id, uuid4()])
+        
+        assert {model.id for model in models} == {model1.id, model2.id}
+    
+    def test_get_many_empty(self, repository: ModelRepository):
+        """Test retrieving with no IDs."""
+        assert repository.get_many([]) == []
+
+
 class TestModelRepositoryGetByName:
     """Tests for the get_by_name method."""
     
@@ -158,13 +204,10 @@ class TestModelRepositoryGetAll:
     
     def test_get_all_with_pagination(self, repository: ModelRepository):
         """Test pagination with skip and limit."""
-        for i in range(5):
-            model_data = ModelCreate(
-                name=f"Model-{i}",
-                provider="TestProvider",
-                price_per_million_tokens=Decimal("10.000000")
-            )
-            repository.create(model_data)
+        repository.create_many([
+            ModelCreate(name=f"Model-{i}", provider="TestProvider", price_per_million_tokens=Decimal("10.000000"))
+            for i in range(5)
+        ])
         
         # Test skip
         models = repository.get_all(skip=2)
@@ -385,6 +428,16 @@ class TestModelRepositoryToggleEnabled:
         
         assert toggled_model is not None
         assert toggled_model.updated_at > original_updated_at
+    
+    def test_toggle_enabled_single_statement(self, repository: ModelRepository, sample_model_data: ModelCreate, executed_statements):
+        """Test that toggling reads and flips the flag in one UPDATE ... RETURNING."""
+        created_model = repository.create(sample_model_data)
+        executed_statements.clear()
+        
+        toggled_model = repository.toggle_enabled(created_model.id)
+        
+        assert toggled_model.is_enabled is False
+        assert [statement.split()[0] for statement in executed_statements] == ["UPDATE"]
 
 
 class TestModelRepositoryCount:
@@ -398,13 +451,10 @@ class TestModelRepositoryCount:
     
     def test_count_all_models(self, repository: ModelRepository):
         """Test counting all models."""
-        for i in range(3):
-            model_data = ModelCreate(
-                name=f"Model-{i}",
-                provider="TestProvider",
-                price_per_million_tokens=Decimal("10.000000")
-            )
-            repository.create(model_data)
+        repository.create_many([
+            ModelCreate(name=f"Model-{i}", provider="TestProvider", price_per_million_tokens=Decimal("10.000000"))
+            for i in range(3)
+        ])
         
         count = repository.count()
         
@@ -429,8 +479,7 @@ class TestModelRepositoryCount:
             ) for i in range(2)
         ]
         
-        for model_data in enabled_models + disabled_models:
-            repository.create(model_data)
+        repository.create_many(enabled_models + disabled_models)
         
         enabled_count = repository.count(enabled_only=True)
         total_count = repository.count()
@@ -482,8 +531,7 @@ class TestModelRepositoryIntegration:
             ModelCreate(name="Gemini", provider="Google", price_per_million_tokens=Decimal("1.0"), is_enabled=True),
         ]
         
-        for model_data in models_data:
-            repository.create(model_data)
+        repository.create_many(models_data)
         
         # Query by provider
         openai_models = repository.get_by_provider("OpenAI")
@@ -507,3 +555,109 @@ class TestModelRepositoryIntegration:
         # Verify count increased
         new_enabled_count = repository.count(enabled_only=True)
         assert new_enabled_count == 4
+
+
+class TestModelRepositoryCache:
+    """Tests for the cached get_by_id and get_by_name lookups."""
+    
+    def test_cached_lookup_skips_query(self, repository: ModelRepository, sample_model_data: ModelCreate, session: Session):
+        """Test that repeated lookups are served without hitting the database."""
+        created_model = repository.create(sample_model_data)
+        repository.get_by_id(created_model.id)
+        repository.get_by_name(created_model.name)
+        
+        statements = []
+        engine = session.get_bind()
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            by_id = repository.get_by_id(created_model.id)
+            by_name = repository.get_by_name(created_model.name)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+        
+        assert statements == []
+        assert by_id.id == created_model.id
+        assert by_name.id == created_model.id
+    
+    def test_cache_invalidated_on_update(self, repository: ModelRepository, sample_model_data: ModelCreate):
+        """Test that updates are visible through the cached lookups."""
+        created_model = repository.create(sample_model_data)
+        repository.get_by_id(created_model.id)
+        repository.get_by_name(created_model.name)
+        
+        repository.update(created_model.id, ModelUpdate(name="GPT-4 Turbo"))
+        
+        assert repository.get_by_id(created_model.id).name == "GPT-4 Turbo"
+        assert repository.get_by_name(sample_model_data.name) is None
+    
+    def test_cache_invalidated_on_toggle_and_delete(self, repository: ModelRepository, sample_model_data: ModelCreate):
+        """Test that toggling and deleting drop the cached entry."""
+        created_model = repository.create(sample_model_data)
+        repository.get_by_id(created_model.id)
+        
+        repository.toggle_enabled(created_model.id)
+        assert repository.get_by_id(created_model.id).is_enabled is False
+        
+        repository.delete(created_model.id)
+        assert repository.get_by_id(created_model.id) is None
+    
+    def test_writes_ignore_stale_cache(self, repository: ModelRepository, sample_model_data: ModelCreate, session: Session):
+        """Test that update and delete don't act on a cached model deleted by another session."""
+        created_model = repository.create(sample_model_data)
+        repository.get_by_id(created_model.id)
+        
+        session.exec(delete(Model).where(Model.id == created_model.id))
+        session.commit()
+        
+        assert repository.update(created_model.id, ModelUpdate(name="GPT-4 Turbo")) is None
+        assert repository.delete(created_model.id) is False
+
+
+class TestModelRepositoryGetDistinctProviders:
+    """Tests for the get_distinct_providers method."""
+    
+    def test_get_distinct_providers(self, repository: ModelRepository):
+        """Test that providers are deduplicated and sorted."""
+        for name, provider in [("GPT-4", "OpenAI"), ("Claude", "Anthropic"), ("GPT-3.5", "OpenAI")]:
+            repository.create(ModelCreate(
+                name=name,
+                provider=provider,
+                price_per_million_tokens=Decimal("1.0")
+            ))
+        
+        assert repository.get_distinct_providers() == ["Anthropic", "OpenAI"]
+    
+    def test_get_distinct_providers_empty(self, repository: ModelRepository):
+        """Test providers when no models exist."""
+        assert repository.get_distinct_providers() == []
+
+
+class TestModelRepositorySetEnabled:
+    """Tests for the set_enabled method."""
+    
+    def test_set_enabled_changes_state(self, repository: ModelRepository, sample_model_data: ModelCreate):
+        """Test disabling and re-enabling a model."""
+        created_model = repository.create(sample_model_data)
+        original_updated_at = created_model.updated_at
+        
+        disabled = repository.set_enabled(created_model.id, False)
+        
+        assert disabled is not None
+        assert disabled.is_enabled is False
+        assert disabled.updated_at >= original_updated_at
+        assert repository.get_by_id(created_model.id).is_enabled is False
+        
+        enabled = repository.set_enabled(created_model.id, True)
+        assert enabled is not None
+        assert enabled.is_enabled is True
+    
+    def test_set_enabled_no_change(self, repository: ModelRepository, sample_model_data: ModelCreate):
+        """Test that setting the current state updates nothing."""
+        created_model = repository.create(sample_model_data)
+        
+        assert repository.set_enabled(created_model.id, True) is None
+    
+    def test_set_enabled_not_found(self, repository: ModelRepository):
+        """Test setting the state of a non-existent model."""
+        assert repository.set_enabled(uuid4(), False) is None
@@ -1,44 +1,11 @@
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 from uuid import uuid4
 
 from app.core import settings
-from app.models import Chat, Model
-from decimal import Decimal
-
-
-@pytest.fixture(name="sample_model")
-def sample_model_fixture(session: Session):
-    """
-    Create a sample model in the database for chat tests.
-    """
-    model = Model(
-        name="gpt-4",
-        provider="OpenAI",
-        price_per_million_tokens=Decimal("30.000000"),
-        is_enabled=True
-    )
-    session.add(model)
-    session.commit()
-    session.refresh(model)
-    return model
-
-
-@pytest.fixture(name="sample_chat")
-def sample_chat_fixture(session: Session):
-    """
-    Create a sample chat in the database.
-    """
-    chat = Chat(
-        user_id="test_user_id",
-        title="Test Chat",
-        summary="This is a test chat"
-    )
-    session.add(chat)
-    session.commit()
-    session.refresh(chat)
-    return chat
+from app.models import Chat
 
 
 @pytest.fixture(name="multiple_chats")
@@ -144,6 +111,16 @@ class TestGetUserChats:
         assert all(chat["user_id"] == "test_user_id" for chat in data)
         assert all(not chat["is_deleted"] for chat in data)
     
+    @pytest.mark.anyio
+    async def test_get_user_chats_async(self, aclient: httpx.AsyncClient, multiple_chats: list[Chat]):
+        """Test getting user chats through the in-process async client."""
+        response = await aclient.get(f"{settings.API_V1_STR}/chats/")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 2
+        assert all(chat["user_id"] == "test_user_id" for chat in data)
+    
     def test_get_user_chats_include_deleted(self, client: TestClient, multiple_chats: list[Chat]):
         """Test getting all user chats including deleted ones."""
         response = client.get(f"{settings.API_V1_STR}/chats/?include_deleted=true")
@@ -167,6 +144,56 @@ class TestGetUserChats:
         
         assert response.status_code == 200
         assert response.json() == []
+    
+    def test_get_user_chats_total_count_header(self, client: TestClient, multiple_chats: list[Chat]):
+        """Test that the total number of chats is returned in X-Total-Count."""
+        response = client.get(f"{settings.API_V1_STR}/chats/?limit=1")
+        
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert response.headers["X-Total-Count"] == "2"
+        
+        response = client.get(f"{settings.API_V1_STR}/chats/?skip=10&include_deleted=true")
+        
+        assert response.json() == []
+        assert response.headers["X-Total-Count"] == "3"
+    
+    def test_get_user_chats_sets_etag(self, client: TestClient, multiple_chats: list[Chat]):
+        """Test that the chat list response carries an ETag."""
+        response = client.get(f"{settings.API_V1_STR}/chats/")
+        
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('W/"')
+    
+    def test_get_user_chats_not_modified(self, client: TestClient, multiple_chats: list[Chat]):
+        """Test that a matching If-None-Match returns 304 without a body."""
+        etag = client.get(f"{settings.API_V1_STR}/chats/").headers["ETag"]
+        
+        response = client.get(f"{settings.API_V1_STR}/chats/", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+    
+    def test_get_user_chats_etag_changes_after_update(self, client: TestClient, multiple_chats: list[Chat]):
+        """Test that modifying a chat invalidates the previous ETag."""
+        etag = client.get(f"{settings.API_V1_STR}/chats/").headers["ETag"]
+        client.post(f"{settings.API_V1_STR}/chats/", json={"title": "Brand New Chat"})
+        
+        response = client.get(f"{settings.API_V1_STR}/chats/", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert len(response.json()) == 3
+    
+    def test_get_user_chats_etag_depends_on_query(self, client: TestClient, multiple_chats: list[Chat]):
+        """Test that different pagination parameters produce different ETags."""
+        etag = client.get(f"{settings.API_V1_STR}/chats/").headers["ETag"]
+        
+        response = client.get(f"{settings.API_V1_STR}/chats/?limit=1", headers={"If-None-Match": etag})
+        
+        assert response.status_code == 200
+        assert len(response.json()) == 1
 
 
 class TestGetActiveChats:
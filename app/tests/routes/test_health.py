@@ -1,3 +1,5 @@
+import httpx
+import pytest
 from fastapi.testclient import TestClient
 
 from app.core import settings
@@ -11,3 +13,13 @@ def test_health_check(client: TestClient):
     response = client.get(f"{settings.API_V1_STR}/health/")
     assert response.status_code == 200
     assert response.json().get("status", "") == HealthStatus.healthy
+
+
+@pytest.mark.anyio
+async def test_health_check_async(aclient: httpx.AsyncClient):
+    """
+    Test the health check endpoint through the in-process async client.
+    """
+    response = await aclient.get(f"{settings.API_V1_STR}/health/")
+    assert response.status_code == 200
+    assert response.json().get("status", "") == HealthStatus.healthy
@@ -8,21 +8,6 @@ from app.core import settings
 from app.models import Chat, Model, Message, MessageType
 
 
-@pytest.fixture(name="sample_model")
-def sample_model_fixture(session: Session):
-    """Create a sample model in the database for message tests."""
-    model = Model(
-        name="gpt-4",
-        provider="OpenAI",
-        price_per_million_tokens=Decimal("30.000000"),
-        is_enabled=True
-    )
-    session.add(model)
-    session.commit()
-    session.refresh(model)
-    return model
-
-
 @pytest.fixture(name="disabled_model")
 def disabled_model_fixture(session: Session):
     """Create a disabled model in the database."""
@@ -38,20 +23,6 @@ def disabled_model_fixture(session: Session):
     return model
 
 
-@pytest.fixture(name="sample_chat")
-def sample_chat_fixture(session: Session):
-    """Create a sample chat in the database."""
-    chat = Chat(
-        user_id="test_user_id",
-        title="Test Chat",
-        summary="This is a test chat"
-    )
-    session.add(chat)
-    session.commit()
-    session.refresh(chat)
-    return chat
-
-
 @pytest.fixture(name="other_user_chat")
 def other_user_chat_fixture(session: Session):
     """Create a chat belonging to a different user."""
@@ -360,6 +331,40 @@ class TestGetChatMessages:
         assert response.status_code == 404
 
 
+class TestGetChatMessagesPage:
+    """Tests for GET /messages/chat/{chat_id}/page endpoint."""
+    
+    def test_get_chat_messages_page_walks_all_pages(self, client: TestClient, sample_chat: Chat, multiple_messages: list[Message]):
+        """Test following next_cursor until the last page."""
+        url = f"{settings.API_V1_STR}/messages/chat/{sample_chat.id}/page"
+        
+        first = client.get(url, params={"limit": 3}).json()
+        assert len(first["items"]) == 3
+        assert first["next_cursor"] is not None
+        
+        second = client.get(url, params={"limit": 3, "cursor": first["next_cursor"]}).json()
+        assert len(second["items"]) == 1
+        assert second["next_cursor"] is None
+        
+        ids = [msg["id"] for msg in first["items"] + second["items"]]
+        assert len(set(ids)) == 4  # Excludes deleted message by default
+    
+    def test_get_chat_messages_page_invalid_cursor(self, client: TestClient, sample_chat: Chat):
+        """Test that a malformed cursor is rejected."""
+        response = client.get(
+            f"{settings.API_V1_STR}/messages/chat/{sample_chat.id}/page",
+            params={"cursor": "not-a-cursor"}
+        )
+        
+        assert response.status_code == 400
+    
+    def test_get_chat_messages_page_other_user_chat(self, client: TestClient, other_user_chat: Chat):
+        """Test paging messages from another user's chat."""
+        response = client.get(f"{settings.API_V1_STR}/messages/chat/{other_user_chat.id}/page")
+        
+        assert response.status_code == 404
+
+
 class TestGetActiveMessages:
     """Tests for GET /messages/chat/{chat_id}/active endpoint."""
     
@@ -8,23 +8,6 @@ from app.core import settings
 from app.models import Model
 
 
-@pytest.fixture(name="sample_model")
-def sample_model_fixture(session: Session):
-    """
-    Create a sample model in the database.
-    """
-    model = Model(
-        name="gpt-4",
-        provider="OpenAI",
-        price_per_million_tokens=Decimal("30.000000"),
-        is_enabled=True
-    )
-    session.add(model)
-    session.commit()
-    session.refresh(model)
-    return model
-
-
 @pytest.fixture(name="multiple_models")
 def multiple_models_fixture(session: Session):
     """
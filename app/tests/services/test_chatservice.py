@@ -3,7 +3,7 @@ from uuid import uuid4, UUID
 from sqlmodel import Session
 
 from app.services.chat import ChatService
-from app.models import ChatCreate, ChatUpdate
+from app.models import ChatCreate, ChatUpdate, ChatPublic
 
 
 @pytest.fixture
@@ -294,6 +294,21 @@ class TestGetAllUserChats:
         
         assert len(result) == 1
         assert result[0].user_id == user_id
+    
+    def test_get_all_user_chats_returns_chat_public(
+        self,
+        chat_service: ChatService,
+        user_id: str,
+        sample_chat_data: ChatCreate
+    ):
+        """Test that list results are ChatPublic instances."""
+        chat_service.create_chat(user_id, sample_chat_data)
+        
+        result = chat_service.get_all_user_chats(user_id)
+        
+        assert len(result) == 1
+        assert isinstance(result[0], ChatPublic)
+        assert result[0].title == sample_chat_data.title
 
 
 class TestGetActiveChats:
@@ -619,6 +634,42 @@ class TestGetDeletedChats:
         assert result[0].is_deleted is True
 
 
+class TestScanUserChats:
+    """Tests for scan_user_chats method."""
+    
+    def test_scan_user_chats_across_batches(self, chat_service: ChatService, user_id: str):
+        """Test that scanning yields every chat once when spanning several batches."""
+        for i in range(5):
+            chat_service.create_chat(user_id, ChatCreate(title=f"Chat {i}"))
+        expected = [chat.id for chat in chat_service.get_all_user_chats(user_id)]
+        
+        result = list(chat_service.scan_user_chats(user_id, batch_size=2))
+        
+        assert [chat.id for chat in result] == expected
+    
+    def test_scan_user_chats_deleted_only(
+        self,
+        chat_service: ChatService,
+        user_id: str,
+        sample_chat_data: ChatCreate,
+        another_chat_data: ChatCreate
+    ):
+        """Test scanning only soft-deleted chats."""
+        chat_service.create_chat(user_id, sample_chat_data)
+        deleted = chat_service.create_chat(user_id, another_chat_data)
+        chat_service.delete_chat(deleted.id, user_id)
+        
+        result = list(chat_service.scan_user_chats(user_id, deleted_only=True))
+        
+        assert len(result) == 1
+        assert result[0].id == deleted.id
+        assert result[0].is_deleted is True
+    
+    def test_scan_user_chats_empty(self, chat_service: ChatService, user_id: str):
+        """Test scanning a user with no chats."""
+        assert list(chat_service.scan_user_chats(user_id)) == []
+
+
 class TestUpdateChatTitle:
     """Tests for update_chat_title method."""
     
@@ -168,6 +168,141 @@ class TestCreateMessage:
         assert result.tokens is None
 
 
+class TestModelCache:
+    """Tests for the per-instance model cache used on write paths."""
+    
+    def test_model_fetched_once_per_service(
+        self,
+        message_service: MessageService,
+        sample_message_data: MessageCreate,
+        monkeypatch
+    ):
+        """Test that repeated writes reuse the cached model."""
+        calls = []
+        original_get_by_id = message_service.model_repository.get_by_id
+        
+        def counting_get_by_id(model_id):
+            calls.append(model_id)
+            return original_get_by_id(model_id)
+        
+        monkeypatch.setattr(message_service.model_repository, "get_by_id", counting_get_by_id)
+        
+        first = message_service.create_message(sample_message_data)
+        message_service.create_message(sample_message_data)
+        message_service.update_message_feedback(first.id, "positive")
+        
+        assert calls == [sample_message_data.model_id]
+    
+    def test_list_fetches_distinct_models_once(
+        self,
+        message_service: MessageService,
+        session: Session,
+        test_chat,
+        test_model,
+        model_service: ModelService,
+        monkeypatch
+    ):
+        """Test that listing messages loads each distinct model in one batched lookup."""
+        other_model = model_service.create_model(ModelCreate(
+            name="other-model",
+            provider="test",
+            price_per_million_tokens=Decimal("1.00")
+        ))
+        for model in (test_model, other_model, test_model):
+            MessageService(session).create_message(MessageCreate(
+                chat_id=test_chat.id,
+                model_id=model.id,
+                type="user",
+                content="Hello"
+            ))
+        
+        calls = []
+        original_get_many = message_service.model_repository.get_many
+        
+        def counting_get_many(model_ids):
+            calls.append(set(model_ids))
+            return original_get_many(model_ids)
+        
+        monkeypatch.setattr(message_service.model_repository, "get_many", counting_get_many)
+        
+        messages = message_service.get_chat_messages(test_chat.id)
+        message_service.get_messages_by_type(test_chat.id, "user")
+        
+        assert [msg.model.id for msg in messages] == [test_model.id, other_model.id, test_model.id]
+        assert calls == [{test_model.id, other_model.id}]
+    
+    def test_missing_model_not_cached(
+        self,
+        message_service: MessageService,
+        sample_message_data: MessageCreate
+    ):
+        """Test that unknown model IDs are not memoized."""
+        missing_id = uuid4()
+        sample_message_data.model_id = missing_id
+        
+        with pytest.raises(ValueError):
+            message_service.create_message(sample_message_data)
+        
+        assert missing_id not in message_service._model_cache
+
+
+class TestCreateMessages:
+    """Tests for create_messages method."""
+    
+    def test_create_messages_success(
+        self,
+        message_service: MessageService,
+        test_chat,
+        test_model
+    ):
+        """Test creating a user and AI message in one call."""
+        messages_data = [
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="Question", tokens=3),
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="ai", content="Answer", tokens=7),
+        ]
+        
+        result = message_service.create_messages(messages_data)
+        
+        assert [msg.content for msg in result] == ["Question", "Answer"]
+        assert all(msg.model.id == test_model.id for msg in result)
+        assert message_service.count_active_messages(test_chat.id) == 2
+    
+    def test_create_messages_empty(self, message_service: MessageService):
+        """Test creating an empty batch."""
+        assert message_service.create_messages([]) == []
+    
+    def test_create_messages_disabled_model(
+        self,
+        message_service: MessageService,
+        test_chat,
+        test_model,
+        disabled_model
+    ):
+        """Test that one disabled model rejects the whole batch."""
+        messages_data = [
+            MessageCreate(chat_id=test_chat.id, model_id=test_model.id, type="user", content="Ok"),
+            MessageCreate(chat_id=test_chat.id, model_id=disabled_model.id, type="ai", content="Nope"),
+        ]
+        
+        with pytest.raises(ValueError, match="disabled"):
+            message_service.create_messages(messages_data)
+        
+        assert message_service.count_active_messages(test_chat.id) == 0
+    
+    def test_create_messages_chat_not_found(
+        self,
+        message_service: MessageService,
+        test_model
+    ):
+        """Test that an unknown chat rejects the batch."""
+        messages_data = [
+            MessageCreate(chat_id=uuid4(), model_id=test_model.id, type="user", content="Orphan"),
+        ]
+        
+        with pytest.raises(ValueError, match="does not exist"):
+            message_service.create_messages(messages_data)
+
+
 class TestCreateMessageWithAutoChat:
     """Tests for create_message_with_auto_chat method."""
     
@@ -885,6 +1020,20 @@ class TestCalculateChatTokens:
         result = message_service.calculate_chat_tokens(test_chat.id)
         
         assert result == 10
+    
+    def test_calculate_chat_tokens_refreshes_after_writes(
+        self,
+        message_service: MessageService,
+        sample_message_data: MessageCreate
+    ):
+        """Test that the memoized total follows creates and deletes."""
+        assert message_service.calculate_chat_tokens(sample_message_data.chat_id) == 0
+        
+        created = message_service.create_message(sample_message_data)
+        assert message_service.calculate_chat_tokens(sample_message_data.chat_id) == 10
+        
+        message_service.delete_message(created.id)
+        assert message_service.calculate_chat_tokens(sample_message_data.chat_id) == 0
 
 
 class TestCalculateChatCost:
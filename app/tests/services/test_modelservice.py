@@ -1,10 +1,10 @@
 import pytest
 from decimal import Decimal
 from uuid import uuid4
-from sqlmodel import Session
+from sqlmodel import Session, delete, update
 
 from app.services.model import ModelService
-from app.models import ModelCreate, ModelUpdate
+from app.models import Model, ModelCreate, ModelUpdate
 
 
 @pytest.fixture
@@ -231,6 +231,23 @@ class TestUpdateModel:
         
         assert result is None
     
+    def test_update_model_deleted_behind_cache(
+        self,
+        model_service: ModelService,
+        sample_model_data: ModelCreate,
+        session: Session
+    ):
+        """Test updating a model deleted by another session while cached returns None."""
+        created = model_service.create_model(sample_model_data)
+        model_service.get_model_by_id(created.id)
+        
+        session.exec(delete(Model).where(Model.id == created.id))
+        session.commit()
+        
+        result = model_service.update_model(created.id, ModelUpdate(name="gpt-4-turbo"))
+        
+        assert result is None
+    
     def test_update_model_duplicate_name(
         self,
         model_service: ModelService,
@@ -378,6 +395,39 @@ class TestDisableModel:
         assert result is not None
         assert result.is_enabled is False
     
+    def test_disable_model_disabled_behind_cache(
+        self,
+        model_service: ModelService,
+        sample_model_data: ModelCreate,
+        session: Session
+    ):
+        """Test that a model disabled by another session is reported from the database, not the cache."""
+        created = model_service.create_model(sample_model_data)
+        assert model_service.get_model_by_id(created.id).is_enabled is True
+        
+        session.exec(update(Model).where(Model.id == created.id).values(is_enabled=False))
+        session.commit()
+        
+        result = model_service.disable_model(created.id)
+        
+        assert result is not None
+        assert result.is_enabled is False
+    
+    def test_disable_model_deleted_behind_cache(
+        self,
+        model_service: ModelService,
+        sample_model_data: ModelCreate,
+        session: Session
+    ):
+        """Test disabling a model deleted by another session while cached returns None."""
+        created = model_service.create_model(sample_model_data)
+        model_service.get_model_by_id(created.id)
+        
+        session.exec(delete(Model).where(Model.id == created.id))
+        session.commit()
+        
+        assert model_service.disable_model(created.id) is None
+    
     def test_disable_model_not_found(self, model_service: ModelService):
         """Test disabling non-existent model returns None."""
         result = model_service.disable_model(uuid4())